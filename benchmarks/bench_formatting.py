@@ -0,0 +1,160 @@
+"""Per-tick formatting benchmark: the per-sensor rule chain vs. the coordinator's FormattingPlan.
+
+    python benchmarks/bench_formatting.py              # 8-bay-gpu fixture
+    python benchmarks/bench_formatting.py --model 2-bay --rounds 9
+
+Formats the values of every sensor of a fixture (see record_fixtures.py) for a series
+of recorded ticks two ways: 'chain' is the path before formatters were chosen at setup,
+where each sensor ran the unit/key rule chain of format_sensor_value and the Decimal
+unit lookup (determine_unit) for its value on every tick; 'plan' is one
+FormattingPlan.format() call per tick, as the coordinators run it. Both must produce
+the same (value, unit) for every sensor. Ticks alternate between the fixture's
+samples, so values change as they would on a NAS.
+
+Exits with 1 if 'plan' is less than --min-speedup times faster than 'chain'.
+Needs Home Assistant installed.
+"""
+import argparse
+import asyncio
+import os
+import sys
+from decimal import Decimal
+from typing import Any
+
+if __name__ == "__main__" and os.environ.get("PYTHONHASHSEED") != "0":
+    os.environ["PYTHONHASHSEED"] = "0"
+    os.execv(sys.executable, [sys.executable, *sys.argv])
+
+from bench_polling import build_fixture_entities, load_fixture, time_best  # noqa: E402
+
+from custom_components.ugreen_pro import get_entity_data_from_api  # noqa: E402
+from custom_components.ugreen_pro.derived import DerivedMetricEngine  # noqa: E402
+from custom_components.ugreen_pro.utils import (  # noqa: E402
+    ExtractionPlan, FormattingPlan, convert_string_to_number, determine_unit, format_dynamic_size,
+    format_frequency_mhz, format_percentage, format_status_code, format_temperature, format_timestamp,
+)
+
+
+def chain_format_value(raw: Any, endpoint) -> Any:
+    # format_sensor_value before formatters were chosen at setup (kept here as the reference).
+    try:
+        if endpoint.description.unit_of_measurement is not None and endpoint.description.unit_of_measurement in ("B", "KB", "MB", "GB", "TB"):
+            return format_dynamic_size(raw, endpoint.description.unit_of_measurement, endpoint.decimal_places)
+        if isinstance(endpoint.description.name, str) and "Timestamp" in endpoint.description.name:
+            return format_timestamp(raw)
+        if "server_status" in endpoint.description.key:
+            return format_status_code(raw, {2: "Normal"})
+        if "disk" in endpoint.description.key and "status" in endpoint.description.key:
+            return format_status_code(raw, {1: "Normal"})
+        if "fan" in endpoint.description.key and "overall" in endpoint.description.key:
+            return format_status_code(raw, {0: "Normal"})
+        if "fan" in endpoint.description.key and "status" in endpoint.description.key:
+            return format_status_code(raw, {0: "ERROR!", 1: "Normal"})
+        if "disk" in endpoint.description.key and not "interface" in endpoint.description.key and "type" in endpoint.description.key:
+            return format_status_code(raw, {0: "HDD", 1: "SSD", 2: "M.2"})
+        if "volume" in endpoint.description.key and "health" in endpoint.description.key:
+            return format_status_code(raw, {0: "Normal"})
+        if "usb_device_type" in endpoint.description.key:
+            return format_status_code(raw, {0: "Generic USB Device"})
+        if endpoint.description.unit_of_measurement is not None and endpoint.description.unit_of_measurement == "%":
+            return format_percentage(raw)
+        if endpoint.description.unit_of_measurement is not None and endpoint.description.unit_of_measurement == "°C":
+            return format_temperature(raw)
+        if endpoint.description.unit_of_measurement is not None and endpoint.description.unit_of_measurement in ("KB/s", "MB/s", "GB/s"):
+            return format_dynamic_size(raw, endpoint.description.unit_of_measurement, endpoint.decimal_places)
+        if endpoint.description.unit_of_measurement is not None and endpoint.description.unit_of_measurement == "MHz":
+            return format_frequency_mhz(raw)
+        return convert_string_to_number(raw, endpoint.decimal_places)
+    except Exception:
+        return Decimal(0)
+
+
+def chain_unit(raw: Any, endpoint) -> Any:
+    # UgreenNasSensor.native_unit_of_measurement before formatters were chosen at setup.
+    unit = endpoint.description.unit_of_measurement or ""
+    if endpoint.description.unit_of_measurement in ("B/s", "KB/s", "MB/s", "GB/s", "TB/s", "PB/s"):
+        return determine_unit(raw, unit, True)
+    elif endpoint.description.unit_of_measurement in ("B", "KB", "MB", "GB", "TB", "PB"):
+        return determine_unit(raw, unit, False)
+    return endpoint.description.unit_of_measurement
+
+
+class EveryEndpointDue:
+    """Poll schedule with every endpoint due on every tick."""
+
+    def __init__(self, endpoints) -> None:
+        self.endpoints = list(endpoints)
+
+    def due(self, now: float) -> list[str]:
+        return self.endpoints
+
+    def fetched(self, endpoints, now: float) -> None:
+        pass
+
+
+async def record_ticks(model: str, ticks: int) -> tuple[list, list[dict]]:
+    """(entities, per-tick data) of both coordinators, extracted as get_entity_data_from_api does."""
+    fixture = load_fixture(model)
+    api, config_entities, status_entities = await build_fixture_entities(fixture)
+    entities = config_entities + status_entities
+    grouped: dict[str, list] = {}
+    for entity in entities:
+        grouped.setdefault(entity.endpoint, []).append(entity)
+    plans = {endpoint: ExtractionPlan(group) for endpoint, group in grouped.items()}
+    derived = DerivedMetricEngine(entities)
+    data: dict[str, Any] = {}
+    recorded = []
+    for _ in range(ticks):
+        # Past every cache TTL, so each tick reads the next recorded sample.
+        api.response_cache.clock.now += 60
+        data = await get_entity_data_from_api(api, None, grouped, plans, derived, EveryEndpointDue(grouped), data, set())
+        recorded.append(data)
+    return entities, recorded
+
+
+def comparable(results: dict) -> dict:
+    # str() for Decimals, so that Decimal('1.0') and Decimal('1.00') differ.
+    return {key: tuple(str(part) if isinstance(part, Decimal) else part for part in result) for key, result in results.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model", default="8-bay-gpu", help="fixture name")
+    parser.add_argument("--ticks", type=int, default=20, help="recorded ticks formatted per round")
+    parser.add_argument("--rounds", type=int, default=7, help="timed rounds, the quickest counts")
+    parser.add_argument("--min-speedup", type=float, default=1.4, help="required plan vs. chain speed-up")
+    args = parser.parse_args()
+
+    entities, ticks = asyncio.run(record_ticks(args.model, args.ticks))
+    keyed = [(entity.description.key, entity) for entity in entities]
+    plan = FormattingPlan(entities)
+
+    def chain(data: dict) -> dict:
+        return {key: (chain_format_value(data.get(key), entity), chain_unit(data.get(key), entity)) for key, entity in keyed}
+
+    for number, data in enumerate(ticks):
+        if comparable(plan.format(data)) != comparable(chain(data)):
+            sys.exit(f"plan formatted tick {number} differently than chain")
+
+    def run_chain() -> None:
+        for data in ticks:
+            chain(data)
+
+    def run_plan() -> None:
+        for data in ticks:
+            plan.format(data)
+
+    timings = {name: seconds / len(ticks) for name, seconds in
+               time_best({"chain": run_chain, "plan": run_plan}, args.rounds, 1).items()}
+    with_values = sum(1 for key, _ in keyed if ticks[-1].get(key) is not None)
+    print(f"{args.model}: {len(keyed)} sensors ({with_values} with values), {len(ticks)} ticks")
+    for name, seconds in timings.items():
+        print(f"  {name:6} {seconds * 1e6:8.1f} us/tick  ({timings['chain'] / seconds:.2f}x)")
+    speedup = timings["chain"] / timings["plan"]
+    if speedup < args.min_speedup:
+        print(f"REGRESSION plan is {speedup:.2f}x faster than chain, expected at least {args.min_speedup}x")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Import time benchmark for the integration's modules, measured with 'python -X importtime'.
+
+    python benchmarks/bench_imports.py                 # median of 11 fresh processes
+    python benchmarks/bench_imports.py --runs 21
+
+Each run is a fresh interpreter (warm .pyc files) that first imports the Home Assistant
+and aiohttp modules the integration needs, so only the integration's own modules are
+timed. Reported per module: self and cumulative import time as listed by -X importtime.
+Three imports are measured: the integration as HA loads it, entities.py as setup loads
+it afterwards (async_load_entity_catalogue), and utils.py on its own, with the package
+registered but its __init__ not run.
+
+Exits with 1 if loading the integration imports entities.py, or utils.py imports api.py.
+Needs Home Assistant installed.
+"""
+import argparse
+import compileall
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+PACKAGE = "custom_components.ugreen_pro"
+
+# Imported before the timed import, so their cost is not attributed to the integration.
+PRELOAD = """
+import aiohttp, async_timeout
+import homeassistant.core, homeassistant.config_entries, homeassistant.exceptions
+import homeassistant.helpers.aiohttp_client, homeassistant.helpers.device_registry
+import homeassistant.helpers.event, homeassistant.helpers.storage, homeassistant.helpers.update_coordinator
+"""
+
+# Registers the package without running its __init__, so a submodule can be timed alone.
+REGISTER_PACKAGE = f"""
+import importlib.util, sys
+spec = importlib.util.spec_from_file_location(
+    "{PACKAGE}", {os.path.join(ROOT, "custom_components", "ugreen_pro", "__init__.py")!r},
+    submodule_search_locations=[{os.path.join(ROOT, "custom_components", "ugreen_pro")!r}],
+)
+sys.modules[spec.name] = importlib.util.module_from_spec(spec)
+"""
+
+# The scenario's timed import is its last line; everything before it is set-up.
+SCENARIOS = {
+    "integration": f"import {PACKAGE}",
+    "entities": f"import {PACKAGE}, {PACKAGE}.api\nimport {PACKAGE}.entities",
+    "utils alone": REGISTER_PACKAGE + f"import {PACKAGE}.utils",
+}
+# Modules a scenario's timed import must not load.
+FORBIDDEN = {
+    "integration": [f"{PACKAGE}.entities"],
+    "utils alone": [f"{PACKAGE}.api"],
+}
+
+
+def import_times(code: str) -> dict[str, tuple[int, int]]:
+    """{module: (self us, cumulative us)} of the last line of 'code', from -X importtime."""
+    setup, timed = code.rsplit("\n", 1) if "\n" in code else ("", code)
+    marker = "import sys; sys.stderr.write('--- timed ---\\n')"
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "\n".join([PRELOAD, setup, marker, timed])],
+        cwd=ROOT, capture_output=True, text=True, check=False,
+    )
+    if process.returncode:
+        sys.exit(process.stderr)
+    times = {}
+    for line in process.stderr.split("--- timed ---\n", 1)[1].splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        own, cumulative, module = line[len("import time:"):].split("|")
+        times[module.strip()] = (int(own), int(cumulative))
+    return times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=11, help="fresh processes per scenario, the median counts")
+    args = parser.parse_args()
+    # Warm .pyc files, also where PYTHONDONTWRITEBYTECODE keeps imports from writing them.
+    compileall.compile_dir(os.path.join(ROOT, "custom_components", "ugreen_pro"), quiet=1)
+
+    failed = False
+    for name, code in SCENARIOS.items():
+        samples: dict[str, list[tuple[int, int]]] = defaultdict(list)
+        for _ in range(args.runs):
+            for module, times in import_times(code).items():
+                if module.startswith(PACKAGE):
+                    samples[module].append(times)
+        print(f"{name}:")
+        for module, times in sorted(samples.items(), key=lambda item: -statistics.median(t[1] for t in item[1])):
+            own = statistics.median(t[0] for t in times) / 1000
+            cumulative = statistics.median(t[1] for t in times) / 1000
+            print(f"  {module:40} {own:6.2f} ms self {cumulative:6.2f} ms cumulative")
+        for module in FORBIDDEN.get(name, []):
+            if module in samples:
+                print(f"REGRESSION {name} imports {module}")
+                failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
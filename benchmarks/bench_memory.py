@@ -0,0 +1,167 @@
+"""Memory benchmark for the entity descriptors: HA EntityDescription layout vs. the slotted one.
+
+    python benchmarks/bench_memory.py                  # all fixtures
+    python benchmarks/bench_memory.py --model 8-bay-gpu
+
+Builds the entity lists of a fixture (see record_fixtures.py) as async_setup_entry does,
+then copies every entity into two layouts under tracemalloc: 'legacy' is the layout
+before the slotted descriptors (a full HA EntityDescription per entity, a plain
+dataclass without interned strings, path steps split into new strings per entity) and
+'compact' is the current one (UgreenEntityDescription, slotted UgreenEntity, interned
+path steps). Both copies share the source's key, name, icon and path strings, so only
+what the layout itself allocates is counted.
+
+Exits with 1 if 'compact' does not save at least --min-saving of the legacy bytes per entity.
+Needs Home Assistant installed.
+"""
+import argparse
+import asyncio
+import gc
+import glob
+import os
+import sys
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from bench_polling import FIXTURES, build_fixture_entities, load_fixture
+
+from homeassistant.helpers.entity import EntityDescription
+
+from custom_components.ugreen_pro.api import UgreenEntity, UgreenEntityDescription
+from custom_components.ugreen_pro.utils import compile_path
+
+
+@dataclass
+class LegacyUgreenEntity:
+    # UgreenEntity before the slotted descriptors (kept here as the reference).
+    description: EntityDescription
+    endpoint: str
+    path: str
+    request_method: str = "GET"
+    decimal_places: int = 2
+    nas_part_category: str = ""
+    poll_tier: str = ""
+    deadband: float | None = None
+    accessor: tuple | None = field(default=None, repr=False, compare=False)
+
+
+def legacy_compile_path(path: str) -> Optional[tuple]:
+    # compile_path before its dict-key steps were interned.
+    steps: list = []
+    try:
+        for part in path.split("."):
+            if "[" in part and "]" in part:
+                part_name, index = part[:-1].split("[")
+                steps.append(part_name)
+                steps.append(int(index))
+            else:
+                steps.append(part)
+    except ValueError:
+        return None
+    return tuple(steps)
+
+
+def accessor_path(entity: UgreenEntity) -> Optional[str]:
+    # The path an entity's accessor is compiled from (see utils.compile_entity_paths).
+    if entity.path.startswith("calculated:scale_bytes_per_second:"):
+        return entity.path.split(":", 2)[2]
+    return None if entity.path.startswith("calculated:") else entity.path
+
+
+def build_legacy(entities: list) -> list:
+    copies = []
+    for entity in entities:
+        d, path = entity.description, accessor_path(entity)
+        copies.append(LegacyUgreenEntity(
+            description=EntityDescription(key=d.key, name=d.name, icon=d.icon, unit_of_measurement=d.unit_of_measurement),
+            endpoint=entity.endpoint, path=entity.path, request_method=entity.request_method,
+            decimal_places=entity.decimal_places, nas_part_category=entity.nas_part_category,
+            poll_tier=entity.poll_tier, deadband=entity.deadband,
+            accessor=legacy_compile_path(path) if path is not None else None,
+        ))
+    return copies
+
+
+def build_compact(entities: list) -> list:
+    compile_path.cache_clear()
+    copies = []
+    for entity in entities:
+        d, path = entity.description, accessor_path(entity)
+        copy = UgreenEntity(
+            description=UgreenEntityDescription(key=d.key, name=d.name, icon=d.icon, unit_of_measurement=d.unit_of_measurement),
+            endpoint=entity.endpoint, path=entity.path, request_method=entity.request_method,
+            decimal_places=entity.decimal_places, nas_part_category=entity.nas_part_category,
+            poll_tier=entity.poll_tier, deadband=entity.deadband,
+        )
+        copy.accessor = compile_path(path) if path is not None else None
+        copies.append(copy)
+    return copies
+
+
+def traced(build, entities: list) -> tuple[list, int]:
+    """(copies, bytes allocated for them and still alive)."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        copies = build(entities)
+        gc.collect()
+        return copies, tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+
+def step_strings(copies: list) -> int:
+    """Distinct string objects among the path steps."""
+    return len({id(step) for copy in copies if copy.accessor for step in copy.accessor if isinstance(step, str)})
+
+
+def measure(model: str) -> dict[str, Any]:
+    _, config_entities, status_entities = asyncio.run(build_fixture_entities(load_fixture(model)))
+    entities = config_entities + status_entities
+    result: dict[str, Any] = {"entities": len(entities)}
+    for name, build in (("legacy", build_legacy), ("compact", build_compact)):
+        copies, allocated = traced(build, entities)
+        result[name] = {
+            "bytes_per_entity": allocated / len(entities),
+            "entity_bytes": sys.getsizeof(copies[0]) + (sys.getsizeof(copies[0].__dict__) if hasattr(copies[0], "__dict__") else 0),
+            "description_bytes": sys.getsizeof(copies[0].description) + (
+                sys.getsizeof(copies[0].description.__dict__) if hasattr(copies[0].description, "__dict__") else 0
+            ),
+            "step_strings": step_strings(copies),
+        }
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model", action="append", help="fixture name (default: all)")
+    parser.add_argument("--min-saving", type=float, default=0.3, help="required share of legacy bytes saved")
+    args = parser.parse_args()
+
+    failed = False
+    for path in sorted(glob.glob(os.path.join(FIXTURES, "*.json"))):
+        model = os.path.splitext(os.path.basename(path))[0]
+        if args.model and model not in args.model:
+            continue
+        result = measure(model)
+        legacy, compact = result["legacy"], result["compact"]
+        saving = 1 - compact["bytes_per_entity"] / legacy["bytes_per_entity"]
+        print(f"{model}: {result['entities']} entities, {saving:.0%} saved")
+        for name in ("legacy", "compact"):
+            figures = result[name]
+            print(
+                f"  {name:8} {figures['bytes_per_entity']:6.0f} B/entity "
+                f"({figures['bytes_per_entity'] * result['entities'] / 1024:6.1f} KiB) | "
+                f"entity {figures['entity_bytes']:4d} B, description {figures['description_bytes']:4d} B | "
+                f"{figures['step_strings']:4d} path step strings"
+            )
+        if saving < args.min_saving:
+            print(f"REGRESSION {model} saves {saving:.0%}, expected at least {args.min_saving:.0%}")
+            failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Micro-benchmark for entity path extraction: parsing dotted paths on every tick vs. pre-compiled paths.
+
+    python benchmarks/bench_paths.py                   # 8-bay-gpu fixture
+    python benchmarks/bench_paths.py --model 2-bay --rounds 9
+
+Resolves every entity path of a fixture (see record_fixtures.py) against its recorded
+responses three ways: 'parse' splits and parses each path on every call (the
+extract_value_from_path of before compile_path), 'walk' walks the accessor compiled at
+setup (utils.walk_path) and 'plan' resolves all paths of an endpoint in one tree walk
+(utils.ExtractionPlan). All three must return the same values.
+
+Exits with 1 if 'walk' is less than --min-speedup times faster than 'parse'.
+Needs Home Assistant installed.
+"""
+import argparse
+import asyncio
+import os
+import sys
+from typing import Any
+
+if __name__ == "__main__" and os.environ.get("PYTHONHASHSEED") != "0":
+    os.environ["PYTHONHASHSEED"] = "0"
+    os.execv(sys.executable, [sys.executable, *sys.argv])
+
+from bench_polling import build_fixture_entities, load_fixture, time_best  # noqa: E402
+
+from custom_components.ugreen_pro.utils import ExtractionPlan, walk_path  # noqa: E402
+
+
+def parse_path(data: dict, path: str) -> Any:
+    # extract_value_from_path before paths were compiled (kept here as the reference).
+    try:
+        parts = path.split(".")
+        value: Any = data
+        for part in parts:
+            if "[" in part and "]" in part:
+                part_name, index = part[:-1].split("[")
+                value = value.get(part_name, []) if isinstance(value, dict) else []
+                value = value[int(index)] if isinstance(value, list) else None
+            else:
+                value = value.get(part) if isinstance(value, dict) else None
+        return value
+    except Exception:
+        return None
+
+
+def raw_path(path: str) -> str:
+    # 'calculated:scale_bytes_per_second:<path>' reads <path> (see utils.compile_entity_paths).
+    return path.split(":", 2)[2] if path.startswith("calculated:") else path
+
+
+async def prepare(model: str) -> list[tuple[dict, list]]:
+    """(response, entities with a response path) per endpoint of the fixture's entities."""
+    fixture = load_fixture(model)
+    _, config_entities, status_entities = await build_fixture_entities(fixture)
+    grouped: dict[str, list] = {}
+    for entity in config_entities + status_entities:
+        if entity.accessor is not None:
+            grouped.setdefault(entity.endpoint, []).append(entity)
+    return [(fixture["responses"][endpoint][0], entities) for endpoint, entities in grouped.items()]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model", default="8-bay-gpu", help="fixture name")
+    parser.add_argument("--rounds", type=int, default=7, help="timed rounds, the quickest counts")
+    parser.add_argument("--number", type=int, default=200, help="ticks per round")
+    parser.add_argument("--min-speedup", type=float, default=1.3, help="required walk vs. parse speed-up")
+    args = parser.parse_args()
+
+    groups = asyncio.run(prepare(args.model))
+    plans = [(response, ExtractionPlan(entities)) for response, entities in groups]
+    paths = [(response, [(e.description.key, raw_path(e.path)) for e in entities]) for response, entities in groups]
+    accessors = [(response, [(e.description.key, e.accessor) for e in entities]) for response, entities in groups]
+
+    def parse() -> dict:
+        return {key: parse_path(response, path) for response, items in paths for key, path in items}
+
+    def walk() -> dict:
+        return {key: walk_path(response, steps) for response, items in accessors for key, steps in items}
+
+    def plan() -> dict:
+        values: dict = {}
+        for response, extraction_plan in plans:
+            values.update(extraction_plan.resolve(response))
+        return values
+
+    reference = parse()
+    for name, function in (("walk", walk), ("plan", plan)):
+        if function() != reference:
+            sys.exit(f"{name} returned different values than parse")
+
+    timings = time_best({"parse": parse, "walk": walk, "plan": plan}, args.rounds, args.number)
+    print(f"{args.model}: {len(reference)} paths over {len(groups)} endpoints")
+    for name, seconds in timings.items():
+        print(f"  {name:6} {seconds * 1e6:8.1f} us/tick  ({timings['parse'] / seconds:.2f}x)")
+    speedup = timings["parse"] / timings["walk"]
+    if speedup < args.min_speedup:
+        print(f"REGRESSION walk is {speedup:.2f}x faster than parse, expected at least {args.min_speedup}x")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
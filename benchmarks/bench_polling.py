@@ -0,0 +1,373 @@
+"""End-to-end polling benchmark: entity building and coordinator ticks on recorded responses.
+
+    python benchmarks/bench_polling.py                 # run, compare with baselines.json
+    python benchmarks/bench_polling.py --update        # run, store the results as new baselines
+    python benchmarks/bench_polling.py --model 8-bay-gpu --status-ticks 600
+
+For each fixture in benchmarks/fixtures (see record_fixtures.py) the integration's
+pipeline is set up the way async_setup_entry does it: discovery, entity lists, the
+per-endpoint extraction plans, poll schedules, derived metrics and formatting plans,
+then real DataUpdateCoordinators with the sensors added to an EntityPlatform of a
+Home Assistant instance. Responses come from the fixture (decoded from JSON on every
+request, like aiohttp does), so ticks measure the hot path without any network.
+The fixtures are synthetic: record_fixtures.py records them from the UGOS simulator
+(tools/ugos_simulator.py), not from a real NAS.
+
+Reported per model: setup time, per-tick wall and CPU time, traced allocations per
+tick and the number of HA state writes. Ticks run on a simulated clock (5s status,
+60s config interval), so tiered endpoints and cached responses expire as on a real NAS.
+
+Exits with 1 if a timing or allocation figure regressed by more than --tolerance
+against the stored baseline, or if the number of state writes changed.
+Needs Home Assistant installed, a version hacs.json supports; baselines.json records
+the environment it was generated in and is only comparable on a similar one.
+"""
+import argparse
+import asyncio
+import gc
+import glob
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import defaultdict
+from datetime import timedelta
+from typing import Any
+
+# String hashing changes dict layouts and with them tick times by up to ~1.5x between
+# runs; a fixed seed keeps runs comparable with each other and with the baseline.
+if __name__ == "__main__" and os.environ.get("PYTHONHASHSEED") != "0":
+    os.environ["PYTHONHASHSEED"] = "0"
+    os.execv(sys.executable, [sys.executable, *sys.argv])
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+from homeassistant.const import __version__ as HA_VERSION  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+from homeassistant.helpers import device_registry as dr, entity as entity_helper, entity_registry as er  # noqa: E402
+from homeassistant.helpers.entity_platform import EntityPlatform  # noqa: E402
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator  # noqa: E402
+
+from custom_components.ugreen_pro import build_entity_lists, entities as catalogue, get_entity_data_from_api  # noqa: E402
+from custom_components.ugreen_pro.api import UgreenApiClient  # noqa: E402
+from custom_components.ugreen_pro.const import CONFIG_INTERVAL, DEFAULT_STATUS_INTERVAL, DOMAIN, TICK_DEADLINE_SHARE  # noqa: E402
+from custom_components.ugreen_pro.derived import DerivedMetricEngine  # noqa: E402
+from custom_components.ugreen_pro.polling import TieredEndpointSchedule  # noqa: E402
+from custom_components.ugreen_pro.sensor import UgreenNasSensor  # noqa: E402
+from custom_components.ugreen_pro.utils import ExtractionPlan, FormattingPlan  # noqa: E402
+
+FIXTURES = os.path.join(HERE, "fixtures")
+BASELINES = os.path.join(HERE, "baselines.json")
+_LOGGER = logging.getLogger("ugreen_pro.benchmark")
+
+# Figures compared against the baseline with --tolerance (the rest is informational).
+COMPARED = ("setup_ms", "tick_cpu_us_median", "alloc_peak_bytes_median")
+
+
+class ReplayClient(UgreenApiClient):
+    """UgreenApiClient answering from a fixture instead of the NAS, cycling through its samples."""
+
+    def __init__(self, responses: dict[str, list]) -> None:
+        super().__init__("replay", 0, token="replay")
+        self._bodies = {endpoint: [json.dumps(r).encode() for r in samples] for endpoint, samples in responses.items()}
+        self._served: dict[str, int] = defaultdict(int)
+
+    async def _send(self, session, method: str, endpoint: str, token: str, payload: dict[str, Any] | None = None) -> dict[str, Any]:
+        started = self.metrics.request_started(endpoint)
+        samples = self._bodies.get(endpoint)
+        if not samples:
+            self.metrics.request_finished(endpoint, started, "failure")
+            return {}
+        body = samples[self._served[endpoint] % len(samples)]
+        self._served[endpoint] += 1
+        data = json.loads(body)
+        self.metrics.request_finished(endpoint, started, "success", len(body))
+        return data
+
+
+class SimulatedClock:
+    """Stands in for time.monotonic(); advanced by the benchmark one interval per tick."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class SimulatedClockSchedule:
+    """TieredEndpointSchedule driven by a simulated clock instead of time.monotonic()."""
+
+    def __init__(self, schedule: TieredEndpointSchedule, clock: SimulatedClock) -> None:
+        self.schedule = schedule
+        self.clock = clock
+
+    def due(self, now: float) -> list[str]:
+        return self.schedule.due(self.clock.now)
+
+    def fetched(self, endpoints, now: float) -> None:
+        self.schedule.fetched(endpoints, self.clock.now)
+
+
+class Pipeline:
+    """One coordinator with its plans, as set up by async_setup_entry."""
+
+    def __init__(self, hass: HomeAssistant, api: UgreenApiClient, name: str, entities: list, interval: float) -> None:
+        self.entities = entities
+        self.clock = api.response_cache.clock
+        self.interval = interval
+        self.grouped: dict[str, list] = defaultdict(list)
+        for entity in entities:
+            self.grouped[entity.endpoint].append(entity)
+        self.extraction_plans = {endpoint: ExtractionPlan(group) for endpoint, group in self.grouped.items()}
+        self.schedule = SimulatedClockSchedule(TieredEndpointSchedule(self.grouped), self.clock)
+        self.derived_metrics = DerivedMetricEngine(entities)
+        self.formatting_plan = FormattingPlan(entities)
+        self.stale_endpoints: set[str] = set()
+
+        async def update() -> dict[str, Any]:
+            data = await get_entity_data_from_api(
+                api, None, self.grouped, self.extraction_plans, self.derived_metrics, self.schedule,
+                self.coordinator.data, self.stale_endpoints,
+                deadline=interval * TICK_DEADLINE_SHARE,
+            )
+            self.formatting_plan.format(data)
+            return data
+
+        # No update_interval: ticks are driven by the benchmark.
+        self.coordinator = DataUpdateCoordinator(hass, _LOGGER, name=name, update_method=update)
+
+
+def load_fixture(model: str) -> dict:
+    with open(os.path.join(FIXTURES, f"{model}.json")) as file:
+        return json.load(file)
+
+
+async def build_fixture_entities(fixture: dict) -> tuple[ReplayClient, list, list]:
+    """Discovery and entity lists for a fixture, as async_setup_entry builds them."""
+    api = ReplayClient(fixture["responses"])
+    # Both coordinators and the response cache share one simulated clock, so cached
+    # responses expire by simulated time as on a real NAS.
+    api.response_cache.clock = SimulatedClock()
+    await api.discover(None)
+    await api.count_dynamic_entities(None)
+    config_entities, status_entities = await build_entity_lists(api, None, catalogue)
+    return api, config_entities, status_entities
+
+
+async def create_hass(config_dir: str) -> HomeAssistant:
+    hass = HomeAssistant(config_dir)
+    entity_helper.async_setup(hass)
+    await dr.async_load(hass)
+    await er.async_load(hass)
+    return hass
+
+
+async def run_model(fixture: dict, status_ticks: int, config_ticks: int, rounds: int) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = await create_hass(config_dir)
+        try:
+            return await _run_model(hass, fixture, status_ticks, config_ticks, rounds)
+        finally:
+            await hass.async_stop(force=True)
+
+
+async def _run_model(hass: HomeAssistant, fixture: dict, status_ticks: int, config_ticks: int, rounds: int) -> dict[str, Any]:
+    ### Setup: discovery, entity lists and plans (as in async_setup_entry); the quickest round counts.
+    setup = float("inf")
+    for _ in range(rounds):
+        gc.collect()
+        started = time.perf_counter()
+        api, config_entities, status_entities = await build_fixture_entities(fixture)
+        config = Pipeline(hass, api, "ugreen_configuration", config_entities, CONFIG_INTERVAL)
+        status = Pipeline(hass, api, "ugreen_status", status_entities, DEFAULT_STATUS_INTERVAL)
+        setup = min(setup, time.perf_counter() - started)
+
+    ### First refresh, then the sensors join the platform (as sensor.async_setup_entry does).
+    await config.coordinator.async_refresh()
+    await status.coordinator.async_refresh()
+    sensors = [
+        UgreenNasSensor(
+            "benchmark", pipeline.coordinator, entity, pipeline.formatting_plan, fixture["model"], api.metrics, pipeline.stale_endpoints
+        )
+        for pipeline in (config, status)
+        for entity in pipeline.entities
+    ]
+    platform_ = EntityPlatform(
+        hass=hass, logger=_LOGGER, domain="sensor", platform_name=DOMAIN, platform=None,
+        scan_interval=timedelta(seconds=30), entity_namespace=None,
+    )
+    started = time.perf_counter()
+    await platform_.async_add_entities(sensors)
+    add_entities = time.perf_counter() - started
+
+    status_result = await _run_ticks(api, status, status_ticks, rounds)
+    config_result = await _run_ticks(api, config, config_ticks, rounds)
+    return {
+        "entities": {"config": len(config_entities), "status": len(status_entities)},
+        "setup_ms": round(setup * 1000, 3),
+        "add_entities_ms": round(add_entities * 1000, 3),
+        "status": status_result,
+        "config": config_result,
+    }
+
+
+async def _run_ticks(api: UgreenApiClient, pipeline: Pipeline, ticks: int, rounds: int) -> dict[str, Any]:
+    # Timed rounds (the quickest round counts, which filters out noise from the rest of the
+    # machine), then one more round under tracemalloc (which slows ticks down).
+    coordinator = pipeline.coordinator
+    best: tuple[list[float], list[float]] | None = None
+    writes: list[int] = []
+    for round_ in range(rounds):
+        wall, cpu = [], []
+        gc.collect()
+        for _ in range(ticks):
+            pipeline.clock.now += pipeline.interval
+            published = api.metrics.state_writes_published
+            wall_started, cpu_started = time.perf_counter(), time.thread_time()
+            await coordinator.async_refresh()
+            cpu.append(time.thread_time() - cpu_started)
+            wall.append(time.perf_counter() - wall_started)
+            if round_ == 0:
+                writes.append(api.metrics.state_writes_published - published)
+        if best is None or statistics.median(cpu) < statistics.median(best[1]):
+            best = (wall, cpu)
+    wall, cpu = best  # type: ignore[misc]
+
+    allocated, retained = [], []
+    tracemalloc.start()
+    try:
+        for _ in range(ticks):
+            pipeline.clock.now += pipeline.interval
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            await coordinator.async_refresh()
+            current, peak = tracemalloc.get_traced_memory()
+            allocated.append(peak - before)
+            retained.append(current - before)
+    finally:
+        tracemalloc.stop()
+
+    if not coordinator.last_update_success:
+        raise RuntimeError(f"{coordinator.name} failed: {coordinator.last_exception}")
+    return {
+        "ticks": ticks,
+        "rounds": rounds,
+        "tick_wall_us_median": _us(statistics.median(wall)),
+        "tick_wall_us_p95": _us(_percentile(wall, 95)),
+        "tick_cpu_us_median": _us(statistics.median(cpu)),
+        "tick_cpu_us_mean": _us(statistics.fmean(cpu)),
+        "alloc_peak_bytes_median": int(statistics.median(allocated)),
+        "alloc_retained_bytes_mean": int(statistics.fmean(retained)),
+        "state_writes_per_tick": round(statistics.fmean(writes), 2),
+        "state_writes_total": sum(writes),
+    }
+
+
+def time_best(functions: dict[str, Any], rounds: int, number: int) -> dict[str, float]:
+    """CPU seconds per call of each function, the quickest of 'rounds' runs of 'number' calls.
+
+    The functions take turns round by round, so a slow phase of the machine hits all of them.
+    """
+    best = dict.fromkeys(functions, float("inf"))
+    for _ in range(rounds):
+        for name, function in functions.items():
+            gc.collect()
+            started = time.thread_time()
+            for _ in range(number):
+                function()
+            best[name] = min(best[name], (time.thread_time() - started) / number)
+    return best
+
+
+def _us(seconds: float) -> float:
+    return round(seconds * 1e6, 1)
+
+
+def _percentile(values: list[float], percentile: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percentile / 100))]
+
+
+def compare(results: dict, baselines: dict, tolerance: float) -> list[str]:
+    """Regressions of results against baselines, as readable lines."""
+    regressions = []
+    for model, result in results.items():
+        baseline = baselines.get(model)
+        if baseline is None:
+            continue
+        checks = [("setup_ms", result["setup_ms"], baseline["setup_ms"])]
+        for part in ("status", "config"):
+            for key in COMPARED[1:]:
+                checks.append((f"{part}.{key}", result[part][key], baseline[part][key]))
+            if result[part]["state_writes_total"] != baseline[part]["state_writes_total"]:
+                regressions.append(
+                    f"{model} {part}.state_writes_total: {baseline[part]['state_writes_total']} -> {result[part]['state_writes_total']}"
+                )
+        for name, value, reference in checks:
+            if reference and value > reference * tolerance:
+                regressions.append(f"{model} {name}: {reference} -> {value} ({value / reference:.2f}x)")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model", action="append", help="fixture name (default: all)")
+    parser.add_argument("--status-ticks", type=int, default=120, help="status ticks per pass (5s each)")
+    parser.add_argument("--config-ticks", type=int, default=60, help="config ticks per pass (60s each)")
+    parser.add_argument("--rounds", type=int, default=5, help="timed passes per coordinator, the quickest counts")
+    parser.add_argument("--tolerance", type=float, default=1.5, help="allowed factor over the baseline")
+    parser.add_argument("--update", action="store_true", help="store the results as the new baselines")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    results = {}
+    for path in sorted(glob.glob(os.path.join(FIXTURES, "*.json"))):
+        model = os.path.splitext(os.path.basename(path))[0]
+        if args.model and model not in args.model:
+            continue
+        with open(path) as file:
+            fixture = json.load(file)
+        results[model] = asyncio.run(run_model(fixture, args.status_ticks, args.config_ticks, args.rounds))
+        status, config = results[model]["status"], results[model]["config"]
+        print(
+            f"{model:20} setup {results[model]['setup_ms']:7.2f} ms | "
+            f"status tick {status['tick_cpu_us_median']:8.1f} us cpu, {status['alloc_peak_bytes_median']:7d} B, "
+            f"{status['state_writes_per_tick']:6.2f} writes | "
+            f"config tick {config['tick_cpu_us_median']:8.1f} us cpu, {config['alloc_peak_bytes_median']:7d} B, "
+            f"{config['state_writes_per_tick']:6.2f} writes"
+        )
+
+    if args.update:
+        with open(BASELINES, "w") as file:
+            json.dump({
+                "environment": {
+                    "python": platform.python_version(),
+                    "hash_seed": os.environ.get("PYTHONHASHSEED"),
+                    "home_assistant": HA_VERSION,
+                    "machine": platform.machine(),
+                },
+                "models": results,
+            }, file, indent=1, sort_keys=True)
+            file.write("\n")
+        print(f"Baselines written to {BASELINES}")
+        return
+
+    if not os.path.exists(BASELINES):
+        return
+    with open(BASELINES) as file:
+        baselines = json.load(file)["models"]
+    regressions = compare(results, baselines, args.tolerance)
+    for line in regressions:
+        print("REGRESSION", line)
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Record the API responses used by bench_polling.py from the UGOS simulator (tools/ugos_simulator.py).
+
+    python benchmarks/record_fixtures.py [--samples 12]
+
+Writes one fixture per model to benchmarks/fixtures/<model>.json. The fixtures are
+synthetic: every response comes from the simulator, whose topologies follow the
+hardware of the real models, not from a real NAS. Needs Home Assistant, aiohttp and
+pycryptodome (the integration's own client does the requests).
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+from dataclasses import asdict
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [os.path.dirname(HERE), os.path.join(os.path.dirname(HERE), "tools")]
+
+import aiohttp  # noqa: E402
+
+from custom_components.ugreen_pro.api import DISCOVERY_ENDPOINTS, UgreenApiClient  # noqa: E402
+from ugos_simulator import SimulatorConfig, serve  # noqa: E402
+
+FIXTURES = os.path.join(HERE, "fixtures")
+
+# Benchmarked models; the topology follows the hardware of the real devices.
+MODELS = {
+    "2-bay": SimulatorConfig(bays=2, pools=1, nics=1, dimms=1, device_fans=1),
+    "4-bay-dxp4800-plus": SimulatorConfig(bays=4, pools=1, nics=2, dimms=1, device_fans=1, model="DXP4800 Plus"),
+    "6-bay": SimulatorConfig(bays=6, pools=2, nics=2, dimms=2, device_fans=2, usbs=1),
+    "8-bay-gpu": SimulatorConfig(bays=8, pools=2, volumes_per_pool=2, nics=2, dimms=2, device_fans=2, gpu=True, usbs=1, ups=True),
+}
+
+DESKTOP_ENDPOINTS = (
+    "/ugreen/v1/desktop/components/data?id=desktop.component.SystemStatus",
+    "/ugreen/v1/desktop/components/data?id=desktop.component.TemperatureMonitoring",
+)
+
+
+async def record(name: str, config: SimulatorConfig, samples: int, port: int) -> dict:
+    config.seed = 0
+    runner = await serve(config, port=port)
+    try:
+        client = UgreenApiClient("127.0.0.1", port, config.username, config.password)
+        # Every sample comes from the simulator, not from the response cache.
+        client.response_cache.policies, client.response_cache.default = {}, (0.0, 0.0)
+        async with aiohttp.ClientSession() as session:
+            if not await client.authenticate(session):
+                raise RuntimeError(f"login to the simulator failed for {name}")
+            endpoints = DISCOVERY_ENDPOINTS + DESKTOP_ENDPOINTS
+            recorded: dict[str, list] = {endpoint: [] for endpoint in endpoints}
+            for _ in range(samples):
+                responses, failed = await client.get_many(session, endpoints)
+                if failed:
+                    raise RuntimeError(f"simulator failed to answer {failed}")
+                for endpoint in endpoints:
+                    recorded[endpoint].append(responses[endpoint])
+    finally:
+        await runner.cleanup()
+    # Responses that never changed are stored once.
+    for endpoint, responses in recorded.items():
+        if all(response == responses[0] for response in responses):
+            recorded[endpoint] = responses[:1]
+    return {"model": name, "simulator": asdict(config), "responses": recorded}
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=12, help="responses recorded per endpoint")
+    parser.add_argument("--port", type=int, default=18999)
+    args = parser.parse_args()
+
+    os.makedirs(FIXTURES, exist_ok=True)
+    for index, (name, config) in enumerate(MODELS.items()):
+        # One port per model: the client caches the NAS's public key per address.
+        fixture = await record(name, config, args.samples, args.port + index)
+        path = os.path.join(FIXTURES, f"{name}.json")
+        with open(path, "w") as file:
+            json.dump(fixture, file, indent=1, sort_keys=True)
+            file.write("\n")
+        print(f"{name}: {path}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
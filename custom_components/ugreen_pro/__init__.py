@@ -1,17 +1,30 @@
+import asyncio
+import importlib
 import logging
+import time
+from types import ModuleType
 from datetime import timedelta
 from typing import Any
 from collections import defaultdict
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.helpers.device_registry import async_get as async_get_device_registry, CONNECTION_NETWORK_MAC
 
-from .const import DOMAIN, PLATFORMS
-from .utils import extract_value_from_path, scale_bytes_per_second
-from .api import UgreenApiClient, STATIC_BUTTON_ENTITIES, STATIC_CONFIG_ENTITIES, STATIC_STATUS_ENTITIES
+from .const import (
+    DOMAIN, PLATFORMS, CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS, TOKEN_RENEWAL_CHECK_INTERVAL,
+    TOPOLOGY_STORAGE_VERSION, TOPOLOGY_RECONCILE_RETRY, CONF_STATUS_INTERVAL, CONF_STATUS_INTERVAL_MAX,
+    DEFAULT_STATUS_INTERVAL, DEFAULT_STATUS_INTERVAL_MAX, CONFIG_INTERVAL, CONFIG_INTERVAL_MAX, TICK_DEADLINE_SHARE,
+)
+from .utils import ExtractionPlan, FormattingPlan, compile_entity_paths
+from .polling import AdaptivePollInterval, TieredEndpointSchedule
+from .derived import DerivedMetricEngine
+from .api import UgreenApiClient, UgreenDiscovery
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,47 +44,90 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         password=entry.data["password"],
         use_https=entry.data.get("use_https", False),
         verify_ssl=entry.data.get("verify_ssl", False),
+        max_concurrent_requests=entry.options.get(CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS),
     )
 
-    ### Initial authentication through API.
-    if not await api.authenticate(session):
-        _LOGGER.error("[UGREEN NAS] Initial login failed. Aborting setup.")
-        return False
+    ### Discovery: start from the topology stored by the last run if there is one, otherwise
+    ### log in and fetch every discovery endpoint once (concurrently) now.
+    ### With a stored topology setup does not wait for the NAS at all: no login, no first
+    ### refresh. The first poll logs in through the re-login on code 1024 (see api.get), and
+    ### the topology is re-checked in the background once setup is done (see below).
+    topology_store = topology_store_for(hass, entry)
+    stored_topology = await topology_store.async_load()
+    if stored_topology:
+        api.load_topology(stored_topology)
+        _LOGGER.debug("[UGREEN NAS] Using stored topology, login and re-discovery run in the background.")
+    else:
+        if not await api.authenticate(session):
+            raise ConfigEntryNotReady("[UGREEN NAS] Initial login failed")
+        discovery = await api.discover(session)
 
     # Create global counters for dynamic entities and RAM.
     dynamic_entity_counts = await api.count_dynamic_entities(session)
     _LOGGER.debug("[UGREEN NAS] Entity counts done: %s", dynamic_entity_counts)
 
-    ### Build list of config entities; group it to ensure single 60s API requests.
-    ### Keeping it the 'long' way (no loop) for better readability.
-    config_entities  = list(STATIC_CONFIG_ENTITIES)
-    config_entities += await api.get_dynamic_config_entities_storage(session) or []
-    config_entities += await api.get_dynamic_config_entities_mem(session) or []
-    config_entities += await api.get_dynamic_config_entities_lan(session) or []
-    config_entities += await api.get_dynamic_config_entities_usb(session) or []
-    config_entities += await api.get_dynamic_config_entities_ups(session) or []
+    catalogue = await async_load_entity_catalogue(hass)
+    config_entities, status_entities = await build_entity_lists(api, session, catalogue)
+    if not stored_topology and not discovery.failed:
+        await topology_store.async_save(api.export_topology())
+
+    ### Group config entities to ensure single 60s API requests.
     config_entities_grouped_by_endpoint = defaultdict(list)
     for entity in config_entities:
         config_entities_grouped_by_endpoint[entity.endpoint].append(entity)
+    config_extraction_plans = {
+        endpoint: ExtractionPlan(entities) for endpoint, entities in config_entities_grouped_by_endpoint.items()
+    }
+    config_schedule = TieredEndpointSchedule(config_entities_grouped_by_endpoint)
+    config_derived_metrics = DerivedMetricEngine(config_entities)
+    config_formatting_plan = FormattingPlan(config_entities)
+    config_stale_endpoints: set[str] = set()
     _LOGGER.debug("[UGREEN NAS] List of config entities prepared.")
 
-    ### Build list of status entities; group it to ensure single 5s API requests.
-    ### Keeping it the 'long' way (no loop) for better readability.
-    status_entities  = list(STATIC_STATUS_ENTITIES)
-    status_entities += await api.get_dynamic_status_entities_storage() or []
-    status_entities += await api.get_dynamic_status_entities_lan() or []
-    status_entities += await api.get_dynamic_status_entities_fan() or []
+    ### Group status entities to ensure single 5s API requests.
     status_entities_grouped_by_endpoint = defaultdict(list)
     for entity in status_entities:
         status_entities_grouped_by_endpoint[entity.endpoint].append(entity)
+    status_extraction_plans = {
+        endpoint: ExtractionPlan(entities) for endpoint, entities in status_entities_grouped_by_endpoint.items()
+    }
+    status_schedule = TieredEndpointSchedule(status_entities_grouped_by_endpoint)
+    status_derived_metrics = DerivedMetricEngine(status_entities)
+    status_formatting_plan = FormattingPlan(status_entities)
+    status_stale_endpoints: set[str] = set()
     _LOGGER.debug("[UGREEN NAS] List of status entities prepared.")
 
+    ### Adaptive update intervals, always within the (user-set) bounds.
+    ### Status: back to the minimum while network/disk rates move, stretched while they are flat.
+    ### Both: stretched while the NAS answers slowly.
+    status_interval = entry.options.get(CONF_STATUS_INTERVAL, DEFAULT_STATUS_INTERVAL)
+    status_poll_interval = AdaptivePollInterval(
+        minimum=status_interval,
+        maximum=entry.options.get(CONF_STATUS_INTERVAL_MAX, max(status_interval, DEFAULT_STATUS_INTERVAL_MAX)),
+        activity_keys=[
+            e.description.key for e in status_entities
+            if not e.path.startswith("calculated:") and e.path.endswith("_rate")
+        ],
+    )
+    config_poll_interval = AdaptivePollInterval(minimum=CONFIG_INTERVAL, maximum=CONFIG_INTERVAL_MAX)
+
     ### Updater for config entities (called every 60s by the config coordinator).
     async def update_configuration_data() -> dict[str, Any]:
         try:
             _LOGGER.debug("[UGREEN NAS] Updating configuration data...")
             endpoint_to_entities = hass.data[DOMAIN][entry.entry_id]["config_entities_grouped_by_endpoint"]
-            return await get_entity_data_from_api(api, session, endpoint_to_entities)
+            extraction_plans = hass.data[DOMAIN][entry.entry_id]["config_extraction_plans"]
+            started = time.monotonic()
+            data = await get_entity_data_from_api(
+                api, session, endpoint_to_entities, extraction_plans, config_derived_metrics, config_schedule,
+                config_coordinator.data, config_stale_endpoints,
+                deadline=config_poll_interval.interval * TICK_DEADLINE_SHARE,
+            )
+            config_coordinator.update_interval = timedelta(
+                seconds=config_poll_interval.next_interval(data, time.monotonic() - started)
+            )
+            config_formatting_plan.format(data)
+            return data
         except Exception as err:
             raise UpdateFailed(f"[UGREEN NAS] Configuration entities update error: {err}") from err
 
@@ -80,47 +136,28 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         try:
             _LOGGER.debug("[UGREEN NAS] Updating status data...")
             endpoint_to_entities = hass.data[DOMAIN][entry.entry_id]["status_entities_grouped_by_endpoint"]
-            return await get_entity_data_from_api(api, session, endpoint_to_entities)
+            extraction_plans = hass.data[DOMAIN][entry.entry_id]["status_extraction_plans"]
+            started = time.monotonic()
+            data = await get_entity_data_from_api(
+                api, session, endpoint_to_entities, extraction_plans, status_derived_metrics, status_schedule,
+                status_coordinator.data, status_stale_endpoints,
+                deadline=status_poll_interval.interval * TICK_DEADLINE_SHARE,
+            )
+            status_coordinator.update_interval = timedelta(
+                seconds=status_poll_interval.next_interval(data, time.monotonic() - started)
+            )
+            status_formatting_plan.format(data)
+            return data
         except Exception as err:
             raise UpdateFailed(f"[UGREEN NAS] Status entities update error: {err}") from err
 
-    # Helper function to fetch data and extract values, used by both 'update_xx' functions above.
-    # Put below for easier code readability (grrr, looks unusual to have it called before defined).
-    async def get_entity_data_from_api(api, session, endpoint_to_entities):
-        data: dict[str, Any] = {}
-        for endpoint_str, entities in endpoint_to_entities.items():
-            try:
-                response = await api.get(session, endpoint_str)
-            except Exception as e:
-                _LOGGER.warning("[UGREEN NAS] Failed to fetch '%s': %s", endpoint_str, e)
-                for entity in entities:
-                    data[entity.description.key] = None
-                continue
-            for entity in entities:
-                try:
-                    path = getattr(entity, "path", None)
-                    if isinstance(path, str) and not path.startswith("calculated:"):
-                        value = extract_value_from_path(response, path)
-                    elif isinstance(path, str): # 'virtual' endpoints handling
-                        if path.startswith("calculated:ram_total_size"):
-                            value = sum(v for k, v in data.items() if k.startswith("RAM") and k.endswith("_size"))
-                        elif path.startswith("calculated:scale_bytes_per_second:"):
-                            value = scale_bytes_per_second(extract_value_from_path(response, path.split(":", 2)[2]))
-                        else:
-                            value = None # fallback for unknown 'calculated' identifiers
-                    data[entity.description.key] = value
-                except Exception as e:
-                    _LOGGER.warning("[UGREEN NAS] Failed to extract '%s': %s", entity.description.key, e)
-                    data[entity.description.key] = None
-        return data
-
     ### Create update coordinator for config entities.
     config_coordinator = DataUpdateCoordinator(
         hass,
         _LOGGER,
         name="ugreen_configuration",
         update_method=update_configuration_data,
-        update_interval=timedelta(seconds=60),
+        update_interval=timedelta(seconds=CONFIG_INTERVAL),
     )
 
     ### Create update coordinator for status entities.
@@ -129,7 +166,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _LOGGER,
         name="ugreen_status",
         update_method=update_status_data,
-        update_interval=timedelta(seconds=entry.options.get("status_interval", 5)),
+        update_interval=timedelta(seconds=status_interval),
     )
 
     ### Hand over all runtime objects to HA's data container.
@@ -137,26 +174,143 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         "config_coordinator": config_coordinator,
         "config_entities": config_entities,
         "config_entities_grouped_by_endpoint": config_entities_grouped_by_endpoint,
+        "config_extraction_plans": config_extraction_plans,
+        "config_formatting_plan": config_formatting_plan,
+        "config_stale_endpoints": config_stale_endpoints,
 
         "status_coordinator": status_coordinator,
         "status_entities": status_entities,
         "status_entities_grouped_by_endpoint": status_entities_grouped_by_endpoint,
+        "status_extraction_plans": status_extraction_plans,
+        "status_formatting_plan": status_formatting_plan,
+        "status_stale_endpoints": status_stale_endpoints,
 
-        "button_entities": STATIC_BUTTON_ENTITIES,
+        "button_entities": catalogue.STATIC_BUTTON_ENTITIES,
 
         "dynamic_entity_counts": dynamic_entity_counts,
         "api": api,
     }
 
-    ### Initial refresh through coordinators.
-    await config_coordinator.async_config_entry_first_refresh()
-    await status_coordinator.async_config_entry_first_refresh()
+    ### Initial refresh through coordinators (fresh discovery only; with a stored topology
+    ### the first refresh runs in the background once the entities exist, see below).
+    if not stored_topology:
+        await config_coordinator.async_config_entry_first_refresh()
+        await status_coordinator.async_config_entry_first_refresh()
+
+    ### Device registration from the discovery snapshot (stored or fresh); with a stored
+    ### topology, reconcile_topology updates it from the fresh discovery.
+    register_device(hass, entry, await api.discover(session))
+
+    ### Renew the token in the background before it expires, keeping logins off the polling path.
+    ### The reactive re-login on code 1024 in api.get/post stays as the fallback.
+    @callback
+    def schedule_token_renewal(_now) -> None:
+        if api.token_renewal_due():
+            hass.async_create_background_task(api.refresh_token(session), "ugreen_pro_token_renewal")
+
+    entry.async_on_unload(
+        async_track_time_interval(hass, schedule_token_renewal, timedelta(seconds=TOKEN_RENEWAL_CHECK_INTERVAL))
+    )
+
+    # A final step, and initialization / startup is done.
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    _LOGGER.debug("[UGREEN NAS] Forwarded entry setups to platforms - setup complete.")
+
+    ### Entities came from the stored topology: refresh them now instead of after the first
+    ### interval, re-discover in the background and reload the entry if the NAS layout
+    ### changed (disks, pools, NICs, ...).
+    if stored_topology:
+        for coordinator in (config_coordinator, status_coordinator):
+            entry.async_create_background_task(hass, coordinator.async_refresh(), f"ugreen_pro_{coordinator.name}_first_refresh")
+        entry.async_create_background_task(
+            hass,
+            reconcile_topology(hass, entry, api, session, config_entities + status_entities),
+            "ugreen_pro_topology_reconcile",
+        )
+
+    return True
+
+
+# Fetches data and extracts values, used by both 'update_xx' functions in async_setup_entry.
+# Only endpoints due per their poll tier are fetched, all of them concurrently; entities of the
+# other endpoints keep their previous values.
+# Entities of endpoints that failed (or were skipped while the NAS is not responding, see breaker.py)
+# keep their last known values too; those endpoints are kept in 'stale_endpoints' until they answer.
+# Requests still running at the 'deadline' (seconds) time out, so a slow endpoint cannot push
+# the tick past its interval; the endpoints that answered in time are published as usual.
+# Each response is resolved in a single tree walk by the endpoint's ExtractionPlan; 'calculated:'
+# entities are evaluated afterwards by the coordinator's DerivedMetricEngine.
+async def get_entity_data_from_api(api, session, endpoint_to_entities, extraction_plans, derived_metrics, schedule, previous, stale_endpoints, deadline=None):
+    data: dict[str, Any] = {}
+    resolved: dict[str, Any] = {}
+    previous = previous or {}
+    now = time.monotonic()
+    due = schedule.due(now)
+    responses, failed = await api.get_many(session, due, deadline)
+    schedule.fetched([endpoint for endpoint in due if endpoint not in failed], now)
+    if failed:
+        log = _LOGGER.debug if api.breaker.is_open else _LOGGER.warning
+        log("[UGREEN NAS] %d of %d endpoints failed: %s", len(failed), len(due), ", ".join(failed))
+    stale_endpoints.difference_update(responses)
+    stale_endpoints.update(failed)
+    for endpoint_str, entities in endpoint_to_entities.items():
+        if endpoint_str not in responses or endpoint_str in stale_endpoints:
+            # Not due on this tick, or no answer: carry the last values over.
+            for entity in entities:
+                data[entity.description.key] = previous.get(entity.description.key)
+            continue
+        response = responses.get(endpoint_str) or {}
+        values = extraction_plans[endpoint_str].resolve(response)
+        resolved.update(values)
+        for entity in entities:
+            if not entity.path.startswith("calculated:"):
+                data[entity.description.key] = values.get(entity.description.key)
+    derived_metrics.evaluate(resolved, data)
+    return data
+
+
+def topology_store_for(hass: HomeAssistant, entry: ConfigEntry) -> Store:
+    """Storage helper holding the discovered topology of one config entry."""
+    return Store(hass, TOPOLOGY_STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.topology")
+
+
+async def async_load_entity_catalogue(hass: HomeAssistant) -> ModuleType:
+    """Import the static entity tables (entities.py) on first use, in the executor."""
+    return await hass.async_add_import_executor_job(importlib.import_module, ".entities", __name__)
+
+
+async def build_entity_lists(api: UgreenApiClient, session, catalogue: ModuleType) -> tuple[list, list]:
+    """Build (and compile) the config and status entity lists from the api's discovery."""
+
+    ### Build list of config entities.
+    ### Keeping it the 'long' way (no loop) for better readability.
+    config_entities  = list(catalogue.STATIC_CONFIG_ENTITIES)
+    config_entities += await api.get_dynamic_config_entities_storage(session) or []
+    config_entities += await api.get_dynamic_config_entities_mem(session) or []
+    config_entities += await api.get_dynamic_config_entities_lan(session) or []
+    config_entities += await api.get_dynamic_config_entities_usb(session) or []
+    config_entities += await api.get_dynamic_config_entities_ups(session) or []
+    compile_entity_paths(config_entities)
+
+    ### Build list of status entities.
+    ### Keeping it the 'long' way (no loop) for better readability.
+    status_entities  = list(catalogue.STATIC_STATUS_ENTITIES)
+    status_entities += await api.get_dynamic_status_entities_storage() or []
+    status_entities += await api.get_dynamic_status_entities_lan() or []
+    status_entities += await api.get_dynamic_status_entities_fan() or []
+    compile_entity_paths(status_entities)
+
+    return config_entities, status_entities
+
+
+def register_device(hass: HomeAssistant, entry: ConfigEntry, discovery: UgreenDiscovery) -> None:
+    """Register (or update) the NAS device from a discovery snapshot."""
 
     ### Device registration - identify through serial # and MAC addresses (fallback).
     ### These will be added on-the-fly, no re-registration of the NAS after update needed.
     try:
         dev_reg = async_get_device_registry(hass)
-        sys_info = await api.get(session, "/ugreen/v1/sysinfo/machine/common")
+        sys_info = discovery.get("/ugreen/v1/sysinfo/machine/common")
 
         common  = (sys_info or {}).get("data", {}).get("common", {})
         model   = common.get("model", "Unknown")
@@ -191,11 +345,26 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     except Exception as e:
         _LOGGER.warning("[UGREEN NAS] Device registration failed: %s", e)
 
-    # A final step, and initialization / startup is done.
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    _LOGGER.debug("[UGREEN NAS] Forwarded entry setups to platforms - setup complete.")
 
-    return True
+async def reconcile_topology(hass: HomeAssistant, entry: ConfigEntry, api: UgreenApiClient, session, entities: list) -> None:
+    """Re-discover the NAS, update the device, store the fresh topology and reload the entry if the layout changed."""
+    ### Retry until the NAS answers every discovery endpoint (it may be down at startup);
+    ### the task is cancelled with the entry.
+    while (discovery := await api.discover(session, refresh=True)).failed:
+        _LOGGER.debug("[UGREEN NAS] Background re-discovery incomplete, retrying in %ss.", TOPOLOGY_RECONCILE_RETRY)
+        await asyncio.sleep(TOPOLOGY_RECONCILE_RETRY)
+    register_device(hass, entry, discovery)
+    await api.count_dynamic_entities(session)
+    catalogue = await async_load_entity_catalogue(hass)
+    config_entities, status_entities = await build_entity_lists(api, session, catalogue)
+    await topology_store_for(hass, entry).async_save(api.export_topology())
+
+    def layout(items: list) -> list:
+        return [(e.description.key, e.endpoint, e.path) for e in items]
+
+    if layout(config_entities + status_entities) != layout(entities):
+        _LOGGER.info("[UGREEN NAS] NAS topology changed since last start, reloading entry.")
+        hass.config_entries.async_schedule_reload(entry.entry_id)
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -203,3 +372,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id, None)
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    await topology_store_for(hass, entry).async_remove()
@@ -1,510 +1,97 @@
 import logging, aiohttp, async_timeout, asyncio
 import base64
-from dataclasses import dataclass
-from typing import List, Any
-from homeassistant.helpers.entity import EntityDescription
+import json
+import sys
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterable, List, Any
 from homeassistant.const import (
-    PERCENTAGE, REVOLUTIONS_PER_MINUTE, UnitOfDataRate, UnitOfTemperature,
-    UnitOfInformation, UnitOfTime, UnitOfFrequency
+    PERCENTAGE, REVOLUTIONS_PER_MINUTE, UnitOfDataRate, UnitOfTemperature, UnitOfInformation
+)
+
+from .breaker import CLOSED, CircuitBreaker, NasUnavailableError
+from .cache import ResponseCache
+from .metrics import UgreenApiMetrics
+from .const import (
+    DEFAULT_MAX_CONCURRENT_REQUESTS, DEFAULT_TOKEN_TTL, TOKEN_RENEWAL_THRESHOLD, TOKEN_EARLY_EXPIRY_LIMIT,
+    DEADBAND_DATA_RATE, DEADBAND_FAN_SPEED, DEADBAND_TEMPERATURE,
+    REQUEST_TIMEOUT, REQUEST_TIMEOUT_MIN, REQUEST_TIMEOUT_P99_FACTOR, REQUEST_TIMEOUT_MIN_SAMPLES, REQUEST_TIMEOUT_RELEARN,
+    TICK_DEADLINE_GRACE,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Parsed RSA public keys per (base_url, username); reused until the NAS rejects a login.
+_PUBLIC_KEY_CACHE: dict[tuple[str, str], Any] = {}
+# (PKCS1_v1_5, RSA) from pycryptodome, imported once on first use (in the executor).
+_CRYPTO_MODULES: tuple | None = None
+# Monotonic time by which the requests of the current tick must be done (see get_many);
+# inherited by the tasks started for them.
+_REQUEST_EXPIRY: ContextVar[float | None] = ContextVar("ugreen_request_expiry", default=None)
 
-@dataclass
+
+def _crypto_modules() -> tuple:
+    global _CRYPTO_MODULES
+    if _CRYPTO_MODULES is None:
+        from Crypto.Cipher import PKCS1_v1_5
+        from Crypto.PublicKey import RSA
+        _CRYPTO_MODULES = (PKCS1_v1_5, RSA)
+    return _CRYPTO_MODULES
+
+
+@dataclass(frozen=True, slots=True)
+class UgreenEntityDescription:
+    """The part of HA's EntityDescription the UGREEN entities use (slotted, hundreds exist per NAS)."""
+    key: str
+    name: str | None = None
+    icon: str | None = None
+    unit_of_measurement: str | None = None
+
+
+@dataclass(slots=True)
 class UgreenEntity:
-    description: EntityDescription
+    description: UgreenEntityDescription
     endpoint: str
     path: str
     request_method: str = "GET"
     decimal_places: int = 2
     nas_part_category: str = ""
+    # Refresh tier (see const.POLL_TIER_PERIODS); "" = on every tick of the entity's coordinator.
+    poll_tier: str = ""
+    # Optional: numeric changes smaller than this are not written to HA (noisy values).
+    deadband: float | None = None
+    # Pre-compiled form of 'path', filled in once at setup (see utils.compile_entity_paths).
+    accessor: tuple | None = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Shared by many entities (and used as dict keys when grouping): keep one copy each.
+        self.endpoint = sys.intern(self.endpoint)
+        self.request_method = sys.intern(self.request_method)
+        self.nas_part_category = sys.intern(self.nas_part_category)
+        self.poll_tier = sys.intern(self.poll_tier)
+
+
+# Endpoints needed to build the dynamic entities; fetched once per setup (see UgreenApiClient.discover).
+DISCOVERY_ENDPOINTS = (
+    "/ugreen/v1/sysinfo/machine/common",
+    "/ugreen/v2/storage/disk/list",
+    "/ugreen/v1/storage/pool/list",
+    "/ugreen/v1/taskmgr/stat/get_all",
+)
+# Discovery responses persisted as topology; get_all is only needed for its counts.
+TOPOLOGY_ENDPOINTS = DISCOVERY_ENDPOINTS[:3]
+
+
+@dataclass
+class UgreenDiscovery:
+    """Snapshot of the discovery endpoints, shared by all dynamic entity builders."""
+    responses: dict[str, dict[str, Any]] = field(default_factory=dict)
+    failed: List[str] = field(default_factory=list)
 
+    def get(self, endpoint: str) -> dict[str, Any]:
+        return self.responses.get(endpoint) or {}
 
-STATIC_CONFIG_ENTITIES: List[UgreenEntity] = [ ################ STATIC_CONFIG ##
-
-    ### Device Info
-    UgreenEntity(
-        description=EntityDescription(
-            key="model",
-            name="NAS Model",
-            icon="mdi:account",
-            unit_of_measurement=None,
-        ),
-        endpoint="/ugreen/v1/sysinfo/machine/common",
-        path="data.common.model",
-        nas_part_category="Device",
-    ),
-    UgreenEntity(
-        description=EntityDescription(
-            key="type",
-            name="NAS Type",
-            icon="mdi:nas",
-            unit_of_measurement=None,
-        ),
-        endpoint="/ugreen/v1/desktop/components/data?id=desktop.component.SystemStatus",
-        path="data.type",
-        nas_part_category="Device",
-    ),
-    UgreenEntity(
-        description=EntityDescription(
-            key="serial",
-            name="NAS Serial",
-            icon="mdi:focus-field",
-            unit_of_measurement=None,
-        ),
-        endpoint="/ugreen/v1/sysinfo/machine/common",
-        path="data.common.serial",
-        nas_part_category="Device",
-    ),
-    UgreenEntity(
-        description=EntityDescription(
-            key="owner",
-            name="NAS Owner",
-            icon="mdi:account",
-            unit_of_measurement=None,
-        ),
-        endpoint="/ugreen/v1/sysinfo/machine/common",
-        path="data.common.nas_owner",
-        nas_part_category="Device",
-    ),
-    UgreenEntity(
-        description=EntityDescription(
-            key="device_name",
-            name="NAS Name",
-            icon="mdi:nas",
-            unit_of_measurement=None,
-        ),
-        endpoint="/ugreen/v1/desktop/components/data?id=desktop.component.SystemStatus",
-        path="data.dev_name",
-        nas_part_category="Device",
-    ),
-    UgreenEntity(
-        description=EntityDescription(
-            key="version",
-            name="NAS UGOS Version",
-            icon="mdi:numeric",
-            unit_of_measurement=None,
-        ),
-        endpoint="/ugreen/v1/sysinfo/machine/common",
-        path="data.common.system_version",
-        nas_part_category="Device",
-    ),
-
-    ### Hardware Info
-    UgreenEntity(
-        description=EntityDescription(
-            key="cpu_model",
-            name="CPU Model",
-            icon="mdi:chip",
-            unit_of_measurement=None,
-        ),
-        endpoint="/ugreen/v1/sysinfo/machine/common",
-        path="data.hardware.cpu[0].model",
-        nas_part_category="Hardware",
-    ),
-    UgreenEntity(
-        description=EntityDescription(
-            key="cpu_ghz",
-            name="CPU Speed",
-            icon="mdi:speedometer",
-            unit_of_measurement=UnitOfFrequency.MEGAHERTZ,
-        ),
-        endpoint="/ugreen/v1/sysinfo/machine/common",
-        path="data.hardware.cpu[0].ghz",
-        decimal_places=0,
-        nas_part_category="Hardware",
-    ),
-    UgreenEntity(
-        description=EntityDescription(
-            key="cpu_core",
-            name="CPU Cores",
-            icon="mdi:chip",
-            unit_of_measurement="Cores",
-        ),
-        endpoint="/ugreen/v1/sysinfo/machine/common",
-        path="data.hardware.cpu[0].core",
-        decimal_places=0,
-        nas_part_category="Hardware",
-    ),
-    UgreenEntity(
-        description=EntityDescription(
-            key="cpu_thread",
-            name="CPU Threads",
-            icon="mdi:chip",
-            unit_of_measurement="Threads",
-        ),
-        endpoint="/ugreen/v1/sysinfo/machine/common",
-        path="data.hardware.cpu[0].thread",
-        decimal_places=0,
-        nas_part_category="Hardware",
-    ),
-
-    ### Runtime info
-        UgreenEntity(
-        description=EntityDescription(
-            key="last_boot_date",
-            name="Last Boot",
-            icon="mdi:calendar",
-            unit_of_measurement=None,
-        ),
-        endpoint="/ugreen/v1/desktop/components/data?id=desktop.component.SystemStatus",
-        path="data.last_boot_date",
-        nas_part_category="Status",
-    ),
-    UgreenEntity(
-        description=EntityDescription(
-            key="last_boot_time",
-            name="Last Boot Timestamp",
-            icon="mdi:clock",
-            unit_of_measurement=None,
-        ),
-        endpoint="/ugreen/v1/desktop/components/data?id=desktop.component.SystemStatus",
-        path="data.last_boot_time",
-        nas_part_category="Status",
-    ),
-    UgreenEntity(
-        description=EntityDescription(
-            key="total_run_time",
-            name="Total Runtime",
-            icon="mdi:timer-outline",
-            unit_of_measurement=UnitOfTime.SECONDS,
-        ),
-        endpoint="/ugreen/v1/desktop/components/data?id=desktop.component.SystemStatus",
-        path="data.total_run_time",
-        nas_part_category="Status",
-    ),
-
-    ### System Status
-    UgreenEntity(
-        description=EntityDescription(
-            key="server_status",
-            name="Server Status",
-            icon="mdi:server",
-            unit_of_measurement=None,
-        ),
-        endpoint="/ugreen/v1/desktop/components/data?id=desktop.component.SystemStatus",
-        path="data.server_status",
-        nas_part_category="Status",
-    ),
-    UgreenEntity(
-        description=EntityDescription(
-            key="status",
-            name="System Status Code",
-            icon="mdi:information",
-            unit_of_measurement=None,
-        ),
-        endpoint="/ugreen/v1/desktop/components/data?id=desktop.component.SystemStatus",
-        path="data.status",
-        nas_part_category="Status",
-    ),
-    UgreenEntity(
-        description=EntityDescription(
-            key="cpu_status",
-            name="CPU Temperature Status",
-            icon="mdi:alert",
-            unit_of_measurement=None,
-        ),
-        endpoint="/ugreen/v1/desktop/components/data?id=desktop.component.TemperatureMonitoring",
-        path="data.cpu_status",
-        nas_part_category="Status",
-    ),
-    UgreenEntity(
-        description=EntityDescription(
-            key="temperature_status",
-            name="Temperature Status Code",
-            icon="mdi:information",
-            unit_of_measurement=None,
-        ),
-        endpoint="/ugreen/v1/desktop/components/data?id=desktop.component.TemperatureMonitoring",
-        path="data.status",
-        nas_part_category="Status",
-    ),
-    UgreenEntity(
-        description=EntityDescription(
-            key="temperature_message",
-            name="Temperature Message",
-            icon="mdi:message-alert",
-            unit_of_measurement=None,
-        ),
-        endpoint="/ugreen/v1/desktop/components/data?id=desktop.component.TemperatureMonitoring",
-        path="data.message",
-        nas_part_category="Status",
-    ),
-    UgreenEntity(
-        description=EntityDescription(
-            key="message",
-            name="System Message",
-            icon="mdi:message",
-            unit_of_measurement=None,
-        ),
-        endpoint="/ugreen/v1/desktop/components/data?id=desktop.component.SystemStatus",
-        path="data.message",
-        nas_part_category="Status",
-    ),
-]
-
-
-STATIC_STATUS_ENTITIES = [ #################################### STATIC_STATUS ##
-
-    ### CPU
-    UgreenEntity(
-        description=EntityDescription(
-            key="cpu_usage",
-            name="CPU Usage",
-            icon="mdi:chip",
-            unit_of_measurement=PERCENTAGE,
-        ),
-        decimal_places=0,
-        endpoint="/ugreen/v1/taskmgr/stat/get_all",
-        path="data.overview.cpu[0].used_percent",
-        nas_part_category="Status",
-    ),
-    UgreenEntity(
-        description=EntityDescription(
-            key="cpu_temperature",
-            name="CPU Temperature",
-            icon="mdi:thermometer",
-            unit_of_measurement=UnitOfTemperature.CELSIUS,
-        ),
-        decimal_places=0,
-        endpoint="/ugreen/v1/taskmgr/stat/get_all",
-        path="data.overview.cpu[0].temp",
-        nas_part_category="Status",
-    ),
-
-    ### RAM
-    UgreenEntity(
-        description=EntityDescription(
-            key="mem_usage",
-            name="RAM Usage",
-            icon="mdi:memory",
-            unit_of_measurement=PERCENTAGE,
-        ),
-        endpoint="/ugreen/v1/taskmgr/stat/get_all",
-        path="data.overview.mem[0].used_percent",
-        nas_part_category="Status",
-    ),
-    UgreenEntity(
-        description=EntityDescription(
-            key="ram_usage_total_usable",
-            name="RAM Usage (Usable RAM)",
-            icon="mdi:memory",
-            unit_of_measurement=UnitOfInformation.BYTES,
-        ),
-        endpoint="/ugreen/v1/taskmgr/stat/get_all",
-        path="data.mem.structure.total",
-        nas_part_category="Status",
-    ),
-    UgreenEntity(
-        description=EntityDescription(
-            key="ram_usage_free",
-            name="RAM Usage (Free RAM)",
-            icon="mdi:memory",
-            unit_of_measurement=UnitOfInformation.BYTES,
-        ),
-        endpoint="/ugreen/v1/taskmgr/stat/get_all",
-        path="data.mem.structure.free",
-        nas_part_category="Status",
-    ),
-    UgreenEntity(
-        description=EntityDescription(
-            key="ram_usage_cache",
-            name="RAM Usage (Cache)",
-            icon="mdi:memory",
-            unit_of_measurement=UnitOfInformation.BYTES,
-        ),
-        endpoint="/ugreen/v1/taskmgr/stat/get_all",
-        path="data.mem.structure.cache",
-        nas_part_category="Status",
-    ),
-    UgreenEntity(
-        description=EntityDescription(
-            key="ram_usage_shared",
-            name="RAM Usage (Shared Mem)",
-            icon="mdi:memory",
-            unit_of_measurement=UnitOfInformation.BYTES,
-        ),
-        endpoint="/ugreen/v1/taskmgr/stat/get_all",
-        path="data.mem.structure.share",
-        nas_part_category="Status",
-    ),
-    UgreenEntity(
-        description=EntityDescription(
-            key="ram_usage_used_gb",
-            name="RAM Usage (Used GB)",
-            icon="mdi:memory",
-            unit_of_measurement=UnitOfInformation.BYTES,
-        ),
-        endpoint="/ugreen/v1/taskmgr/stat/get_all",
-        path="data.mem.structure.used",
-        nas_part_category="Status",
-    ),
-
-    ### LAN (net.overview = first element, overall)
-    UgreenEntity(
-        description=EntityDescription(
-            key="overall_lan_upload_raw",
-            name="Overall LAN Upload (raw)",
-            icon="mdi:upload-network",
-            unit_of_measurement=UnitOfDataRate.BYTES_PER_SECOND,
-        ),
-        endpoint="/ugreen/v1/taskmgr/stat/get_all",
-        path="data.net.series[0].send_rate",
-        nas_part_category="Status",
-    ),
-    UgreenEntity(
-        description=EntityDescription(
-            key="overall_lan_upload",
-            name="Overall LAN Upload",
-            icon="mdi:upload-network",
-            unit_of_measurement=None,
-        ),
-        endpoint="/ugreen/v1/taskmgr/stat/get_all",
-        path="calculated:scale_bytes_per_second:data.net.series[0].send_rate",
-        nas_part_category="Status",
-    ),
-    UgreenEntity(
-        description=EntityDescription(
-            key="overall_lan_download_raw",
-            name="Overall LAN Download (raw)",
-            icon="mdi:download-network",
-            unit_of_measurement=UnitOfDataRate.BYTES_PER_SECOND,
-        ),
-        endpoint="/ugreen/v1/taskmgr/stat/get_all",
-        path="data.net.series[0].recv_rate",
-        nas_part_category="Status",
-    ),
-    UgreenEntity(
-        description=EntityDescription(
-            key="overall_lan_download",
-            name="Overall LAN Download",
-            icon="mdi:download-network",
-            unit_of_measurement=None,
-        ),
-        endpoint="/ugreen/v1/taskmgr/stat/get_all",
-        path="calculated:scale_bytes_per_second:data.net.series[0].recv_rate",
-        nas_part_category="Status",
-    ),
-
-    ### Disks (disk.series only = first element, overall)
-    UgreenEntity(
-        description=EntityDescription(
-            key="overall_disk_read_rate_raw",
-            name="Overall Disk Read Rate (raw)",
-            icon="mdi:harddisk",
-            unit_of_measurement=UnitOfDataRate.BYTES_PER_SECOND,
-        ),
-        endpoint="/ugreen/v1/taskmgr/stat/get_all",
-        path="data.disk.series[0].read_rate",
-        nas_part_category="Status",
-    ),
-    UgreenEntity(
-        description=EntityDescription(
-            key="overall_disk_read_rate",
-            name="Overall Disk Read Rate",
-            icon="mdi:harddisk",
-            unit_of_measurement=None,
-        ),
-        endpoint="/ugreen/v1/taskmgr/stat/get_all",
-        path="calculated:scale_bytes_per_second:data.disk.series[0].read_rate",
-        nas_part_category="Status",
-    ),
-    UgreenEntity(
-        description=EntityDescription(
-            key="overall_disk_write_rate_raw",
-            name="Overall Disk Write Rate (raw)",
-            icon="mdi:harddisk",
-            unit_of_measurement=UnitOfDataRate.BYTES_PER_SECOND,
-        ),
-        endpoint="/ugreen/v1/taskmgr/stat/get_all",
-        path="data.disk.series[0].write_rate",
-        nas_part_category="Status",
-    ),
-    UgreenEntity(
-        description=EntityDescription(
-            key="overall_disk_write_rate",
-            name="Overall Disk Write Rate",
-            icon="mdi:harddisk",
-            unit_of_measurement=None,
-        ),
-        endpoint="/ugreen/v1/taskmgr/stat/get_all",
-        path="calculated:scale_bytes_per_second:data.disk.series[0].write_rate",
-        nas_part_category="Status",
-    ),
-
-    ### Volumes (volume.series only = first element, overall)
-    UgreenEntity(
-        description=EntityDescription(
-            key="overall_volume_read_rate_raw",
-            name="Overall Volume Read Rate (raw)",
-            icon="mdi:harddisk",
-            unit_of_measurement=UnitOfDataRate.BYTES_PER_SECOND,
-        ),
-        endpoint="/ugreen/v1/taskmgr/stat/get_all",
-        path="data.volume.series[0].read_rate",
-        nas_part_category="Status",
-    ),
-    UgreenEntity(
-        description=EntityDescription(
-            key="overall_volume_read_rate",
-            name="Overall Volume Read Rate",
-            icon="mdi:harddisk",
-            unit_of_measurement=None,
-        ),
-        endpoint="/ugreen/v1/taskmgr/stat/get_all",
-        path="calculated:scale_bytes_per_second:data.volume.series[0].read_rate",
-        nas_part_category="Status",
-    ),
-    UgreenEntity(
-        description=EntityDescription(
-            key="overall_volume_write_rate_raw",
-            name="Overall Volume Write Rate (raw)",
-            icon="mdi:harddisk",
-            unit_of_measurement=UnitOfDataRate.BYTES_PER_SECOND,
-        ),
-        endpoint="/ugreen/v1/taskmgr/stat/get_all",
-        path="data.volume.series[0].write_rate",
-        nas_part_category="Status",
-    ),
-    UgreenEntity(
-        description=EntityDescription(
-            key="overall_volume_write_rate",
-            name="Overall Volume Write Rate",
-            icon="mdi:harddisk",
-            unit_of_measurement=None,
-        ),
-        endpoint="/ugreen/v1/taskmgr/stat/get_all",
-        path="calculated:scale_bytes_per_second:data.volume.series[0].write_rate",
-        nas_part_category="Status",
-    ),
-]
-
-STATIC_BUTTON_ENTITIES: List[UgreenEntity] = [
-    ### System Actions
-    UgreenEntity(
-        description=EntityDescription(
-            key="shutdown",
-            name="Shutdown",
-            icon="mdi:power",
-        ),
-        endpoint="/ugreen/v1/desktop/shutdown",
-        path="",
-        request_method="POST",
-        nas_part_category="",
-    ),
-    UgreenEntity(
-        description=EntityDescription(
-            key="reboot",
-            name="Reboot",
-            icon="mdi:restart",
-        ),
-        endpoint="/ugreen/v1/desktop/reboot",
-        path="",
-        request_method="POST",
-        nas_part_category="",
-    ),
-]
 
 class UgreenApiClient:
     def __init__(
@@ -517,6 +104,7 @@ class UgreenApiClient:
         token: str = "",
         use_https: bool = False,
         verify_ssl: bool = True,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
     ):
         protocol = "https" if use_https else "http"
         self.base_url = f"{protocol}://{ugreen_nas_host}:{ugreen_nas_port}"
@@ -527,13 +115,47 @@ class UgreenApiClient:
         self.verify_ssl = verify_ssl
         self._dynamic_entity_counts = None
         self._dynamic_entity_counts_lock = asyncio.Lock()
+        self._discovery: UgreenDiscovery | None = None
+        self._discovery_lock = asyncio.Lock()
+        # Upper bound for requests in flight against this NAS (see get_many).
+        self._request_semaphore = asyncio.Semaphore(max(1, int(max_concurrent_requests)))
+        # Per-endpoint latency, outcome and size counters (diagnostic sensors, diagnostics download).
+        self.metrics = UgreenApiMetrics()
+        # Pauses all requests while the NAS does not answer (down, asleep); see breaker.py.
+        self.breaker = CircuitBreaker()
+        # Recent GET responses and running GETs, shared by all consumers (see cache.py).
+        self.response_cache = ResponseCache()
+        # Learned request timeout per endpoint: (finished requests when learned, seconds).
+        self._timeouts: dict[str, tuple[int, float]] = {}
+        # Single-flight token refresh: the one login in progress, shared by all callers.
+        self._token_refresh: asyncio.Future | None = None
+        # Token age tracking for proactive renewal (see token_renewal_due).
+        self._token_issued_at: float | None = None
+        self._token_ttl: float = DEFAULT_TOKEN_TTL
+        # Early expiries in a row (token rejected before the learned lifetime) and the longest age among them.
+        self._early_expiries = 0
+        self._early_expiry_age = 0.0
+        self._token_rejected = False
+        self._token_refresh_stats = {
+            "count": 0,
+            "failures": 0,
+            "coalesced": 0,
+            "last_duration": None,
+            "total_duration": 0.0,
+        }
 
 
     ################################################ CORE API FUNCTIONS ########
+    def import_public_key(self, public_key):
+        """Parse the raw key from verify/check (blocking - run in the executor)."""
+        _, RSA = _crypto_modules()
+        return RSA.import_key(public_key)
+
     def encrypt_password(self, password, public_key):
-        from Crypto.Cipher import PKCS1_v1_5
-        from Crypto.PublicKey import RSA
-        public_key = RSA.import_key(public_key)
+        """Encrypt with a raw or already parsed key (blocking - run in the executor)."""
+        PKCS1_v1_5, _ = _crypto_modules()
+        if isinstance(public_key, (bytes, str)):
+            public_key = self.import_public_key(public_key)
         encrypted_password = PKCS1_v1_5.new(public_key).encrypt(password.encode())
         encrypted_base64 = base64.b64encode(encrypted_password).decode('utf-8')
         return encrypted_base64
@@ -562,10 +184,36 @@ class UgreenApiClient:
         pass
 
 
-    async def login(self, session: aiohttp.ClientSession) -> str:
+    async def login(self, session: aiohttp.ClientSession, retry_with_fresh_key: bool = True) -> bool:
+        """Log in with the cached RSA key (one round trip); fetch a fresh key if the NAS rejects it."""
+        loop = asyncio.get_running_loop()
+        cache_key = (self.base_url, self.username)
+        public_key = _PUBLIC_KEY_CACHE.get(cache_key)
+        from_cache = public_key is not None
+        if public_key is None:
+            raw_key = await self._get_public_key(session)
+            if not raw_key:
+                return False
+            try:
+                public_key = await loop.run_in_executor(None, self.import_public_key, raw_key)
+            except Exception as e:
+                _LOGGER.error("[UGREENPRO NAS] Could not parse RSA public key: %s", e)
+                return False
+            _PUBLIC_KEY_CACHE[cache_key] = public_key
+
+        password = await loop.run_in_executor(None, self.encrypt_password, self.password, public_key)
+        if await self._post_login(session, password):
+            return True
+
+        if from_cache and retry_with_fresh_key:
+            _LOGGER.debug("[UGREENPRO NAS] Login with cached RSA key failed, fetching a fresh key")
+            _PUBLIC_KEY_CACHE.pop(cache_key, None)
+            return await self.login(session, retry_with_fresh_key=False)
+        return False
+
+
+    async def _post_login(self, session: aiohttp.ClientSession, password: str) -> bool:
         url = f"{self.base_url}/ugreen/v1/verify/login"
-        key = await self._get_public_key(session)
-        password = self.encrypt_password(self.password, key)
         payload_json = {
             "is_simple": True,
             'keepalive': True,
@@ -589,7 +237,12 @@ class UgreenApiClient:
                     _LOGGER.error("[UGREENPRO NAS] Login succeeded but token not found in response")
                     return False
 
+                if not self._token_rejected:
+                    # The previous token was replaced before the NAS rejected it: any early expiry was a one-off.
+                    self._early_expiries = 0
                 self.token = token
+                self._token_issued_at = time.monotonic()
+                self._token_rejected = False
                 _LOGGER.info("[UGREENPRO NAS] Token received and stored token: %s", token)
                 return True
         except Exception as e:
@@ -599,7 +252,7 @@ class UgreenApiClient:
 
 
     async def authenticate(self, session: aiohttp.ClientSession) -> bool:
-        return await self.login(session)
+        return await self.refresh_token(session)
         """Login and fetch new token."""
         """url = f"{self.token_url}/token?username={self.username}&password={self.password}"
         
@@ -628,32 +281,242 @@ class UgreenApiClient:
             return False"""
 
 
+    async def refresh_token(self, session: aiohttp.ClientSession, stale_token: str | None = None) -> bool:
+        """Log in again; concurrent callers share one login (single flight).
+
+        'stale_token' is the token a request was rejected with (code 1024). If another
+        caller has replaced it meanwhile, the fresh token is reused without a new login.
+        """
+        if stale_token is not None and self.token and self.token != stale_token:
+            self._token_refresh_stats["coalesced"] += 1
+            return True
+        if self.breaker.is_open:
+            _LOGGER.debug("[UGREEN NAS] NAS not responding, token refresh skipped")
+            return False
+        if self._token_refresh is None:
+            self._token_refresh = asyncio.ensure_future(self._do_token_refresh(session))
+        else:
+            self._token_refresh_stats["coalesced"] += 1
+        return await asyncio.shield(self._token_refresh)
+
+
+    async def _do_token_refresh(self, session: aiohttp.ClientSession) -> bool:
+        started = time.monotonic()
+        try:
+            success = await self.login(session)
+        finally:
+            self._token_refresh = None
+        duration = time.monotonic() - started
+        stats = self._token_refresh_stats
+        stats["count"] += 1
+        stats["last_duration"] = duration
+        stats["total_duration"] += duration
+        if not success:
+            stats["failures"] += 1
+        _LOGGER.debug("[UGREEN NAS] Token refresh #%d took %.3fs (success=%s)", stats["count"], duration, success)
+        return success
+
+
+    def token_renewal_due(self) -> bool:
+        """True once the current token has used up most of its (learned) lifetime."""
+        if not self.token or self._token_issued_at is None or self._token_refresh is not None:
+            return False
+        return time.monotonic() - self._token_issued_at >= self._token_ttl * TOKEN_RENEWAL_THRESHOLD
+
+
+    def _note_token_expired(self, token: str) -> None:
+        # The NAS rejected 'token' (code 1024): learn the real lifetime from its age,
+        # so the next renewal happens in the background before it runs out again.
+        # A single early expiry (NAS reboot, admin logout) does not lower the lifetime;
+        # only TOKEN_EARLY_EXPIRY_LIMIT of them in a row do.
+        if token != self.token or self._token_issued_at is None:
+            return
+        self._token_rejected = True
+        age = time.monotonic() - self._token_issued_at
+        if age >= self._token_ttl:
+            # Expired on time (the renewal ran late); the lifetime fits.
+            self._early_expiries = 0
+            return
+        self._early_expiries += 1
+        self._early_expiry_age = max(age, self._early_expiry_age) if self._early_expiries > 1 else age
+        if self._early_expiries < TOKEN_EARLY_EXPIRY_LIMIT:
+            _LOGGER.debug("[UGREEN NAS] Token expired early after %.0fs, keeping assumed lifetime of %.0fs", age, self._token_ttl)
+            return
+        ttl = max(self._early_expiry_age, 60.0)
+        _LOGGER.debug("[UGREEN NAS] Token expired early %d times in a row, lowering assumed lifetime from %.0fs to %.0fs",
+                      self._early_expiries, self._token_ttl, ttl)
+        self._token_ttl = ttl
+        self._early_expiries = 0
+
+
+    def _note_token_accepted(self, token: str) -> None:
+        # The NAS accepted 'token': it lives at least as long as its current age, so a
+        # lifetime learned too short grows back (tokens outlive it when a renewal runs late).
+        if token != self.token or self._token_issued_at is None:
+            return
+        age = time.monotonic() - self._token_issued_at
+        if age > self._token_ttl:
+            _LOGGER.debug("[UGREEN NAS] Token still valid after %.0fs, raising assumed lifetime from %.0fs", age, self._token_ttl)
+            self._token_ttl = age
+
+
+    def get_token_refresh_metrics(self) -> dict[str, Any]:
+        """Return token refresh count, failures, coalesced callers and latency (seconds)."""
+        stats = dict(self._token_refresh_stats)
+        stats["token_ttl"] = self._token_ttl
+        stats["early_expiries"] = self._early_expiries
+        stats["avg_duration"] = stats["total_duration"] / stats["count"] if stats["count"] else None
+        return stats
+
+
+    async def _send(self, session: aiohttp.ClientSession, method: str, endpoint: str, token: str, payload: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Send a single request with the given token and record it in self.metrics."""
+        url = f"{self.base_url}{endpoint}"
+        delimiter = "&" if "?" in url else "?"
+        url += f"{delimiter}token={token}"
+        _LOGGER.debug("[UGREEN NAS] Sending %s request to: %s with payload: %s", method, url, payload)
+
+        # uncomment this to see each 5s/60s API call in the log:
+        # _LOGGER.error("[UGREEN API] Calling endpoint: %s", endpoint)
+
+        ticket = self.breaker.allow_request()
+        if ticket is None:
+            raise NasUnavailableError(f"NAS not responding, request to {endpoint} skipped")
+        async with self._request_semaphore:
+            timeout = self.timeout_for(endpoint)
+            expiry = _REQUEST_EXPIRY.get()
+            if expiry is not None:
+                # Within a tick: time out at its deadline instead of being cancelled there.
+                remaining = expiry - time.monotonic()
+                if remaining <= 0:
+                    # Queued past the deadline, never sent: no verdict on the NAS.
+                    self.breaker.release(ticket)
+                    raise asyncio.TimeoutError
+                timeout = min(timeout, remaining)
+            started = self.metrics.request_started(endpoint)
+            outcome, size = "failure", 0
+            try:
+                try:
+                    async with async_timeout.timeout(timeout):
+                        if method == "POST":
+                            request = session.post(url, json=payload, ssl=self.verify_ssl)
+                        else:
+                            request = session.get(url, ssl=self.verify_ssl)
+                        async with request as resp:
+                            resp.raise_for_status()
+                            size = len(await resp.read())
+                            data = await resp.json()
+                except (aiohttp.ContentTypeError, json.JSONDecodeError, UnicodeDecodeError):
+                    # The NAS answered, just not with JSON (wrong content type or a malformed body).
+                    self.breaker.record_success()
+                    raise
+                except (aiohttp.ClientError, asyncio.TimeoutError):
+                    self.breaker.record_failure(ticket)
+                    raise
+                except BaseException:
+                    # Cancelled before an answer (e.g. tick deadline), or no verdict on the NAS.
+                    self.breaker.release(ticket)
+                    outcome = "cancelled"
+                    raise
+                self.breaker.record_success()
+                code = data.get("code") if isinstance(data, dict) else None
+                if code == 1024:
+                    outcome = "token_expired"
+                elif code in (None, 200):
+                    outcome = "success"
+                    self._note_token_accepted(token)
+                return data
+            finally:
+                self.metrics.request_finished(endpoint, started, outcome, size)
+
+
+    def timeout_for(self, endpoint: str) -> float:
+        """Request timeout (seconds) for an endpoint, learned from its recent latencies.
+
+        Relearned every REQUEST_TIMEOUT_RELEARN finished requests, not on each one.
+        """
+        metrics = self.metrics.endpoint(endpoint)
+        finished = metrics.successes + metrics.failures + metrics.token_expired
+        learned = self._timeouts.get(endpoint)
+        if learned is not None and finished - learned[0] < REQUEST_TIMEOUT_RELEARN:
+            return learned[1]
+        timeout = float(REQUEST_TIMEOUT)
+        if len(metrics.latency_samples) >= REQUEST_TIMEOUT_MIN_SAMPLES:
+            p99 = metrics.latency_percentile(99) or 0.0
+            timeout = min(REQUEST_TIMEOUT, max(REQUEST_TIMEOUT_MIN, p99 * REQUEST_TIMEOUT_P99_FACTOR))
+        self._timeouts[endpoint] = (finished, timeout)
+        return timeout
+
+
+    def learned_timeouts(self) -> dict[str, float]:
+        """Request timeout (seconds) per endpoint as last learned; read-only (see timeout_for)."""
+        return {endpoint: timeout for endpoint, (_, timeout) in self._timeouts.items()}
+
+
     async def get(self, session: aiohttp.ClientSession, endpoint: str) -> dict[str, Any]:
+        """GET through the response cache: consumers within an endpoint's TTL share one response,
+        identical GETs in flight share one request, and a stale response is served while it
+        is refreshed in the background. Stale responses are only served while the NAS answers
+        (breaker closed); otherwise the caller waits for, and sees the failure of, the request.
+        """
+        cache = self.response_cache
+        data, fresh = cache.lookup(endpoint)
+        if data is not None and not fresh and self.breaker.state != CLOSED:
+            data = None
+        if data is not None:
+            self.metrics.cache_hit(endpoint, fresh)
+            if not fresh:
+                cache.start(endpoint, lambda: self._fetch(session, endpoint))
+            return data
+        running, shared = cache.start(endpoint, lambda: self._fetch(session, endpoint))
+        if shared:
+            self.metrics.coalesced(endpoint)
+        running[1] += 1
+        try:
+            data = await asyncio.shield(running[0])
+        except asyncio.CancelledError:
+            # The last caller gave up (e.g. tick deadline): cancel the request too.
+            running[1] -= 1
+            if not running[1]:
+                running[0].cancel()
+            raise
+        running[1] -= 1
+        return data
+
+
+    async def _fetch(self, session: aiohttp.ClientSession, endpoint: str) -> dict[str, Any]:
+        data = await self._get_uncached(session, endpoint)
+        if isinstance(data, dict) and data.get("code") == 200:
+            self.response_cache.store(endpoint, data)
+        else:
+            # Failed refresh: don't keep serving the old response as if the NAS had answered.
+            self.response_cache.discard(endpoint)
+        return data
+
+
+    async def _get_uncached(self, session: aiohttp.ClientSession, endpoint: str) -> dict[str, Any]:
         """Perform GET with retry on token expiration (code 1024)."""
-        async def _do_get() -> dict[str, Any]:
-            url = f"{self.base_url}{endpoint}"
-            delimiter = "&" if "?" in url else "?"
-            url += f"{delimiter}token={self.token}"
-            _LOGGER.debug("[UGREEN NAS] Sending GET request to: %s", url)
-
-            # uncomment this to see each 5s/60s API call in the log:
-            # _LOGGER.error("[UGREEN API] Calling endpoint: %s", endpoint)
-
-            async with async_timeout.timeout(10):
-                async with session.get(url, ssl=self.verify_ssl) as resp:
-                    resp.raise_for_status()
-                    data = await resp.json()
-                    return data
+        async def _do_get(token: str) -> dict[str, Any]:
+            return await self._send(session, "GET", endpoint, token)
         try:
-            data = await _do_get()
+            token = self.token
+            data = await _do_get(token)
             if data.get("code") == 1024:
                 _LOGGER.warning("[UGREEN NAS] Token expired (code 1024), refreshing...")
-                if await self.authenticate(session):
-                    data = await _do_get()
+                self._note_token_expired(token)
+                if await self.refresh_token(session, stale_token=token):
+                    self.metrics.retry(endpoint)
+                    data = await _do_get(self.token)
                 else:
                     _LOGGER.error("[UGREEN NAS] Token refresh failed")
                     return {}
             return data
+        except NasUnavailableError as e:
+            _LOGGER.debug("[UGREEN NAS] %s", e)
+            return {}
+        except asyncio.TimeoutError:
+            _LOGGER.error("[UGREEN NAS] GET request to %s timed out", endpoint)
+            return {}
         except Exception as e:
             _LOGGER.error("[UGREEN NAS] GET request to %s failed: %s", endpoint, e)
             return {}
@@ -661,35 +524,125 @@ class UgreenApiClient:
 
     async def post(self, session: aiohttp.ClientSession, endpoint: str, payload: dict[str, Any] = {}) -> dict[str, Any]:
         """Perform POST request (formerly GET) with optional payload and retry on token expiration (code 1024)."""
-        async def _do_post() -> dict[str, Any]:
-            url = f"{self.base_url}{endpoint}"
-            delimiter = "&" if "?" in url else "?"
-            url += f"{delimiter}token={self.token}"
-            _LOGGER.debug("[UGREEN NAS] Sending POST request to: %s with payload: %s", url, payload)
-            async with async_timeout.timeout(10):
-                async with session.post(url, json=payload, ssl=self.verify_ssl) as resp:
-                    resp.raise_for_status()
-                    data = await resp.json()
-                    return data
+        async def _do_post(token: str) -> dict[str, Any]:
+            return await self._send(session, "POST", endpoint, token, payload)
         try:
-            data = await _do_post()
+            token = self.token
+            data = await _do_post(token)
             if data.get("code") == 1024:
                 _LOGGER.warning("[UGREEN NAS] Token expired (code 1024), refreshing...")
-                if await self.authenticate(session):
-                    data = await _do_post()
+                self._note_token_expired(token)
+                if await self.refresh_token(session, stale_token=token):
+                    self.metrics.retry(endpoint)
+                    data = await _do_post(self.token)
                 else:
                     _LOGGER.error("[UGREEN NAS] Token refresh failed during POST")
                     return {}
             return data
 
+        except NasUnavailableError as e:
+            _LOGGER.warning("[UGREEN NAS] %s", e)
+            return {}
+        except asyncio.TimeoutError:
+            _LOGGER.error("[UGREEN NAS] POST request to %s timed out", endpoint)
+            return {}
         except Exception as e:
             _LOGGER.error("[UGREEN NAS] POST request to %s failed: %s", endpoint, e)
             return {}
 
 
+    async def execute(self, session: aiohttp.ClientSession, endpoint: str, method: str = "GET", payload: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Run a one-off command (e.g. a button press) with the current token.
+
+        Uses the caller's (pooled) session; a new login only happens on code 1024.
+        Commands bypass the response cache: every call is sent to the NAS.
+        """
+        method = str(method or "GET").upper()
+        if method == "POST":
+            return await self.post(session, endpoint, payload or {})
+        if method == "GET":
+            return await self._get_uncached(session, endpoint)
+        _LOGGER.warning("[UGREEN NAS] Unsupported method: %s", method)
+        return {}
+
+
+    async def get_many(
+        self, session: aiohttp.ClientSession, endpoints: Iterable[str], deadline: float | None = None
+    ) -> tuple[dict[str, dict[str, Any]], List[str]]:
+        """Fetch several endpoints concurrently (bounded by max_concurrent_requests).
+
+        Returns the responses keyed by endpoint, plus the endpoints that failed
+        (exception, empty response or a non-200 code). Failed endpoints map to {}
+        unless the NAS returned a body, which is handed over as-is.
+        With a deadline (seconds), requests still running by then time out and count
+        as failed (for the circuit breaker too); the ones that finished in time are
+        returned. Anything left TICK_DEADLINE_GRACE later is cancelled.
+        """
+        endpoints = list(endpoints)
+        expiry = _REQUEST_EXPIRY.set(time.monotonic() + deadline if deadline is not None else None)
+        try:
+            tasks = [asyncio.ensure_future(self.get(session, endpoint)) for endpoint in endpoints]
+        finally:
+            _REQUEST_EXPIRY.reset(expiry)
+        try:
+            async with async_timeout.timeout(deadline + TICK_DEADLINE_GRACE if deadline is not None else None):
+                await asyncio.gather(*tasks, return_exceptions=True)
+        except asyncio.TimeoutError:
+            # gather has cancelled the requests still running.
+            late = [endpoint for endpoint, task in zip(endpoints, tasks) if task.cancelled()]
+            _LOGGER.warning("[UGREEN NAS] Tick deadline of %.1fs reached, cancelled: %s", deadline, ", ".join(late))
+        responses: dict[str, dict[str, Any]] = {}
+        failed: List[str] = []
+        for endpoint, task in zip(endpoints, tasks):
+            if task.cancelled():
+                result: Any = {}
+            else:
+                result = task.exception() or task.result()
+            if isinstance(result, BaseException) or not isinstance(result, dict):
+                _LOGGER.warning("[UGREEN NAS] Failed to fetch '%s': %s", endpoint, result)
+                result = {}
+            if not result or result.get("code", 200) != 200:
+                failed.append(endpoint)
+            responses[endpoint] = result
+        return responses, failed
+
+
     #################################################### COUNT DYNAMIC  ########
 
 
+    async def discover(self, session: aiohttp.ClientSession, refresh: bool = False) -> UgreenDiscovery:
+        """Fetch all DISCOVERY_ENDPOINTS once (concurrently) and keep the snapshot.
+
+        refresh=True discards the current snapshot and entity counts and discovers again.
+        """
+        if self._discovery is not None and not refresh:
+            return self._discovery
+        async with self._discovery_lock:
+            if self._discovery is None or refresh:
+                responses, failed = await self.get_many(session, DISCOVERY_ENDPOINTS)
+                if failed:
+                    _LOGGER.warning("[UGREEN NAS] Discovery incomplete, failed endpoints: %s", ", ".join(failed))
+                self._discovery = UgreenDiscovery(responses, failed)
+                if refresh:
+                    self._dynamic_entity_counts = None
+            return self._discovery
+
+
+    def export_topology(self) -> dict[str, Any]:
+        """Return what the dynamic entity builders need, in a form that can be persisted."""
+        discovery = self._discovery or UgreenDiscovery()
+        return {
+            "responses": {endpoint: discovery.get(endpoint) for endpoint in TOPOLOGY_ENDPOINTS},
+            "counts": self.get_dynamic_entity_counts(),
+        }
+
+
+    def load_topology(self, topology: dict[str, Any]) -> None:
+        """Seed discovery snapshot and entity counts from a persisted topology (no requests)."""
+        self._discovery = UgreenDiscovery(dict(topology.get("responses") or {}))
+        self._dynamic_entity_counts = dict(topology.get("counts") or {})
+
+
     async def count_dynamic_entities(self, session: aiohttp.ClientSession) -> dict:
         if self._dynamic_entity_counts is not None:
             return self._dynamic_entity_counts
@@ -698,9 +651,10 @@ class UgreenApiClient:
                 return self._dynamic_entity_counts
             try:
                 counts: dict[str, Any] = {}
+                discovery = await self.discover(session)
 
                 # 1) RAM / USB / UPS (sysinfo)
-                sysinfo = await self.get(session, "/ugreen/v1/sysinfo/machine/common")
+                sysinfo = discovery.get("/ugreen/v1/sysinfo/machine/common")
                 if isinstance(sysinfo, dict):
                     hw = (sysinfo.get("data", {}) or {}).get("hardware", {}) or {}
                     counts["num_rams"] = len(hw.get("mem", []) or [])
@@ -708,18 +662,18 @@ class UgreenApiClient:
                     counts["has_ups"] = bool(hw.get("ups", []) or [])
 
                 # 2) Storage: Disks / Pools / Volumes
-                disks_resp = await self.get(session, "/ugreen/v2/storage/disk/list")
+                disks_resp = discovery.get("/ugreen/v2/storage/disk/list")
                 if isinstance(disks_resp, dict):
                     counts["num_disks"] = len((disks_resp.get("data", {}) or {}).get("result", []) or [])
 
-                pools_resp = await self.get(session, "/ugreen/v1/storage/pool/list")
+                pools_resp = discovery.get("/ugreen/v1/storage/pool/list")
                 if isinstance(pools_resp, dict):
                     pools = (pools_resp.get("data", {}) or {}).get("result", []) or []
                     counts["num_pools"] = len(pools)
                     counts["num_volumes"] = sum(len(p.get("volumes", []) or []) for p in pools)
 
                 # 3) NICs / Fans / GPU (stat/get_all)
-                stat = await self.get(session, "/ugreen/v1/taskmgr/stat/get_all")
+                stat = discovery.get("/ugreen/v1/taskmgr/stat/get_all")
                 if isinstance(stat, dict) and stat.get("code") == 200:
                     sdata = (stat.get("data", {}) or {})
 
@@ -765,7 +719,7 @@ class UgreenApiClient:
 
         endpoint = "/ugreen/v1/sysinfo/machine/common"
         _LOGGER.debug("[UGREEN NAS] Fetching dynamic mem entities from %s", endpoint)
-        data = await self.get(session, endpoint)
+        data = (await self.discover(session)).get(endpoint)
 
         mem_list = data.get("data", {}).get("hardware", {}).get("mem", []) if isinstance(data, dict) else []
         counts = self.get_dynamic_entity_counts() or {}
@@ -781,7 +735,7 @@ class UgreenApiClient:
 
             entities.extend([
                 UgreenEntity(
-                    description=EntityDescription(
+                    description=UgreenEntityDescription(
                         key=f"{prefix_key}_model",
                         name=f"{prefix_name} Model",
                         icon="mdi:memory",
@@ -790,9 +744,10 @@ class UgreenApiClient:
                     endpoint=endpoint,
                     path=f"data.hardware.mem[{i}].model",
                     nas_part_category="Hardware",
+                    poll_tier="static",
                 ),
                 UgreenEntity(
-                    description=EntityDescription(
+                    description=UgreenEntityDescription(
                         key=f"{prefix_key}_manufacturer",
                         name=f"{prefix_name} Manufacturer",
                         icon="mdi:factory",
@@ -801,9 +756,10 @@ class UgreenApiClient:
                     endpoint=endpoint,
                     path=f"data.hardware.mem[{i}].manufacturer",
                     nas_part_category="Hardware",
+                    poll_tier="static",
                 ),
                 UgreenEntity(
-                    description=EntityDescription(
+                    description=UgreenEntityDescription(
                         key=f"{prefix_key}_size",
                         name=f"{prefix_name} Size",
                         icon="mdi:memory",
@@ -813,9 +769,10 @@ class UgreenApiClient:
                     path=f"data.hardware.mem[{i}].size",
                     decimal_places=0,
                     nas_part_category="Hardware",
+                    poll_tier="static",
                 ),
                 UgreenEntity(
-                    description=EntityDescription(
+                    description=UgreenEntityDescription(
                         key=f"{prefix_key}_speed",
                         name=f"{prefix_name} Speed",
                         icon="mdi:speedometer",
@@ -825,22 +782,24 @@ class UgreenApiClient:
                     path=f"data.hardware.mem[{i}].mhz",
                     decimal_places=0,
                     nas_part_category="Hardware",
+                    poll_tier="static",
                 ),
             ])
 
-        # Total comes as virtual entity (calculated in init.py)
+        # Total comes as virtual entity (calculated in derived.py)
         entities.append(
             UgreenEntity(
-                description=EntityDescription(
+                description=UgreenEntityDescription(
                     key="ram_total_size",
                     name="RAM Total Size",
                     icon="mdi:memory",
                     unit_of_measurement=UnitOfInformation.BYTES,
                 ),
                 endpoint=endpoint,
-                path="calculated:ram_total_size",
+                path="calculated:sum(RAM*_size)",
                 decimal_places=0,
                 nas_part_category="Hardware",
+                poll_tier="static",
             )
         )
 
@@ -852,7 +811,7 @@ class UgreenApiClient:
 
         endpoint = "/ugreen/v1/sysinfo/machine/common"
         _LOGGER.debug("[UGREEN NAS] Fetching dynamic LAN entities from %s", endpoint)
-        data = await self.get(session, endpoint)
+        data = (await self.discover(session)).get(endpoint)
 
         lan_list = (data or {}).get("data", {}).get("hardware", {}).get("net", []) or []
         if not lan_list:
@@ -869,7 +828,7 @@ class UgreenApiClient:
 
             entities.extend([
                 UgreenEntity(
-                    description=EntityDescription(
+                    description=UgreenEntityDescription(
                         key=f"{prefix_key}_model",
                         name=f"{prefix_name} Model",
                         icon="mdi:lan",
@@ -878,9 +837,10 @@ class UgreenApiClient:
                     endpoint=endpoint,
                     path=f"data.hardware.net[{i}].model",
                     nas_part_category="Network",
+                    poll_tier="capacity",
                 ),
                 UgreenEntity(
-                    description=EntityDescription(
+                    description=UgreenEntityDescription(
                         key=f"{prefix_key}_ip",
                         name=f"{prefix_name} IP",
                         icon="mdi:lan",
@@ -889,9 +849,10 @@ class UgreenApiClient:
                     endpoint=endpoint,
                     path=f"data.hardware.net[{i}].ip",
                     nas_part_category="Network",
+                    poll_tier="capacity",
                 ),
                 UgreenEntity(
-                    description=EntityDescription(
+                    description=UgreenEntityDescription(
                         key=f"{prefix_key}_mac",
                         name=f"{prefix_name} MAC",
                         icon="mdi:lan",
@@ -900,9 +861,10 @@ class UgreenApiClient:
                     endpoint=endpoint,
                     path=f"data.hardware.net[{i}].mac",
                     nas_part_category="Network",
+                    poll_tier="capacity",
                 ),
                 UgreenEntity(
-                    description=EntityDescription(
+                    description=UgreenEntityDescription(
                         key=f"{prefix_key}_speed",
                         name=f"{prefix_name} Speed",
                         icon="mdi:speedometer",
@@ -912,9 +874,10 @@ class UgreenApiClient:
                     path=f"data.hardware.net[{i}].speed",
                     decimal_places=0,
                     nas_part_category="Network",
+                    poll_tier="capacity",
                 ),
                 UgreenEntity(
-                    description=EntityDescription(
+                    description=UgreenEntityDescription(
                         key=f"{prefix_key}_duplex",
                         name=f"{prefix_name} Duplex",
                         icon="mdi:lan",
@@ -923,9 +886,10 @@ class UgreenApiClient:
                     endpoint=endpoint,
                     path=f"data.hardware.net[{i}].duplex",
                     nas_part_category="Network",
+                    poll_tier="capacity",
                 ),
                 UgreenEntity(
-                    description=EntityDescription(
+                    description=UgreenEntityDescription(
                         key=f"{prefix_key}_mtu",
                         name=f"{prefix_name} MTU",
                         icon="mdi:lan",
@@ -935,9 +899,10 @@ class UgreenApiClient:
                     path=f"data.hardware.net[{i}].mtu",
                     decimal_places=0,
                     nas_part_category="Network",
+                    poll_tier="capacity",
                 ),
                 UgreenEntity(
-                    description=EntityDescription(
+                    description=UgreenEntityDescription(
                         key=f"{prefix_key}_netmask",
                         name=f"{prefix_name} Netmask",
                         icon="mdi:lan",
@@ -946,6 +911,7 @@ class UgreenApiClient:
                     endpoint=endpoint,
                     path=f"data.hardware.net[{i}].mask",
                     nas_part_category="Network",
+                    poll_tier="capacity",
                 ),
                 
                 # <todo>
@@ -962,7 +928,7 @@ class UgreenApiClient:
 
         endpoint = "/ugreen/v1/sysinfo/machine/common"
         _LOGGER.debug("[UGREEN NAS] Fetching dynamic USB entities from %s", endpoint)
-        data = await self.get(session, endpoint)
+        data = (await self.discover(session)).get(endpoint)
 
         usb_list = (data or {}).get("data", {}).get("hardware", {}).get("usb", []) or []
         if not usb_list:
@@ -979,7 +945,7 @@ class UgreenApiClient:
 
             entities.extend([
                 UgreenEntity(
-                    description=EntityDescription(
+                    description=UgreenEntityDescription(
                         key=f"{prefix_key}_model",
                         name=f"{prefix_name} Model",
                         icon="mdi:usb-port",
@@ -988,9 +954,10 @@ class UgreenApiClient:
                     endpoint=endpoint,
                     path=f"data.hardware.usb[{i}].model",
                     nas_part_category="USB",
+                    poll_tier="capacity",
                 ),
                 UgreenEntity(
-                    description=EntityDescription(
+                    description=UgreenEntityDescription(
                         key=f"{prefix_key}_vendor",
                         name=f"{prefix_name} Vendor",
                         icon="mdi:usb-port",
@@ -999,9 +966,10 @@ class UgreenApiClient:
                     endpoint=endpoint,
                     path=f"data.hardware.usb[{i}].vendor",
                     nas_part_category="USB",
+                    poll_tier="capacity",
                 ),
                 UgreenEntity(
-                    description=EntityDescription(
+                    description=UgreenEntityDescription(
                         key=f"{prefix_key}_type",
                         name=f"{prefix_name} Type",
                         icon="mdi:usb-port",
@@ -1010,6 +978,7 @@ class UgreenApiClient:
                     endpoint=endpoint,
                     path=f"data.hardware.usb[{i}].device_type",
                     nas_part_category="USB",
+                    poll_tier="capacity",
                 ),
             ])
 
@@ -1026,13 +995,13 @@ class UgreenApiClient:
 
         endpoint = "/ugreen/v1/sysinfo/machine/common"
         _LOGGER.debug("[UGREEN NAS] Fetching UPS info from %s", endpoint)
-        data = await self.get(session, endpoint)
+        data = (await self.discover(session)).get(endpoint)
 
         # Exactly one UPS supported: take index 0
         entities: List[UgreenEntity] = []
         entities.extend([
             UgreenEntity(
-                description=EntityDescription(
+                description=UgreenEntityDescription(
                     key="ups_model",
                     name="UPS Model",
                     icon="mdi:power-plug-battery",
@@ -1041,9 +1010,10 @@ class UgreenApiClient:
                 endpoint=endpoint,
                 path="data.hardware.ups[0].model",
                 nas_part_category="Hardware",
+                poll_tier="static",
             ),
             UgreenEntity(
-                description=EntityDescription(
+                description=UgreenEntityDescription(
                     key="ups_vendor",
                     name="UPS Vendor",
                     icon="mdi:factory",
@@ -1052,9 +1022,10 @@ class UgreenApiClient:
                 endpoint=endpoint,
                 path="data.hardware.ups[0].vendor",
                 nas_part_category="Hardware",
+                poll_tier="static",
             ),
             UgreenEntity(
-                description=EntityDescription(
+                description=UgreenEntityDescription(
                     key="ups_power_free",
                     name="UPS Power Remaining",
                     icon="mdi:power-plug-battery",
@@ -1063,6 +1034,7 @@ class UgreenApiClient:
                 endpoint=endpoint,
                 path="data.hardware.ups[0].power_free",
                 nas_part_category="Hardware",
+                poll_tier="health",
             ),
         ])
 
@@ -1073,7 +1045,7 @@ class UgreenApiClient:
         """Fetch and build dynamic storage entities."""
         endpoint = "/ugreen/v1/storage/pool/list"
         _LOGGER.debug("[UGREEN NAS] Fetching dynamic storage entities from %s", endpoint)
-        data = await self.get(session, endpoint)
+        data = (await self.discover(session)).get(endpoint)
 
         if not data:
             _LOGGER.warning("[UGREEN NAS] No data received from %s", endpoint)
@@ -1085,6 +1057,7 @@ class UgreenApiClient:
             return []
 
         entities: List[UgreenEntity] = []
+        disks_by_dev_name: dict[str, tuple[int, dict]] | None = None
 
         try:
             for pool_index, pool in enumerate(results):
@@ -1094,7 +1067,7 @@ class UgreenApiClient:
 
                 entities.extend([
                     UgreenEntity(
-                        description=EntityDescription(
+                        description=UgreenEntityDescription(
                             key=f"{prefix_pool_key}_name",
                             name=f"{prefix_pool_name} Name",
                             icon="mdi:chip",
@@ -1103,9 +1076,10 @@ class UgreenApiClient:
                         endpoint=endpoint,
                         path=f"data.result[{pool_index}].name",
                         nas_part_category="Pools",
+                        poll_tier="capacity",
                     ),
                     UgreenEntity(
-                        description=EntityDescription(
+                        description=UgreenEntityDescription(
                             key=f"{prefix_pool_key}_label",
                             name=f"{prefix_pool_name} Label",
                             icon="mdi:label",
@@ -1114,9 +1088,10 @@ class UgreenApiClient:
                         endpoint=endpoint,
                         path=f"data.result[{pool_index}].label",
                         nas_part_category="Pools",
+                        poll_tier="capacity",
                     ),
                     UgreenEntity(
-                        description=EntityDescription(
+                        description=UgreenEntityDescription(
                             key=f"{prefix_pool_key}_level",
                             name=f"{prefix_pool_name} Level",
                             icon="mdi:format-list-bulleted-type",
@@ -1125,9 +1100,10 @@ class UgreenApiClient:
                         endpoint=endpoint,
                         path=f"data.result[{pool_index}].level",
                         nas_part_category="Pools",
+                        poll_tier="capacity",
                     ),
                     UgreenEntity(
-                        description=EntityDescription(
+                        description=UgreenEntityDescription(
                             key=f"{prefix_pool_key}_status",
                             name=f"{prefix_pool_name} Status",
                             icon="mdi:check-circle-outline",
@@ -1136,9 +1112,10 @@ class UgreenApiClient:
                         endpoint=endpoint,
                         path=f"data.result[{pool_index}].status",
                         nas_part_category="Pools",
+                        poll_tier="health",
                     ),
                     UgreenEntity(
-                        description=EntityDescription(
+                        description=UgreenEntityDescription(
                             key=f"{prefix_pool_key}_total",
                             name=f"{prefix_pool_name} Total Size",
                             icon="mdi:database",
@@ -1147,9 +1124,10 @@ class UgreenApiClient:
                         endpoint=endpoint,
                         path=f"data.result[{pool_index}].total",
                         nas_part_category="Pools",
+                        poll_tier="capacity",
                     ),
                     UgreenEntity(
-                        description=EntityDescription(
+                        description=UgreenEntityDescription(
                             key=f"{prefix_pool_key}_used",
                             name=f"{prefix_pool_name} Used Size",
                             icon="mdi:database-check",
@@ -1158,9 +1136,10 @@ class UgreenApiClient:
                         endpoint=endpoint,
                         path=f"data.result[{pool_index}].used",
                         nas_part_category="Pools",
+                        poll_tier="capacity",
                     ),
                     UgreenEntity(
-                        description=EntityDescription(
+                        description=UgreenEntityDescription(
                             key=f"{prefix_pool_key}_free",
                             name=f"{prefix_pool_name} Free Size",
                             icon="mdi:database-remove",
@@ -1169,9 +1148,10 @@ class UgreenApiClient:
                         endpoint=endpoint,
                         path=f"data.result[{pool_index}].free",
                         nas_part_category="Pools",
+                        poll_tier="capacity",
                     ),
                     UgreenEntity(
-                        description=EntityDescription(
+                        description=UgreenEntityDescription(
                             key=f"{prefix_pool_key}_available",
                             name=f"{prefix_pool_name} Available Size",
                             icon="mdi:database-plus",
@@ -1180,9 +1160,22 @@ class UgreenApiClient:
                         endpoint=endpoint,
                         path=f"data.result[{pool_index}].available",
                         nas_part_category="Pools",
+                        poll_tier="capacity",
+                    ),
+                    UgreenEntity(
+                        description=UgreenEntityDescription(
+                            key=f"{prefix_pool_key}_free_percent",
+                            name=f"{prefix_pool_name} Free Space",
+                            icon="mdi:database-remove",
+                            unit_of_measurement=PERCENTAGE,
+                        ),
+                        endpoint=endpoint,
+                        path=f"calculated:percent({prefix_pool_key}_free, {prefix_pool_key}_total)",
+                        nas_part_category="Pools",
+                        poll_tier="capacity",
                     ),
                     UgreenEntity(
-                        description=EntityDescription(
+                        description=UgreenEntityDescription(
                             key=f"{prefix_pool_key}_disk_count",
                             name=f"{prefix_pool_name} Disk Count",
                             icon="mdi:harddisk",
@@ -1191,20 +1184,21 @@ class UgreenApiClient:
                         endpoint=endpoint,
                         path=f"data.result[{pool_index}].total_disk_num",
                         nas_part_category="Pools",
+                        poll_tier="capacity",
                     ),
                 ])
 
-                # Disk-Details über globale Diskliste (nur Cache pflegen, keine Zähler setzen)
-                if not hasattr(self, "_ugreen_disks_cache"):
-                    disk_response = await self.get(session, "/ugreen/v2/storage/disk/list")
-                    disks_global = (disk_response or {}).get("data", {}).get("result", []) if isinstance(disk_response, dict) else []
-                    self._ugreen_disks_cache = {
+                # Disk-Details über globale Diskliste (aus dem Discovery-Snapshot, keine Zähler setzen)
+                if disks_by_dev_name is None:
+                    disk_response = (await self.discover(session)).get("/ugreen/v2/storage/disk/list")
+                    disks_global = disk_response.get("data", {}).get("result", []) or []
+                    disks_by_dev_name = {
                         d.get("dev_name"): (idx, d) for idx, d in enumerate(disks_global)
                     }
 
                 for pool_disk_index, disk_ref in enumerate(pool.get("disks", []) or []):
                     dev_name = disk_ref.get("dev_name")
-                    match = self._ugreen_disks_cache.get(dev_name)
+                    match = disks_by_dev_name.get(dev_name)
                     if match is None:
                         _LOGGER.warning("[UGREEN NAS] Disk with dev_name '%s' not found in global disk list, skipping.", dev_name)
                         continue
@@ -1216,7 +1210,7 @@ class UgreenApiClient:
 
                     entities.extend([
                         UgreenEntity(
-                            description=EntityDescription(
+                            description=UgreenEntityDescription(
                                 key=f"{prefix_disk_key}_model",
                                 name=f"{prefix_disk_name} Model",
                                 icon="mdi:chip",
@@ -1225,9 +1219,10 @@ class UgreenApiClient:
                             endpoint=endpoint_disk,
                             path=f"data.result[{disk_index}].model",
                             nas_part_category="Disks",
+                            poll_tier="static",
                         ),
                         UgreenEntity(
-                            description=EntityDescription(
+                            description=UgreenEntityDescription(
                                 key=f"{prefix_disk_key}_serial",
                                 name=f"{prefix_disk_name} Serial Number",
                                 icon="mdi:identifier",
@@ -1236,9 +1231,10 @@ class UgreenApiClient:
                             endpoint=endpoint_disk,
                             path=f"data.result[{disk_index}].serial",
                             nas_part_category="Disks",
+                            poll_tier="static",
                         ),
                         UgreenEntity(
-                            description=EntityDescription(
+                            description=UgreenEntityDescription(
                                 key=f"{prefix_disk_key}_size",
                                 name=f"{prefix_disk_name} Size",
                                 icon="mdi:database",
@@ -1247,9 +1243,10 @@ class UgreenApiClient:
                             endpoint=endpoint_disk,
                             path=f"data.result[{disk_index}].size",
                             nas_part_category="Disks",
+                            poll_tier="static",
                         ),
                         UgreenEntity(
-                            description=EntityDescription(
+                            description=UgreenEntityDescription(
                                 key=f"{prefix_disk_key}_name",
                                 name=f"{prefix_disk_name} Name",
                                 icon="mdi:harddisk",
@@ -1258,9 +1255,10 @@ class UgreenApiClient:
                             endpoint=endpoint_disk,
                             path=f"data.result[{disk_index}].name",
                             nas_part_category="Disks",
+                            poll_tier="capacity",
                         ),
                         UgreenEntity(
-                            description=EntityDescription(
+                            description=UgreenEntityDescription(
                                 key=f"{prefix_disk_key}_dev_name",
                                 name=f"{prefix_disk_name} Device Name",
                                 icon="mdi:console",
@@ -1269,9 +1267,10 @@ class UgreenApiClient:
                             endpoint=endpoint_disk,
                             path=f"data.result[{disk_index}].dev_name",
                             nas_part_category="Disks",
+                            poll_tier="capacity",
                         ),
                         UgreenEntity(
-                            description=EntityDescription(
+                            description=UgreenEntityDescription(
                                 key=f"{prefix_disk_key}_slot",
                                 name=f"{prefix_disk_name} Slot",
                                 icon="mdi:server-network",
@@ -1280,9 +1279,10 @@ class UgreenApiClient:
                             endpoint=endpoint_disk,
                             path=f"data.result[{disk_index}].slot",
                             nas_part_category="Disks",
+                            poll_tier="capacity",
                         ),
                         UgreenEntity(
-                            description=EntityDescription(
+                            description=UgreenEntityDescription(
                                 key=f"{prefix_disk_key}_type",
                                 name=f"{prefix_disk_name} Type",
                                 icon="mdi:harddisk",
@@ -1291,9 +1291,10 @@ class UgreenApiClient:
                             endpoint=endpoint_disk,
                             path=f"data.result[{disk_index}].type",
                             nas_part_category="Disks",
+                            poll_tier="static",
                         ),
                         UgreenEntity(
-                            description=EntityDescription(
+                            description=UgreenEntityDescription(
                                 key=f"{prefix_disk_key}_interface_type",
                                 name=f"{prefix_disk_name} Interface Type",
                                 icon="mdi:harddisk",
@@ -1302,9 +1303,10 @@ class UgreenApiClient:
                             endpoint=endpoint_disk,
                             path=f"data.result[{disk_index}].interface_type",
                             nas_part_category="Disks",
+                            poll_tier="static",
                         ),
                         UgreenEntity(
-                            description=EntityDescription(
+                            description=UgreenEntityDescription(
                                 key=f"{prefix_disk_key}_label",
                                 name=f"{prefix_disk_name} Label",
                                 icon="mdi:label",
@@ -1313,9 +1315,10 @@ class UgreenApiClient:
                             endpoint=endpoint_disk,
                             path=f"data.result[{disk_index}].label",
                             nas_part_category="Disks",
+                            poll_tier="capacity",
                         ),
                         UgreenEntity(
-                            description=EntityDescription(
+                            description=UgreenEntityDescription(
                                 key=f"{prefix_disk_key}_used_for",
                                 name=f"{prefix_disk_name} Used For",
                                 icon="mdi:database-marker",
@@ -1324,9 +1327,10 @@ class UgreenApiClient:
                             endpoint=endpoint_disk,
                             path=f"data.result[{disk_index}].used_for",
                             nas_part_category="Disks",
+                            poll_tier="capacity",
                         ),
                         UgreenEntity(
-                            description=EntityDescription(
+                            description=UgreenEntityDescription(
                                 key=f"{prefix_disk_key}_status",
                                 name=f"{prefix_disk_name} Status",
                                 icon="mdi:check-circle-outline",
@@ -1335,9 +1339,10 @@ class UgreenApiClient:
                             endpoint=endpoint_disk,
                             path=f"data.result[{disk_index}].status",
                             nas_part_category="Disks",
+                            poll_tier="health",
                         ),
                         UgreenEntity(
-                            description=EntityDescription(
+                            description=UgreenEntityDescription(
                                 key=f"{prefix_disk_key}_temperature",
                                 name=f"{prefix_disk_name} Temperature",
                                 icon="mdi:thermometer",
@@ -1346,9 +1351,11 @@ class UgreenApiClient:
                             endpoint=endpoint_disk,
                             path=f"data.result[{disk_index}].temperature",
                             nas_part_category="Disks",
+                            poll_tier="health",
+                            deadband=DEADBAND_TEMPERATURE,
                         ),
                         UgreenEntity(
-                            description=EntityDescription(
+                            description=UgreenEntityDescription(
                                 key=f"{prefix_disk_key}_power_on_hours",
                                 name=f"{prefix_disk_name} Power-On Hours",
                                 icon="mdi:clock-outline",
@@ -1357,9 +1364,10 @@ class UgreenApiClient:
                             endpoint=endpoint_disk,
                             path=f"data.result[{disk_index}].power_on_hours",
                             nas_part_category="Disks",
+                            poll_tier="health",
                         ),
                         UgreenEntity(
-                            description=EntityDescription(
+                            description=UgreenEntityDescription(
                                 key=f"{prefix_disk_key}_brand",
                                 name=f"{prefix_disk_name} Brand",
                                 icon="mdi:tag",
@@ -1368,6 +1376,7 @@ class UgreenApiClient:
                             endpoint=endpoint_disk,
                             path=f"data.result[{disk_index}].brand",
                             nas_part_category="Disks",
+                            poll_tier="static",
                         ),
                     ])
 
@@ -1378,7 +1387,7 @@ class UgreenApiClient:
 
                     entities.extend([
                         UgreenEntity(
-                            description=EntityDescription(
+                            description=UgreenEntityDescription(
                                 key=f"{prefix_volume_key}_name",
                                 name=f"{prefix_volume_name} Name",
                                 icon="mdi:label",
@@ -1387,9 +1396,10 @@ class UgreenApiClient:
                             endpoint=endpoint,
                             path=f"data.result[{pool_index}].volumes[{volume_index}].name",
                             nas_part_category="Volumes",
+                            poll_tier="capacity",
                         ),
                         UgreenEntity(
-                            description=EntityDescription(
+                            description=UgreenEntityDescription(
                                 key=f"{prefix_volume_key}_label",
                                 name=f"{prefix_volume_name} Label",
                                 icon="mdi:label-outline",
@@ -1398,9 +1408,10 @@ class UgreenApiClient:
                             endpoint=endpoint,
                             path=f"data.result[{pool_index}].volumes[{volume_index}].label",
                             nas_part_category="Volumes",
+                            poll_tier="capacity",
                         ),
                         UgreenEntity(
-                            description=EntityDescription(
+                            description=UgreenEntityDescription(
                                 key=f"{prefix_volume_key}_poolname",
                                 name=f"{prefix_volume_name} Pool Name",
                                 icon="mdi:database",
@@ -1409,9 +1420,10 @@ class UgreenApiClient:
                             endpoint=endpoint,
                             path=f"data.result[{pool_index}].volumes[{volume_index}].poolname",
                             nas_part_category="Volumes",
+                            poll_tier="capacity",
                         ),
                         UgreenEntity(
-                            description=EntityDescription(
+                            description=UgreenEntityDescription(
                                 key=f"{prefix_volume_key}_total",
                                 name=f"{prefix_volume_name} Total Size",
                                 icon="mdi:database",
@@ -1420,9 +1432,10 @@ class UgreenApiClient:
                             endpoint=endpoint,
                             path=f"data.result[{pool_index}].volumes[{volume_index}].total",
                             nas_part_category="Volumes",
+                            poll_tier="capacity",
                         ),
                         UgreenEntity(
-                            description=EntityDescription(
+                            description=UgreenEntityDescription(
                                 key=f"{prefix_volume_key}_used",
                                 name=f"{prefix_volume_name} Used Size",
                                 icon="mdi:database-check",
@@ -1431,9 +1444,10 @@ class UgreenApiClient:
                             endpoint=endpoint,
                             path=f"data.result[{pool_index}].volumes[{volume_index}].used",
                             nas_part_category="Volumes",
+                            poll_tier="capacity",
                         ),
                         UgreenEntity(
-                            description=EntityDescription(
+                            description=UgreenEntityDescription(
                                 key=f"{prefix_volume_key}_available",
                                 name=f"{prefix_volume_name} Available Size",
                                 icon="mdi:database-plus",
@@ -1442,9 +1456,22 @@ class UgreenApiClient:
                             endpoint=endpoint,
                             path=f"data.result[{pool_index}].volumes[{volume_index}].available",
                             nas_part_category="Volumes",
+                            poll_tier="capacity",
+                        ),
+                        UgreenEntity(
+                            description=UgreenEntityDescription(
+                                key=f"{prefix_volume_key}_used_percent",
+                                name=f"{prefix_volume_name} Used Space",
+                                icon="mdi:database-check",
+                                unit_of_measurement=PERCENTAGE,
+                            ),
+                            endpoint=endpoint,
+                            path=f"calculated:percent({prefix_volume_key}_used, {prefix_volume_key}_total)",
+                            nas_part_category="Volumes",
+                            poll_tier="capacity",
                         ),
                         UgreenEntity(
-                            description=EntityDescription(
+                            description=UgreenEntityDescription(
                                 key=f"{prefix_volume_key}_hascache",
                                 name=f"{prefix_volume_name} Has Cache",
                                 icon="mdi:cached",
@@ -1453,9 +1480,10 @@ class UgreenApiClient:
                             endpoint=endpoint,
                             path=f"data.result[{pool_index}].volumes[{volume_index}].hascache",
                             nas_part_category="Volumes",
+                            poll_tier="capacity",
                         ),
                         UgreenEntity(
-                            description=EntityDescription(
+                            description=UgreenEntityDescription(
                                 key=f"{prefix_volume_key}_filesystem",
                                 name=f"{prefix_volume_name} Filesystem",
                                 icon="mdi:file-cog",
@@ -1464,9 +1492,10 @@ class UgreenApiClient:
                             endpoint=endpoint,
                             path=f"data.result[{pool_index}].volumes[{volume_index}].filesystem",
                             nas_part_category="Volumes",
+                            poll_tier="capacity",
                         ),
                         UgreenEntity(
-                            description=EntityDescription(
+                            description=UgreenEntityDescription(
                                 key=f"{prefix_volume_key}_health",
                                 name=f"{prefix_volume_name} Health",
                                 icon="mdi:heart-pulse",
@@ -1475,9 +1504,10 @@ class UgreenApiClient:
                             endpoint=endpoint,
                             path=f"data.result[{pool_index}].volumes[{volume_index}].health",
                             nas_part_category="Volumes",
+                            poll_tier="health",
                         ),
                         UgreenEntity(
-                            description=EntityDescription(
+                            description=UgreenEntityDescription(
                                 key=f"{prefix_volume_key}_status",
                                 name=f"{prefix_volume_name} Status",
                                 icon="mdi:checkbox-marked-circle-outline",
@@ -1486,6 +1516,7 @@ class UgreenApiClient:
                             endpoint=endpoint,
                             path=f"data.result[{pool_index}].volumes[{volume_index}].status",
                             nas_part_category="Volumes",
+                            poll_tier="health",
                         ),
                     ])
         except Exception as e:
@@ -1505,7 +1536,7 @@ class UgreenApiClient:
         if counts.get("has_cpu_fan"):
             label = "CPU Fan"
             entities.append(UgreenEntity(
-                description=EntityDescription(
+                description=UgreenEntityDescription(
                     key="cpu_fan_speed",
                     name=label,
                     icon="mdi:fan",
@@ -1514,9 +1545,10 @@ class UgreenApiClient:
                 endpoint="/ugreen/v1/taskmgr/stat/get_all",
                 path="data.overview.cpu_fan[0].speed",
                 nas_part_category="Status",
+                deadband=DEADBAND_FAN_SPEED,
             ))
             entities.append(UgreenEntity(
-                description=EntityDescription(
+                description=UgreenEntityDescription(
                     key="cpu_fan_status",
                     name=f"{label} Status",
                     icon="mdi:fan-alert",
@@ -1534,7 +1566,7 @@ class UgreenApiClient:
             label  = "Device Fan" if single else f"Device Fan {i+1}"
             key    = "device_fan_speed" if single else f"device_fan{i+1}_speed"
             entities.append(UgreenEntity(
-                description=EntityDescription(
+                description=UgreenEntityDescription(
                     key=key,
                     name=label,
                     icon="mdi:fan",
@@ -1543,10 +1575,11 @@ class UgreenApiClient:
                 endpoint="/ugreen/v1/taskmgr/stat/get_all",
                 path=f"data.overview.device_fan[{i}].speed",
                 nas_part_category="Status",
+                deadband=DEADBAND_FAN_SPEED,
             ))
             status_key = "device_fan_status" if single else f"device_fan{i+1}_status"
             entities.append(UgreenEntity(
-                description=EntityDescription(
+                description=UgreenEntityDescription(
                     key=status_key,
                     name=f"{label} Status",
                     icon="mdi:fan-alert",
@@ -1559,7 +1592,7 @@ class UgreenApiClient:
 
         # Overall fan status
         entities.append(UgreenEntity(
-            description=EntityDescription(
+            description=UgreenEntityDescription(
                 key="fan_status_overall",
                 name="Fan Status (overall)",
                 icon="mdi:fan-alert",
@@ -1568,6 +1601,7 @@ class UgreenApiClient:
             endpoint="/ugreen/v1/desktop/components/data?id=desktop.component.TemperatureMonitoring",
             path="data.fan_status",
             nas_part_category="Status",
+            poll_tier="health",
         ))
 
         return entities
@@ -1583,7 +1617,7 @@ class UgreenApiClient:
             prefix = f"lan{idx}"
             entities.extend([
                 UgreenEntity(
-                    description=EntityDescription(
+                    description=UgreenEntityDescription(
                         key=f"{prefix}_upload_raw",
                         name=f"{label} Upload (raw)",
                         icon="mdi:upload-network",
@@ -1593,9 +1627,10 @@ class UgreenApiClient:
                     path=f"data.net.series[{idx}].send_rate",
                     decimal_places=0,
                     nas_part_category="Status",
+                    deadband=DEADBAND_DATA_RATE,
                 ),
                 UgreenEntity(
-                    description=EntityDescription(
+                    description=UgreenEntityDescription(
                         key=f"{prefix}_upload",
                         name=f"{label} Upload",
                         icon="mdi:upload-network",
@@ -1607,7 +1642,7 @@ class UgreenApiClient:
                     nas_part_category="Status",
                 ),
                 UgreenEntity(
-                    description=EntityDescription(
+                    description=UgreenEntityDescription(
                         key=f"{prefix}_download_raw",
                         name=f"{label} Download (raw)",
                         icon="mdi:download-network",
@@ -1617,9 +1652,10 @@ class UgreenApiClient:
                     path=f"data.net.series[{idx}].recv_rate",
                     decimal_places=0,
                     nas_part_category="Status",
+                    deadband=DEADBAND_DATA_RATE,
                 ),
                 UgreenEntity(
-                    description=EntityDescription(
+                    description=UgreenEntityDescription(
                         key=f"{prefix}_download",
                         name=f"{label} Download",
                         icon="mdi:download-network",
@@ -1646,7 +1682,7 @@ class UgreenApiClient:
 
             entities.extend([
                 UgreenEntity(
-                    description=EntityDescription(
+                    description=UgreenEntityDescription(
                         key=f"{prefix}_read_rate_raw",
                         name=f"Disk {idx} Read Rate (raw)",
                         icon="mdi:download",
@@ -1658,7 +1694,7 @@ class UgreenApiClient:
                     nas_part_category="Status",
                 ),
                 UgreenEntity(
-                    description=EntityDescription(
+                    description=UgreenEntityDescription(
                         key=f"{prefix}_read_rate",
                         name=f"Disk {idx} Read Rate",
                         icon="mdi:download",
@@ -1670,7 +1706,7 @@ class UgreenApiClient:
                     nas_part_category="Status",
                 ),
                 UgreenEntity(
-                    description=EntityDescription(
+                    description=UgreenEntityDescription(
                         key=f"{prefix}_write_rate_raw",
                         name=f"Disk {idx} Write Rate (raw)",
                         icon="mdi:upload",
@@ -1682,7 +1718,7 @@ class UgreenApiClient:
                     nas_part_category="Status",
                 ),
                 UgreenEntity(
-                    description=EntityDescription(
+                    description=UgreenEntityDescription(
                         key=f"{prefix}_write_rate",
                         name=f"Disk {idx} Write Rate",
                         icon="mdi:upload",
@@ -1694,7 +1730,7 @@ class UgreenApiClient:
                     nas_part_category="Status",
                 ),
                 UgreenEntity(
-                    description=EntityDescription(
+                    description=UgreenEntityDescription(
                         key=f"{prefix}_temperature",
                         name=f"Disk {idx} Temperature",
                         icon="mdi:thermometer",
@@ -1704,7 +1740,24 @@ class UgreenApiClient:
                     path=f"data.disk.series[{idx}].temperature",
                     decimal_places=1,
                     nas_part_category="Status",
+                    deadband=DEADBAND_TEMPERATURE,
                 ),
             ])
 
+        if n_disks:
+            entities.append(
+                UgreenEntity(
+                    description=UgreenEntityDescription(
+                        key="disks_total_throughput",
+                        name="Disks Total Throughput",
+                        icon="mdi:swap-vertical",
+                        unit_of_measurement=None,  # skaliert (human readable)
+                    ),
+                    endpoint="/ugreen/v1/taskmgr/stat/get_all",
+                    path="calculated:scale_bytes_per_second(sum(disk*_read_rate_raw, disk*_write_rate_raw))",
+                    decimal_places=0,
+                    nas_part_category="Status",
+                )
+            )
+
         return entities
@@ -0,0 +1,124 @@
+import logging
+import time
+from typing import Any
+
+from .const import CIRCUIT_BACKOFF_MAX, CIRCUIT_BACKOFF_MIN, CIRCUIT_FAILURE_THRESHOLD
+
+_LOGGER = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# A probe that has not reported back after this long (s) is considered lost; the next request probes.
+PROBE_LEASE = 30.0
+
+
+class NasUnavailableError(Exception):
+    """Raised instead of sending a request while the circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """Stops sending requests to a NAS that stopped answering (down, asleep, unreachable).
+
+    Closed: requests pass. After 'threshold' transport failures in a row (timeouts,
+    connection or HTTP errors) it opens and requests fail at once for 'backoff' seconds.
+    Then one probe request is let through (half-open): if it succeeds the breaker closes,
+    if it fails it opens again with the backoff doubled, up to 'maximum'.
+    allow_request hands out a ticket per request; only the probe's ticket can end the probe.
+    """
+
+    def __init__(
+        self,
+        threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        backoff: float = CIRCUIT_BACKOFF_MIN,
+        maximum: float = CIRCUIT_BACKOFF_MAX,
+    ) -> None:
+        self.threshold = max(1, int(threshold))
+        self.minimum_backoff = float(backoff)
+        self.maximum_backoff = max(float(maximum), self.minimum_backoff)
+        self.backoff = self.minimum_backoff
+        self.failures = 0
+        self._opened_at: float | None = None
+        self._probe_started: float | None = None
+        self._probe: int | None = None
+        self._stats = {"opened": 0, "rejected": 0, "probes": 0}
+
+    @property
+    def _probing(self) -> bool:
+        return self._probe_started is not None and time.monotonic() - self._probe_started < PROBE_LEASE
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return CLOSED
+        if self._probing or time.monotonic() - self._opened_at >= self.backoff:
+            return HALF_OPEN
+        return OPEN
+
+    @property
+    def is_open(self) -> bool:
+        """True while requests are refused without a probe being due."""
+        return self.state == OPEN
+
+    def allow_request(self) -> int | None:
+        """Ticket for a request that may go out now (0, or the probe number), None if it may not.
+
+        In half-open state only the first caller gets through, as the probe.
+        """
+        state = self.state
+        if state == CLOSED:
+            return 0
+        if state == HALF_OPEN and not self._probing:
+            self._probe_started = time.monotonic()
+            self._stats["probes"] += 1
+            self._probe = self._stats["probes"]
+            _LOGGER.debug("[UGREEN NAS] Probing the NAS after %.0fs pause.", self.backoff)
+            return self._probe
+        self._stats["rejected"] += 1
+        return None
+
+    def record_success(self) -> None:
+        if self._opened_at is not None:
+            _LOGGER.info("[UGREEN NAS] NAS reachable again, resuming requests.")
+        self.failures = 0
+        self.backoff = self.minimum_backoff
+        self._opened_at = None
+        self._end_probe()
+
+    def record_failure(self, ticket: int = 0) -> None:
+        self.failures += 1
+        if self._probing and ticket == self._probe:
+            # The probe failed: stay open, wait longer before the next one.
+            self.backoff = min(self.backoff * 2, self.maximum_backoff)
+            self._open()
+        elif self._opened_at is None and self.failures >= self.threshold:
+            self._open()
+            _LOGGER.warning("[UGREEN NAS] NAS not responding (%d failed requests in a row), pausing requests for %.0fs.",
+                            self.failures, self.backoff)
+
+    def release(self, ticket: int = 0) -> None:
+        """A request let through ended without an answer (cancelled); if it was the probe, let the next one probe."""
+        if ticket and ticket == self._probe:
+            self._end_probe()
+
+    def _end_probe(self) -> None:
+        self._probe_started = None
+        self._probe = None
+
+    def _open(self) -> None:
+        self._opened_at = time.monotonic()
+        self._end_probe()
+        self._stats["opened"] += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        retry_in = None
+        if self._opened_at is not None:
+            retry_in = max(0.0, self._opened_at + self.backoff - time.monotonic())
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "backoff": self.backoff,
+            "retry_in": retry_in,
+            **self._stats,
+        }
@@ -1,6 +1,7 @@
 import logging
-import aiohttp
+from typing import TYPE_CHECKING
 from homeassistant.components.button import ButtonEntity
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import CoordinatorEntity, DataUpdateCoordinator
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
@@ -8,7 +9,9 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .device_info import build_device_info
 from .const import DOMAIN
-from .api import UgreenApiClient, UgreenEntity
+
+if TYPE_CHECKING:
+    from .api import UgreenApiClient, UgreenEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -19,7 +22,7 @@ async def async_setup_entry(
 ) -> None:
     """Set up UGREEN NAS buttons based on a config entry."""
     coordinator = hass.data[DOMAIN][entry.entry_id]["config_coordinator"]
-    entities: list[UgreenEntity] = hass.data[DOMAIN][entry.entry_id]["button_entities"]
+    entities: 'list[UgreenEntity]' = hass.data[DOMAIN][entry.entry_id]["button_entities"]
     api = hass.data[DOMAIN][entry.entry_id]["api"]
 
     nas_model = hass.data[DOMAIN][entry.entry_id].get("nas_model")
@@ -34,7 +37,7 @@ async def async_setup_entry(
 class UgreenNasButton(CoordinatorEntity, ButtonEntity): # type: ignore
     """Representation of a UGREEN NAS button."""
 
-    def __init__(self, entry_id: str, coordinator: DataUpdateCoordinator, endpoint: UgreenEntity, api: UgreenApiClient, nas_model: 'str | None' = None) -> None:
+    def __init__(self, entry_id: str, coordinator: DataUpdateCoordinator, endpoint: 'UgreenEntity', api: 'UgreenApiClient', nas_model: 'str | None' = None) -> None:
         super().__init__(coordinator)
         self._entry_id = entry_id
         self._endpoint = endpoint
@@ -51,18 +54,14 @@ class UgreenNasButton(CoordinatorEntity, ButtonEntity): # type: ignore
     async def async_press(self) -> None: # type: ignore
         """Perform the button action."""
         try:
-            async with aiohttp.ClientSession() as session:
-                await self._api.authenticate(session)
-
-                method = str(self._endpoint.request_method or "GET").upper()
-                path = self._endpoint.endpoint
-        
-                if method == "POST":
-                    await self._api.post(session, path)
-                elif method == "GET":
-                    await self._api.get(session, path)
-                else:
-                    _LOGGER.warning("Unsupported method: %s", method)
+            # Shared HA session and current token: a press is a single request
+            # (plus a login only if the token turns out to be expired).
+            session = async_get_clientsession(self.hass)
+            await self._api.execute(
+                session,
+                self._endpoint.endpoint,
+                self._endpoint.request_method or "GET",
+            )
 
         except Exception as e:
             _LOGGER.error("Error pressing button %s: %s", self._key, e)
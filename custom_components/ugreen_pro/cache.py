@@ -0,0 +1,62 @@
+import asyncio
+import time
+from typing import Any, Callable
+
+from .const import RESPONSE_CACHE_DEFAULT, RESPONSE_CACHE_POLICIES
+
+
+class ResponseCache:
+    """Recent GET responses per endpoint, shared by all consumers of one UgreenApiClient.
+
+    A response is fresh for its endpoint's TTL. After that, within the endpoint's stale
+    window, it is still served while a refresh runs in the background (stale-while-revalidate);
+    later it is dropped, and so is a response whose refresh failed. 'in_flight' holds the running fetch per endpoint, so identical
+    GETs share one request.
+    """
+
+    def __init__(
+        self,
+        policies: dict[str, tuple[float, float]] = RESPONSE_CACHE_POLICIES,
+        default: tuple[float, float] = RESPONSE_CACHE_DEFAULT,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.policies = policies
+        self.default = default
+        self.clock = clock
+        self._entries: dict[str, tuple[float, dict[str, Any]]] = {}
+        # endpoint: [fetch, number of callers waiting for it]
+        self.in_flight: dict[str, list] = {}
+
+    def lookup(self, endpoint: str) -> tuple[dict[str, Any] | None, bool]:
+        """(response, fresh) for an endpoint; (None, False) if nothing usable is cached."""
+        entry = self._entries.get(endpoint)
+        if entry is None:
+            return None, False
+        ttl, stale = self.policies.get(endpoint, self.default)
+        age = self.clock() - entry[0]
+        if age < ttl:
+            return entry[1], True
+        if age < ttl + stale:
+            return entry[1], False
+        del self._entries[endpoint]
+        return None, False
+
+    def store(self, endpoint: str, response: dict[str, Any]) -> None:
+        self._entries[endpoint] = (self.clock(), response)
+
+    def discard(self, endpoint: str) -> None:
+        self._entries.pop(endpoint, None)
+
+    def start(self, endpoint: str, fetch: Callable[[], Any]) -> tuple[list, bool]:
+        """The running fetch of an endpoint, started now if there is none; and whether it was already running."""
+        running = self.in_flight.get(endpoint)
+        if running is not None:
+            return running, True
+        task = asyncio.ensure_future(fetch())
+        running = self.in_flight[endpoint] = [task, 0]
+
+        def finished(_task: asyncio.Future) -> None:
+            if self.in_flight.get(endpoint) is running:
+                del self.in_flight[endpoint]
+        task.add_done_callback(finished)
+        return running, False
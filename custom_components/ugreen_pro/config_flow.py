@@ -14,6 +14,12 @@ from .const import (
     CONF_PASSWORD,
     CONF_USE_HTTPS,
     CONF_VERIFY_SSL,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    CONF_STATUS_INTERVAL,
+    CONF_STATUS_INTERVAL_MAX,
+    DEFAULT_STATUS_INTERVAL,
+    DEFAULT_STATUS_INTERVAL_MAX,
 )
 from .api import UgreenApiClient
 
@@ -105,5 +111,8 @@ class UgreenNasOptionsFlowHandler(config_entries.OptionsFlow):
                 vol.Optional(CONF_PASSWORD, default=current.get(CONF_PASSWORD, "")): str,
                 vol.Optional(CONF_USE_HTTPS, default=current.get(CONF_USE_HTTPS, False)): bool,
                 vol.Optional(CONF_VERIFY_SSL, default=current.get(CONF_VERIFY_SSL, False)): bool,
+                vol.Optional(CONF_MAX_CONCURRENT_REQUESTS, default=current.get(CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS)): vol.All(int, vol.Range(min=1, max=16)),
+                vol.Optional(CONF_STATUS_INTERVAL, default=current.get(CONF_STATUS_INTERVAL, DEFAULT_STATUS_INTERVAL)): vol.All(int, vol.Range(min=1, max=3600)),
+                vol.Optional(CONF_STATUS_INTERVAL_MAX, default=current.get(CONF_STATUS_INTERVAL_MAX, DEFAULT_STATUS_INTERVAL_MAX)): vol.All(int, vol.Range(min=1, max=3600)),
             }),
         )
@@ -8,3 +8,72 @@ CONF_VERIFY_SSL = "verify_ssl"
 
 CONF_USERNAME = "username"
 CONF_PASSWORD = "password"
+
+CONF_MAX_CONCURRENT_REQUESTS = "max_concurrent_requests"
+DEFAULT_MAX_CONCURRENT_REQUESTS = 4
+
+# Token lifetime assumed until the first observed expiry (code 1024) teaches the real one.
+DEFAULT_TOKEN_TTL = 3600
+# Renew in the background once this share of the token lifetime has passed.
+TOKEN_RENEWAL_THRESHOLD = 0.8
+TOKEN_RENEWAL_CHECK_INTERVAL = 60
+# Early token expiries in a row before the assumed lifetime is lowered; a single one is
+# usually a NAS reboot or an admin logout, not a shorter lifetime.
+TOKEN_EARLY_EXPIRY_LIMIT = 2
+
+# Persisted entity topology (see async_setup_entry); bump the version when its layout changes.
+TOPOLOGY_STORAGE_VERSION = 1
+# Retry the background re-discovery (s) while the NAS cannot be reached at startup.
+TOPOLOGY_RECONCILE_RETRY = 60
+
+# Circuit breaker (see breaker.py): transport failures in a row before requests pause,
+# and the pause (s) before the first probe, doubled per failed probe up to the maximum.
+CIRCUIT_FAILURE_THRESHOLD = 3
+CIRCUIT_BACKOFF_MIN = 10
+CIRCUIT_BACKOFF_MAX = 300
+
+# Request timeouts (s), per endpoint: REQUEST_TIMEOUT until enough latencies are known, then
+# a multiple of the endpoint's p99 latency, kept within [REQUEST_TIMEOUT_MIN, REQUEST_TIMEOUT].
+REQUEST_TIMEOUT = 10
+REQUEST_TIMEOUT_MIN = 2
+REQUEST_TIMEOUT_P99_FACTOR = 3
+REQUEST_TIMEOUT_MIN_SAMPLES = 20
+REQUEST_TIMEOUT_RELEARN = 10
+# A coordinator tick gives up on requests still running after this share of its interval:
+# their timeouts are cut to the deadline, so they time out (a NAS failure, see breaker.py).
+# Whatever still runs this much (s) later (queued requests, a login) is cancelled.
+TICK_DEADLINE_SHARE = 0.8
+TICK_DEADLINE_GRACE = 0.5
+
+# Response cache (see cache.py): (TTL, stale window) in seconds per GET endpoint. Within the TTL
+# all consumers (both coordinators, buttons) share one response; within the stale window the old
+# response is served while a fresh one is fetched in the background.
+RESPONSE_CACHE_DEFAULT: tuple[float, float] = (1.0, 0.0)
+RESPONSE_CACHE_POLICIES: dict[str, tuple[float, float]] = {
+    # Slow-moving status codes, read by both coordinators.
+    "/ugreen/v1/desktop/components/data?id=desktop.component.SystemStatus": (4.0, 30.0),
+    "/ugreen/v1/desktop/components/data?id=desktop.component.TemperatureMonitoring": (4.0, 30.0),
+}
+
+# Deadbands of noisy status values (see UgreenEntity.deadband): smaller moves than these,
+# against the last written state, are not written to HA.
+DEADBAND_PERCENT = 1.0          # CPU / RAM usage, percentage points
+DEADBAND_TEMPERATURE = 2        # °C (reported in full degrees)
+DEADBAND_FAN_SPEED = 50         # RPM
+DEADBAND_DATA_RATE = 10 * 1024  # B/s, network rates
+
+CONF_STATUS_INTERVAL = "status_interval"
+CONF_STATUS_INTERVAL_MAX = "status_interval_max"
+DEFAULT_STATUS_INTERVAL = 5
+DEFAULT_STATUS_INTERVAL_MAX = 30
+# The config coordinator only backs off while the NAS answers slowly.
+CONFIG_INTERVAL = 60
+CONFIG_INTERVAL_MAX = 300
+
+# Refresh period (s) per UgreenEntity.poll_tier; None = fetched once per setup.
+# An endpoint is fetched as often as its fastest entity needs it.
+POLL_TIER_PERIODS: dict[str, int | None] = {
+    "static": None,     # identity / hardware (model, serial, CPU, RAM modules)
+    "capacity": 600,    # sizes, names, network config
+    "health": 60,       # status codes, temperatures, runtime
+}
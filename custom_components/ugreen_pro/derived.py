@@ -0,0 +1,268 @@
+import logging
+import re
+import time
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from operator import itemgetter
+from typing import Any, Callable, Iterable, TYPE_CHECKING
+
+from .utils import scale_bytes_per_second
+
+if TYPE_CHECKING:
+    from .api import UgreenEntity
+
+_LOGGER = logging.getLogger(__name__)
+
+# Inputs of a metric that has not been evaluated yet (None is a valid input).
+_NOT_EVALUATED = object()
+
+# Names kept from before the expression language, mapped to their expression.
+LEGACY_EXPRESSIONS = {
+    "ram_total_size": "sum(RAM*_size)",
+}
+
+_TOKEN = re.compile(r"\s*(?:(?P<number>-?\d+(?:\.\d+)?)(?![\w*?])|(?P<name>[\w*?]+)|(?P<punct>[(),]))")
+
+
+@dataclass
+class DerivedMetric:
+    """Value of a 'calculated:' entity: compute(*inputs), inputs being entity keys.
+
+    An input naming another derived metric reads that metric's result; any other
+    input (including the metric's own key) reads the raw value extracted for it.
+    A volatile metric (rate) is recomputed whenever an input was fetched again.
+    """
+    key: str
+    inputs: tuple[str, ...]
+    compute: Callable[..., Any]
+    volatile: bool = False
+
+
+def build_derived_metric(entity: 'UgreenEntity', known_keys: Iterable[str]) -> DerivedMetric:
+    """Turn a 'calculated:' path into a DerivedMetric with its inputs resolved against known_keys.
+
+    Paths are either 'calculated:scale_bytes_per_second:<path>' (scales the value at
+    <path> of the entity's endpoint) or 'calculated:<expression>', see compile_expression.
+    """
+    key = entity.description.key
+    path = entity.path
+
+    if path.startswith("calculated:scale_bytes_per_second:"):
+        # The inner path is extracted under the entity's own key (see compile_entity_paths).
+        return DerivedMetric(key, (key,), scale_bytes_per_second)
+
+    expression = path.removeprefix("calculated:")
+    try:
+        return compile_expression(key, LEGACY_EXPRESSIONS.get(expression, expression), known_keys)
+    except ValueError as e:
+        _LOGGER.warning("[UGREEN NAS] Invalid calculated path '%s' for '%s': %s", path, key, e)
+        return DerivedMetric(key, (), lambda: None)
+
+
+#################################################### EXPRESSIONS ###########
+
+# Expressions are function calls over entity keys, numbers and nested calls, e.g.
+#   sum(RAM*_size)                     sum over all keys matching a glob (* and ?)
+#   percent(pool1_free, pool1_total)   100 * a / b
+#   scale_bytes_per_second(sum(disk*_read_rate_raw, disk*_write_rate_raw))
+# A glob may expand to many keys where a function takes any number of values
+# (sum, min, max); everywhere else an argument must be exactly one value.
+# Any unknown (None) input makes the result None.
+
+def _numbers(function: Callable[..., Any]) -> Callable[..., Any]:
+    def call(*values: Any) -> Any:
+        return None if any(value is None for value in values) else function(*values)
+    return call
+
+def _divide(a: float, b: float) -> float | None:
+    return a / b if b else None
+
+def _percent(a: float, b: float) -> float | None:
+    return 100 * a / b if b else None
+
+def _rate() -> Callable[[Any], float | None]:
+    # Change per second since the previous sample; None for the first sample and on counter resets.
+    previous: list = [None, 0.0]
+
+    def rate(value: Any) -> float | None:
+        now = time.monotonic()
+        last, last_time = previous
+        previous[:] = [value, now]
+        if value is None or last is None or now <= last_time or value < last:
+            return None
+        return (value - last) / (now - last_time)
+    return rate
+
+# name: (number of arguments (None = any, globs expand), function factory)
+EXPRESSION_FUNCTIONS: dict[str, tuple[int | None, Callable[[], Callable[..., Any]]]] = {
+    "sum": (None, lambda: _numbers(lambda *values: sum(values))),
+    "min": (None, lambda: _numbers(lambda *values: min(values) if values else None)),
+    "max": (None, lambda: _numbers(lambda *values: max(values) if values else None)),
+    "diff": (2, lambda: _numbers(lambda a, b: a - b)),
+    "ratio": (2, lambda: _numbers(_divide)),
+    "percent": (2, lambda: _numbers(_percent)),
+    "rate": (1, _rate),
+    "scale_bytes_per_second": (1, lambda: scale_bytes_per_second),
+}
+
+
+def parse_expression(text: str) -> tuple:
+    """Parse an expression into a tree of ('call', name, args), ('ref', key or glob) and ('number', value)."""
+    tokens: list[tuple[str, str]] = []
+    position = 0
+    text = text.strip()
+    while position < len(text):
+        match = _TOKEN.match(text, position)
+        if match is None or match.end() == position:
+            raise ValueError(f"unexpected '{text[position:].strip()}'")
+        tokens.append((match.lastgroup, match.group(match.lastgroup)))  # type: ignore[arg-type]
+        position = match.end()
+
+    def node(index: int) -> tuple[tuple, int]:
+        if index >= len(tokens):
+            raise ValueError("unexpected end")
+        kind, value = tokens[index]
+        if kind == "number":
+            return ("number", float(value) if "." in value else int(value)), index + 1
+        if kind != "name":
+            raise ValueError(f"unexpected '{value}'")
+        if index + 1 >= len(tokens) or tokens[index + 1] != ("punct", "("):
+            return ("ref", value), index + 1
+        args: list[tuple] = []
+        index += 2
+        while index < len(tokens) and tokens[index] != ("punct", ")"):
+            if args:
+                if tokens[index] != ("punct", ","):
+                    raise ValueError(f"expected ',' in {value}()")
+                index += 1
+            arg, index = node(index)
+            args.append(arg)
+        if index >= len(tokens):
+            raise ValueError(f"missing ')' in {value}()")
+        return ("call", value, args), index + 1
+
+    tree, index = node(0)
+    if index != len(tokens):
+        raise ValueError(f"unexpected '{tokens[index][1]}'")
+    return tree
+
+
+def compile_expression(key: str, text: str, known_keys: Iterable[str]) -> DerivedMetric:
+    """Compile an expression once into a DerivedMetric; raises ValueError if it is invalid."""
+    known_keys = [k for k in known_keys if k != key]
+    known = set(known_keys)
+    inputs: list[str] = []
+    volatile = False
+
+    def getter_for(input_key: str) -> Callable[[tuple], Any]:
+        if input_key not in inputs:
+            inputs.append(input_key)
+        return itemgetter(inputs.index(input_key))
+
+    def compile_node(node: tuple) -> list[Callable[[tuple], Any]]:
+        # Returns one getter per value the node stands for (a glob may stand for many).
+        nonlocal volatile
+        if node[0] == "number":
+            value = node[1]
+            return [lambda args: value]
+        if node[0] == "ref":
+            pattern = node[1]
+            if "*" in pattern or "?" in pattern:
+                return [getter_for(k) for k in known_keys if fnmatchcase(k, pattern)]
+            if pattern not in known:
+                raise ValueError(f"unknown key '{pattern}'")
+            return [getter_for(pattern)]
+        _, name, arg_nodes = node
+        if name not in EXPRESSION_FUNCTIONS:
+            raise ValueError(f"unknown function '{name}'")
+        arity, factory = EXPRESSION_FUNCTIONS[name]
+        volatile = volatile or name == "rate"
+        getters = [compile_node(arg) for arg in arg_nodes]
+        if arity is None:
+            flat = [getter for group in getters for getter in group]
+        elif len(getters) != arity or any(len(group) != 1 for group in getters):
+            raise ValueError(f"{name}() takes {arity} single value(s)")
+        else:
+            flat = [group[0] for group in getters]
+        function = factory()
+        return [lambda args: function(*(getter(args) for getter in flat))]
+
+    getters = compile_node(parse_expression(text))
+    if len(getters) != 1:
+        raise ValueError("expression must stand for a single value")
+    evaluate = getters[0]
+    return DerivedMetric(key, tuple(inputs), lambda *args: evaluate(args), volatile)
+
+
+#################################################### ENGINE ################
+
+class DerivedMetricEngine:
+    """Evaluates the 'calculated:' entities of one coordinator after raw extraction.
+
+    Metrics run in dependency order, so one may use another's result. A metric is
+    recomputed only when one of its inputs changed since it was last evaluated;
+    otherwise its previous result is reused.
+    """
+
+    def __init__(self, entities: 'Iterable[UgreenEntity]') -> None:
+        entities = list(entities)
+        known_keys = [entity.description.key for entity in entities]
+        metrics = {
+            entity.description.key: build_derived_metric(entity, known_keys)
+            for entity in entities
+            if entity.path.startswith("calculated:")
+        }
+        # (metric, ((input key, reads a derived result), ...)) in evaluation order.
+        self._order: list[tuple[DerivedMetric, tuple[tuple[str, bool], ...]]] = [
+            (metric, tuple((k, k in metrics and k != metric.key) for k in metric.inputs))
+            for metric in _dependency_order(metrics)
+        ]
+        self._raw_inputs = {k for metric, refs in self._order for k, derived in refs if not derived}
+        self._raw: dict[str, Any] = {}
+        self._results: dict[str, Any] = {}
+        self._last_inputs: dict[str, Any] = {}
+
+    def evaluate(self, resolved: dict[str, Any], data: dict[str, Any]) -> None:
+        """Write all derived values into data; resolved holds the raw values extracted on this tick."""
+        raw, results, last_inputs = self._raw, self._results, self._last_inputs
+        for key in self._raw_inputs:
+            if key in resolved:
+                raw[key] = resolved[key]
+        for metric, refs in self._order:
+            args = tuple(results.get(k) if derived else raw.get(k) for k, derived in refs)
+            fetched_again = metric.volatile and any(not derived and k in resolved for k, derived in refs)
+            if fetched_again or last_inputs.get(metric.key, _NOT_EVALUATED) != args:
+                last_inputs[metric.key] = args
+                try:
+                    results[metric.key] = metric.compute(*args)
+                except Exception as e:
+                    _LOGGER.warning("[UGREEN NAS] Failed to calculate '%s': %s", metric.key, e)
+                    results[metric.key] = None
+            data[metric.key] = results[metric.key]
+
+
+def _dependency_order(metrics: dict[str, DerivedMetric]) -> list[DerivedMetric]:
+    # Depth-first topological sort over inputs that are other derived metrics.
+    # Metrics on a cycle are dropped with a warning (their entities stay unknown).
+    ordered: list[DerivedMetric] = []
+    state: dict[str, str] = {}
+
+    def visit(key: str) -> bool:
+        if state.get(key) == "done":
+            return True
+        if state.get(key) in ("visiting", "cycle"):
+            return False
+        state[key] = "visiting"
+        metric = metrics[key]
+        for dependency in metric.inputs:
+            if dependency in metrics and dependency != key and not visit(dependency):
+                state[key] = "cycle"
+                return False
+        state[key] = "done"
+        ordered.append(metric)
+        return True
+
+    for key in metrics:
+        if not visit(key):
+            _LOGGER.warning("[UGREEN NAS] Calculated entity '%s' depends on itself, skipped.", key)
+    return ordered
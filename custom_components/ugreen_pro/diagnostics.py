@@ -0,0 +1,27 @@
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, CONF_PASSWORD, CONF_USERNAME
+
+TO_REDACT = {CONF_PASSWORD, CONF_USERNAME, "token"}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    """Return diagnostics for a config entry, including the API request metrics."""
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    api = entry_data["api"]
+
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "dynamic_entity_counts": entry_data.get("dynamic_entity_counts"),
+        "api": {
+            "summary": api.metrics.summary(),
+            "endpoints": api.metrics.as_dict(),
+            "token_refresh": api.get_token_refresh_metrics(),
+            "circuit_breaker": api.breaker.as_dict(),
+            "request_timeouts": api.learned_timeouts(),
+        },
+    }
@@ -0,0 +1,519 @@
+from typing import List
+from homeassistant.const import (
+    PERCENTAGE, UnitOfDataRate, UnitOfTemperature, UnitOfInformation, UnitOfTime, UnitOfFrequency
+)
+
+from .api import UgreenEntity, UgreenEntityDescription
+from .const import DEADBAND_DATA_RATE, DEADBAND_PERCENT, DEADBAND_TEMPERATURE
+
+# Static entity catalogue (entities every UGREEN NAS has). Kept out of api.py and imported
+# on first use (see async_load_entity_catalogue), so loading the integration stays cheap.
+
+STATIC_CONFIG_ENTITIES: List[UgreenEntity] = [ ################ STATIC_CONFIG ##
+
+    ### Device Info
+    UgreenEntity(
+        description=UgreenEntityDescription(
+            key="model",
+            name="NAS Model",
+            icon="mdi:account",
+            unit_of_measurement=None,
+        ),
+        endpoint="/ugreen/v1/sysinfo/machine/common",
+        path="data.common.model",
+        nas_part_category="Device",
+        poll_tier="static",
+    ),
+    UgreenEntity(
+        description=UgreenEntityDescription(
+            key="type",
+            name="NAS Type",
+            icon="mdi:nas",
+            unit_of_measurement=None,
+        ),
+        endpoint="/ugreen/v1/desktop/components/data?id=desktop.component.SystemStatus",
+        path="data.type",
+        nas_part_category="Device",
+        poll_tier="static",
+    ),
+    UgreenEntity(
+        description=UgreenEntityDescription(
+            key="serial",
+            name="NAS Serial",
+            icon="mdi:focus-field",
+            unit_of_measurement=None,
+        ),
+        endpoint="/ugreen/v1/sysinfo/machine/common",
+        path="data.common.serial",
+        nas_part_category="Device",
+        poll_tier="static",
+    ),
+    UgreenEntity(
+        description=UgreenEntityDescription(
+            key="owner",
+            name="NAS Owner",
+            icon="mdi:account",
+            unit_of_measurement=None,
+        ),
+        endpoint="/ugreen/v1/sysinfo/machine/common",
+        path="data.common.nas_owner",
+        nas_part_category="Device",
+        poll_tier="capacity",
+    ),
+    UgreenEntity(
+        description=UgreenEntityDescription(
+            key="device_name",
+            name="NAS Name",
+            icon="mdi:nas",
+            unit_of_measurement=None,
+        ),
+        endpoint="/ugreen/v1/desktop/components/data?id=desktop.component.SystemStatus",
+        path="data.dev_name",
+        nas_part_category="Device",
+        poll_tier="capacity",
+    ),
+    UgreenEntity(
+        description=UgreenEntityDescription(
+            key="version",
+            name="NAS UGOS Version",
+            icon="mdi:numeric",
+            unit_of_measurement=None,
+        ),
+        endpoint="/ugreen/v1/sysinfo/machine/common",
+        path="data.common.system_version",
+        nas_part_category="Device",
+        poll_tier="capacity",
+    ),
+
+    ### Hardware Info
+    UgreenEntity(
+        description=UgreenEntityDescription(
+            key="cpu_model",
+            name="CPU Model",
+            icon="mdi:chip",
+            unit_of_measurement=None,
+        ),
+        endpoint="/ugreen/v1/sysinfo/machine/common",
+        path="data.hardware.cpu[0].model",
+        nas_part_category="Hardware",
+        poll_tier="static",
+    ),
+    UgreenEntity(
+        description=UgreenEntityDescription(
+            key="cpu_ghz",
+            name="CPU Speed",
+            icon="mdi:speedometer",
+            unit_of_measurement=UnitOfFrequency.MEGAHERTZ,
+        ),
+        endpoint="/ugreen/v1/sysinfo/machine/common",
+        path="data.hardware.cpu[0].ghz",
+        decimal_places=0,
+        nas_part_category="Hardware",
+        poll_tier="static",
+    ),
+    UgreenEntity(
+        description=UgreenEntityDescription(
+            key="cpu_core",
+            name="CPU Cores",
+            icon="mdi:chip",
+            unit_of_measurement="Cores",
+        ),
+        endpoint="/ugreen/v1/sysinfo/machine/common",
+        path="data.hardware.cpu[0].core",
+        decimal_places=0,
+        nas_part_category="Hardware",
+        poll_tier="static",
+    ),
+    UgreenEntity(
+        description=UgreenEntityDescription(
+            key="cpu_thread",
+            name="CPU Threads",
+            icon="mdi:chip",
+            unit_of_measurement="Threads",
+        ),
+        endpoint="/ugreen/v1/sysinfo/machine/common",
+        path="data.hardware.cpu[0].thread",
+        decimal_places=0,
+        nas_part_category="Hardware",
+        poll_tier="static",
+    ),
+
+    ### Runtime info
+        UgreenEntity(
+        description=UgreenEntityDescription(
+            key="last_boot_date",
+            name="Last Boot",
+            icon="mdi:calendar",
+            unit_of_measurement=None,
+        ),
+        endpoint="/ugreen/v1/desktop/components/data?id=desktop.component.SystemStatus",
+        path="data.last_boot_date",
+        nas_part_category="Status",
+        poll_tier="capacity",
+    ),
+    UgreenEntity(
+        description=UgreenEntityDescription(
+            key="last_boot_time",
+            name="Last Boot Timestamp",
+            icon="mdi:clock",
+            unit_of_measurement=None,
+        ),
+        endpoint="/ugreen/v1/desktop/components/data?id=desktop.component.SystemStatus",
+        path="data.last_boot_time",
+        nas_part_category="Status",
+        poll_tier="capacity",
+    ),
+    UgreenEntity(
+        description=UgreenEntityDescription(
+            key="total_run_time",
+            name="Total Runtime",
+            icon="mdi:timer-outline",
+            unit_of_measurement=UnitOfTime.SECONDS,
+        ),
+        endpoint="/ugreen/v1/desktop/components/data?id=desktop.component.SystemStatus",
+        path="data.total_run_time",
+        nas_part_category="Status",
+        poll_tier="health",
+    ),
+
+    ### System Status
+    UgreenEntity(
+        description=UgreenEntityDescription(
+            key="server_status",
+            name="Server Status",
+            icon="mdi:server",
+            unit_of_measurement=None,
+        ),
+        endpoint="/ugreen/v1/desktop/components/data?id=desktop.component.SystemStatus",
+        path="data.server_status",
+        nas_part_category="Status",
+        poll_tier="health",
+    ),
+    UgreenEntity(
+        description=UgreenEntityDescription(
+            key="status",
+            name="System Status Code",
+            icon="mdi:information",
+            unit_of_measurement=None,
+        ),
+        endpoint="/ugreen/v1/desktop/components/data?id=desktop.component.SystemStatus",
+        path="data.status",
+        nas_part_category="Status",
+        poll_tier="health",
+    ),
+    UgreenEntity(
+        description=UgreenEntityDescription(
+            key="cpu_status",
+            name="CPU Temperature Status",
+            icon="mdi:alert",
+            unit_of_measurement=None,
+        ),
+        endpoint="/ugreen/v1/desktop/components/data?id=desktop.component.TemperatureMonitoring",
+        path="data.cpu_status",
+        nas_part_category="Status",
+        poll_tier="health",
+    ),
+    UgreenEntity(
+        description=UgreenEntityDescription(
+            key="temperature_status",
+            name="Temperature Status Code",
+            icon="mdi:information",
+            unit_of_measurement=None,
+        ),
+        endpoint="/ugreen/v1/desktop/components/data?id=desktop.component.TemperatureMonitoring",
+        path="data.status",
+        nas_part_category="Status",
+        poll_tier="health",
+    ),
+    UgreenEntity(
+        description=UgreenEntityDescription(
+            key="temperature_message",
+            name="Temperature Message",
+            icon="mdi:message-alert",
+            unit_of_measurement=None,
+        ),
+        endpoint="/ugreen/v1/desktop/components/data?id=desktop.component.TemperatureMonitoring",
+        path="data.message",
+        nas_part_category="Status",
+        poll_tier="health",
+    ),
+    UgreenEntity(
+        description=UgreenEntityDescription(
+            key="message",
+            name="System Message",
+            icon="mdi:message",
+            unit_of_measurement=None,
+        ),
+        endpoint="/ugreen/v1/desktop/components/data?id=desktop.component.SystemStatus",
+        path="data.message",
+        nas_part_category="Status",
+        poll_tier="health",
+    ),
+]
+
+
+STATIC_STATUS_ENTITIES = [ #################################### STATIC_STATUS ##
+
+    ### CPU
+    UgreenEntity(
+        description=UgreenEntityDescription(
+            key="cpu_usage",
+            name="CPU Usage",
+            icon="mdi:chip",
+            unit_of_measurement=PERCENTAGE,
+        ),
+        decimal_places=0,
+        endpoint="/ugreen/v1/taskmgr/stat/get_all",
+        path="data.overview.cpu[0].used_percent",
+        nas_part_category="Status",
+        deadband=DEADBAND_PERCENT,
+    ),
+    UgreenEntity(
+        description=UgreenEntityDescription(
+            key="cpu_temperature",
+            name="CPU Temperature",
+            icon="mdi:thermometer",
+            unit_of_measurement=UnitOfTemperature.CELSIUS,
+        ),
+        decimal_places=0,
+        endpoint="/ugreen/v1/taskmgr/stat/get_all",
+        path="data.overview.cpu[0].temp",
+        nas_part_category="Status",
+        deadband=DEADBAND_TEMPERATURE,
+    ),
+
+    ### RAM
+    UgreenEntity(
+        description=UgreenEntityDescription(
+            key="mem_usage",
+            name="RAM Usage",
+            icon="mdi:memory",
+            unit_of_measurement=PERCENTAGE,
+        ),
+        endpoint="/ugreen/v1/taskmgr/stat/get_all",
+        path="data.overview.mem[0].used_percent",
+        nas_part_category="Status",
+        deadband=DEADBAND_PERCENT,
+    ),
+    UgreenEntity(
+        description=UgreenEntityDescription(
+            key="ram_usage_total_usable",
+            name="RAM Usage (Usable RAM)",
+            icon="mdi:memory",
+            unit_of_measurement=UnitOfInformation.BYTES,
+        ),
+        endpoint="/ugreen/v1/taskmgr/stat/get_all",
+        path="data.mem.structure.total",
+        nas_part_category="Status",
+    ),
+    UgreenEntity(
+        description=UgreenEntityDescription(
+            key="ram_usage_free",
+            name="RAM Usage (Free RAM)",
+            icon="mdi:memory",
+            unit_of_measurement=UnitOfInformation.BYTES,
+        ),
+        endpoint="/ugreen/v1/taskmgr/stat/get_all",
+        path="data.mem.structure.free",
+        nas_part_category="Status",
+    ),
+    UgreenEntity(
+        description=UgreenEntityDescription(
+            key="ram_usage_cache",
+            name="RAM Usage (Cache)",
+            icon="mdi:memory",
+            unit_of_measurement=UnitOfInformation.BYTES,
+        ),
+        endpoint="/ugreen/v1/taskmgr/stat/get_all",
+        path="data.mem.structure.cache",
+        nas_part_category="Status",
+    ),
+    UgreenEntity(
+        description=UgreenEntityDescription(
+            key="ram_usage_shared",
+            name="RAM Usage (Shared Mem)",
+            icon="mdi:memory",
+            unit_of_measurement=UnitOfInformation.BYTES,
+        ),
+        endpoint="/ugreen/v1/taskmgr/stat/get_all",
+        path="data.mem.structure.share",
+        nas_part_category="Status",
+    ),
+    UgreenEntity(
+        description=UgreenEntityDescription(
+            key="ram_usage_used_gb",
+            name="RAM Usage (Used GB)",
+            icon="mdi:memory",
+            unit_of_measurement=UnitOfInformation.BYTES,
+        ),
+        endpoint="/ugreen/v1/taskmgr/stat/get_all",
+        path="data.mem.structure.used",
+        nas_part_category="Status",
+    ),
+
+    ### LAN (net.overview = first element, overall)
+    UgreenEntity(
+        description=UgreenEntityDescription(
+            key="overall_lan_upload_raw",
+            name="Overall LAN Upload (raw)",
+            icon="mdi:upload-network",
+            unit_of_measurement=UnitOfDataRate.BYTES_PER_SECOND,
+        ),
+        endpoint="/ugreen/v1/taskmgr/stat/get_all",
+        path="data.net.series[0].send_rate",
+        nas_part_category="Status",
+        deadband=DEADBAND_DATA_RATE,
+    ),
+    UgreenEntity(
+        description=UgreenEntityDescription(
+            key="overall_lan_upload",
+            name="Overall LAN Upload",
+            icon="mdi:upload-network",
+            unit_of_measurement=None,
+        ),
+        endpoint="/ugreen/v1/taskmgr/stat/get_all",
+        path="calculated:scale_bytes_per_second:data.net.series[0].send_rate",
+        nas_part_category="Status",
+    ),
+    UgreenEntity(
+        description=UgreenEntityDescription(
+            key="overall_lan_download_raw",
+            name="Overall LAN Download (raw)",
+            icon="mdi:download-network",
+            unit_of_measurement=UnitOfDataRate.BYTES_PER_SECOND,
+        ),
+        endpoint="/ugreen/v1/taskmgr/stat/get_all",
+        path="data.net.series[0].recv_rate",
+        nas_part_category="Status",
+        deadband=DEADBAND_DATA_RATE,
+    ),
+    UgreenEntity(
+        description=UgreenEntityDescription(
+            key="overall_lan_download",
+            name="Overall LAN Download",
+            icon="mdi:download-network",
+            unit_of_measurement=None,
+        ),
+        endpoint="/ugreen/v1/taskmgr/stat/get_all",
+        path="calculated:scale_bytes_per_second:data.net.series[0].recv_rate",
+        nas_part_category="Status",
+    ),
+
+    ### Disks (disk.series only = first element, overall)
+    UgreenEntity(
+        description=UgreenEntityDescription(
+            key="overall_disk_read_rate_raw",
+            name="Overall Disk Read Rate (raw)",
+            icon="mdi:harddisk",
+            unit_of_measurement=UnitOfDataRate.BYTES_PER_SECOND,
+        ),
+        endpoint="/ugreen/v1/taskmgr/stat/get_all",
+        path="data.disk.series[0].read_rate",
+        nas_part_category="Status",
+    ),
+    UgreenEntity(
+        description=UgreenEntityDescription(
+            key="overall_disk_read_rate",
+            name="Overall Disk Read Rate",
+            icon="mdi:harddisk",
+            unit_of_measurement=None,
+        ),
+        endpoint="/ugreen/v1/taskmgr/stat/get_all",
+        path="calculated:scale_bytes_per_second:data.disk.series[0].read_rate",
+        nas_part_category="Status",
+    ),
+    UgreenEntity(
+        description=UgreenEntityDescription(
+            key="overall_disk_write_rate_raw",
+            name="Overall Disk Write Rate (raw)",
+            icon="mdi:harddisk",
+            unit_of_measurement=UnitOfDataRate.BYTES_PER_SECOND,
+        ),
+        endpoint="/ugreen/v1/taskmgr/stat/get_all",
+        path="data.disk.series[0].write_rate",
+        nas_part_category="Status",
+    ),
+    UgreenEntity(
+        description=UgreenEntityDescription(
+            key="overall_disk_write_rate",
+            name="Overall Disk Write Rate",
+            icon="mdi:harddisk",
+            unit_of_measurement=None,
+        ),
+        endpoint="/ugreen/v1/taskmgr/stat/get_all",
+        path="calculated:scale_bytes_per_second:data.disk.series[0].write_rate",
+        nas_part_category="Status",
+    ),
+
+    ### Volumes (volume.series only = first element, overall)
+    UgreenEntity(
+        description=UgreenEntityDescription(
+            key="overall_volume_read_rate_raw",
+            name="Overall Volume Read Rate (raw)",
+            icon="mdi:harddisk",
+            unit_of_measurement=UnitOfDataRate.BYTES_PER_SECOND,
+        ),
+        endpoint="/ugreen/v1/taskmgr/stat/get_all",
+        path="data.volume.series[0].read_rate",
+        nas_part_category="Status",
+    ),
+    UgreenEntity(
+        description=UgreenEntityDescription(
+            key="overall_volume_read_rate",
+            name="Overall Volume Read Rate",
+            icon="mdi:harddisk",
+            unit_of_measurement=None,
+        ),
+        endpoint="/ugreen/v1/taskmgr/stat/get_all",
+        path="calculated:scale_bytes_per_second:data.volume.series[0].read_rate",
+        nas_part_category="Status",
+    ),
+    UgreenEntity(
+        description=UgreenEntityDescription(
+            key="overall_volume_write_rate_raw",
+            name="Overall Volume Write Rate (raw)",
+            icon="mdi:harddisk",
+            unit_of_measurement=UnitOfDataRate.BYTES_PER_SECOND,
+        ),
+        endpoint="/ugreen/v1/taskmgr/stat/get_all",
+        path="data.volume.series[0].write_rate",
+        nas_part_category="Status",
+    ),
+    UgreenEntity(
+        description=UgreenEntityDescription(
+            key="overall_volume_write_rate",
+            name="Overall Volume Write Rate",
+            icon="mdi:harddisk",
+            unit_of_measurement=None,
+        ),
+        endpoint="/ugreen/v1/taskmgr/stat/get_all",
+        path="calculated:scale_bytes_per_second:data.volume.series[0].write_rate",
+        nas_part_category="Status",
+    ),
+]
+
+STATIC_BUTTON_ENTITIES: List[UgreenEntity] = [
+    ### System Actions
+    UgreenEntity(
+        description=UgreenEntityDescription(
+            key="shutdown",
+            name="Shutdown",
+            icon="mdi:power",
+        ),
+        endpoint="/ugreen/v1/desktop/shutdown",
+        path="",
+        request_method="POST",
+        nas_part_category="",
+    ),
+    UgreenEntity(
+        description=UgreenEntityDescription(
+            key="reboot",
+            name="Reboot",
+            icon="mdi:restart",
+        ),
+        endpoint="/ugreen/v1/desktop/reboot",
+        path="",
+        request_method="POST",
+        nas_part_category="",
+    ),
+]
@@ -0,0 +1,150 @@
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+# Upper bounds (seconds) of the latency histogram buckets; a last, open-ended bucket follows.
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Number of recent latencies kept per endpoint for percentiles.
+LATENCY_SAMPLES = 100
+
+
+@dataclass
+class EndpointMetrics:
+    """Counters, gauges and latency histogram of a single API endpoint."""
+    requests: int = 0
+    successes: int = 0
+    failures: int = 0
+    token_expired: int = 0
+    cancelled: int = 0
+    retries: int = 0
+    cache_hits: int = 0
+    cache_stale_hits: int = 0
+    coalesced: int = 0
+    bytes_received: int = 0
+    in_flight: int = 0
+    latency_total: float = 0.0
+    latency_max: float = 0.0
+    latency_histogram: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+    latency_samples: deque = field(default_factory=lambda: deque(maxlen=LATENCY_SAMPLES))
+
+    @property
+    def latency_avg(self) -> float | None:
+        finished = self.successes + self.failures + self.token_expired
+        return self.latency_total / finished if finished else None
+
+    def latency_percentile(self, percentile: float) -> float | None:
+        """Latency percentile (0..100) over the recent samples, in seconds."""
+        if not self.latency_samples:
+            return None
+        ordered = sorted(self.latency_samples)
+        index = min(len(ordered) - 1, max(0, round(percentile / 100 * len(ordered)) - 1))
+        return ordered[index]
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "successes": self.successes,
+            "failures": self.failures,
+            "token_expired": self.token_expired,
+            "cancelled": self.cancelled,
+            "retries": self.retries,
+            "cache_hits": self.cache_hits,
+            "cache_stale_hits": self.cache_stale_hits,
+            "coalesced": self.coalesced,
+            "bytes_received": self.bytes_received,
+            "in_flight": self.in_flight,
+            "latency_avg": self.latency_avg,
+            "latency_p95": self.latency_percentile(95),
+            "latency_max": self.latency_max,
+            "latency_histogram": dict(zip([*map(str, LATENCY_BUCKETS), "inf"], self.latency_histogram)),
+        }
+
+
+class UgreenApiMetrics:
+    """Request-level instrumentation of UgreenApiClient, keyed by endpoint."""
+
+    def __init__(self) -> None:
+        self._endpoints: dict[str, EndpointMetrics] = {}
+        # Sensor state writes done vs. skipped because the published value did not change.
+        self.state_writes_published = 0
+        self.state_writes_skipped = 0
+
+    def endpoint(self, endpoint: str) -> EndpointMetrics:
+        metrics = self._endpoints.get(endpoint)
+        if metrics is None:
+            metrics = self._endpoints[endpoint] = EndpointMetrics()
+        return metrics
+
+    def request_started(self, endpoint: str) -> float:
+        metrics = self.endpoint(endpoint)
+        metrics.requests += 1
+        metrics.in_flight += 1
+        return time.monotonic()
+
+    def request_finished(self, endpoint: str, started: float, outcome: str, size: int = 0) -> None:
+        """Record a finished request; outcome is 'success', 'failure', 'token_expired' or 'cancelled'."""
+        latency = time.monotonic() - started
+        metrics = self.endpoint(endpoint)
+        metrics.in_flight -= 1
+        if outcome == "cancelled":
+            # Cut short by the tick deadline: no answer, and no latency to learn from.
+            metrics.cancelled += 1
+            return
+        if outcome == "success":
+            metrics.successes += 1
+        elif outcome == "token_expired":
+            metrics.token_expired += 1
+        else:
+            metrics.failures += 1
+        metrics.bytes_received += size
+        metrics.latency_total += latency
+        metrics.latency_max = max(metrics.latency_max, latency)
+        metrics.latency_samples.append(latency)
+        bucket = 0
+        while bucket < len(LATENCY_BUCKETS) and latency > LATENCY_BUCKETS[bucket]:
+            bucket += 1
+        metrics.latency_histogram[bucket] += 1
+
+    def retry(self, endpoint: str) -> None:
+        self.endpoint(endpoint).retries += 1
+
+    def cache_hit(self, endpoint: str, fresh: bool) -> None:
+        metrics = self.endpoint(endpoint)
+        if fresh:
+            metrics.cache_hits += 1
+        else:
+            metrics.cache_stale_hits += 1
+
+    def coalesced(self, endpoint: str) -> None:
+        self.endpoint(endpoint).coalesced += 1
+
+    def state_write(self, published: bool) -> None:
+        if published:
+            self.state_writes_published += 1
+        else:
+            self.state_writes_skipped += 1
+
+    def summary(self) -> dict[str, Any]:
+        """Totals over all endpoints, plus the endpoint with the highest average latency."""
+        endpoints = self._endpoints.values()
+        finished = sum(m.successes + m.failures + m.token_expired for m in endpoints)
+        slowest = max(self._endpoints.items(), key=lambda item: item[1].latency_avg or 0.0, default=(None, None))[0]
+        return {
+            "requests": sum(m.requests for m in endpoints),
+            "failures": sum(m.failures for m in endpoints),
+            "token_expired": sum(m.token_expired for m in endpoints),
+            "cancelled": sum(m.cancelled for m in endpoints),
+            "cache_hits": sum(m.cache_hits + m.cache_stale_hits for m in endpoints),
+            "coalesced": sum(m.coalesced for m in endpoints),
+            "retries": sum(m.retries for m in endpoints),
+            "bytes_received": sum(m.bytes_received for m in endpoints),
+            "in_flight": sum(m.in_flight for m in endpoints),
+            "latency_avg": sum(m.latency_total for m in endpoints) / finished if finished else None,
+            "slowest_endpoint": slowest,
+            "state_writes_published": self.state_writes_published,
+            "state_writes_skipped": self.state_writes_skipped,
+        }
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        return {endpoint: metrics.as_dict() for endpoint, metrics in self._endpoints.items()}
@@ -0,0 +1,93 @@
+from typing import Any, Iterable
+
+from .const import POLL_TIER_PERIODS
+
+# A tick that takes longer than this share of the current interval counts as a slow NAS.
+SLOW_RESPONSE_SHARE = 0.5
+# Growth factor of the interval while values are flat.
+IDLE_BACKOFF_FACTOR = 1.5
+# Growth factor of the interval while the NAS answers slowly.
+SLOW_BACKOFF_FACTOR = 2.0
+# Ticks never land exactly on a tier period; an endpoint this close to due is fetched now.
+TIER_SLACK = 1.0
+
+
+class AdaptivePollInterval:
+    """Chooses the next update interval of a coordinator, always within [minimum, maximum].
+
+    While any of the watched 'activity' values moves noticeably (network/disk rates), the
+    interval drops back to the minimum. While they are flat it grows step by step, and it
+    grows faster if the NAS needs a large share of the interval to answer. Without activity
+    keys, only the slow-response backoff applies.
+    """
+
+    def __init__(
+        self,
+        minimum: float,
+        maximum: float,
+        activity_keys: Iterable[str] = (),
+        relative_change: float = 0.1,
+        absolute_change: float = 1024,
+    ) -> None:
+        self.minimum = float(minimum)
+        self.maximum = max(float(maximum), self.minimum)
+        self.interval = self.minimum
+        self._activity_keys = tuple(activity_keys)
+        self._relative_change = relative_change
+        self._absolute_change = absolute_change
+        self._previous: dict[str, Any] = {}
+
+    def next_interval(self, data: dict[str, Any], duration: float) -> float:
+        """Return the interval (seconds) until the next tick, given this tick's data and duration."""
+        active = self._is_active(data)
+        if duration > self.interval * SLOW_RESPONSE_SHARE:
+            self.interval = self.interval * SLOW_BACKOFF_FACTOR
+        elif active or not self._activity_keys:
+            self.interval = self.minimum
+        else:
+            self.interval = self.interval * IDLE_BACKOFF_FACTOR
+        self.interval = min(self.maximum, max(self.minimum, self.interval))
+        return self.interval
+
+    def _is_active(self, data: dict[str, Any]) -> bool:
+        active = False
+        for key in self._activity_keys:
+            value = data.get(key)
+            previous = self._previous.get(key)
+            self._previous[key] = value
+            if active or not isinstance(value, (int, float)) or not isinstance(previous, (int, float)):
+                continue
+            delta = abs(value - previous)
+            if delta >= self._absolute_change and delta >= self._relative_change * max(abs(previous), 1):
+                active = True
+        return active
+
+
+class TieredEndpointSchedule:
+    """Decides which endpoints of a coordinator are due on a tick.
+
+    Each endpoint refreshes with the shortest period among its entities' poll tiers;
+    entities without a tier want every tick. All endpoints due on the same tick are
+    returned together, so they are fetched as one batch.
+    """
+
+    def __init__(self, endpoint_to_entities: dict[str, list]) -> None:
+        self._periods: dict[str, float | None] = {}
+        for endpoint, entities in endpoint_to_entities.items():
+            periods = [POLL_TIER_PERIODS[e.poll_tier] if e.poll_tier else 0 for e in entities]
+            periods = [period for period in periods if period is not None]
+            self._periods[endpoint] = min(periods) if periods else None
+        self._last_fetched: dict[str, float] = {}
+
+    def due(self, now: float) -> list[str]:
+        """Endpoints to fetch on a tick at monotonic time 'now'."""
+        due = []
+        for endpoint, period in self._periods.items():
+            last = self._last_fetched.get(endpoint)
+            if last is None or (period is not None and now - last >= period - TIER_SLACK):
+                due.append(endpoint)
+        return due
+
+    def fetched(self, endpoints: Iterable[str], now: float) -> None:
+        for endpoint in endpoints:
+            self._last_fetched[endpoint] = now
@@ -1,5 +1,6 @@
 import logging
 from homeassistant.components.sensor import SensorEntity
+from homeassistant.const import EntityCategory
 from homeassistant.helpers.typing import StateType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity, DataUpdateCoordinator
 from homeassistant.core import HomeAssistant
@@ -10,11 +11,28 @@ from decimal import Decimal
 
 from .device_info import build_device_info
 from .const import DOMAIN
-from .api import UgreenEntity
-from .utils import determine_unit, format_sensor_value
+from .api import UgreenApiClient, UgreenEntity, UgreenEntityDescription
+from .metrics import UgreenApiMetrics
+from .utils import FormattingPlan
 
 _LOGGER = logging.getLogger(__name__)
 
+# Diagnostic sensors fed by the API client's request metrics (see metrics.py).
+API_METRIC_SENSORS: list[UgreenEntityDescription] = [
+    UgreenEntityDescription(key="api_requests", name="API Requests", icon="mdi:counter"),
+    UgreenEntityDescription(key="api_failures", name="API Failures", icon="mdi:alert-circle-outline"),
+    UgreenEntityDescription(key="api_token_expired", name="API Token Expirations", icon="mdi:key-alert"),
+    UgreenEntityDescription(key="api_retries", name="API Retries", icon="mdi:replay"),
+    UgreenEntityDescription(key="api_token_refreshes", name="API Token Refreshes", icon="mdi:key-change"),
+    UgreenEntityDescription(key="api_circuit_state", name="API Circuit State", icon="mdi:electric-switch"),
+    UgreenEntityDescription(key="api_in_flight", name="API Requests In Flight", icon="mdi:transit-connection-variant"),
+    UgreenEntityDescription(key="api_latency_avg", name="API Average Latency", icon="mdi:timer-outline", unit_of_measurement="ms"),
+    UgreenEntityDescription(key="api_bytes_received", name="API Bytes Received", icon="mdi:download-network", unit_of_measurement="B"),
+    UgreenEntityDescription(key="api_slowest_endpoint", name="API Slowest Endpoint", icon="mdi:speedometer-slow"),
+    UgreenEntityDescription(key="state_writes_published", name="Sensor State Writes", icon="mdi:database-arrow-down"),
+    UgreenEntityDescription(key="state_writes_skipped", name="Sensor State Writes Skipped", icon="mdi:database-off"),
+]
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -26,30 +44,48 @@ async def async_setup_entry(
     config_entities = hass.data[DOMAIN][entry.entry_id]["config_entities"]
     status_coordinator = hass.data[DOMAIN][entry.entry_id]["status_coordinator"]
     status_entities = hass.data[DOMAIN][entry.entry_id]["status_entities"]
+    config_formatting = hass.data[DOMAIN][entry.entry_id]["config_formatting_plan"]
+    status_formatting = hass.data[DOMAIN][entry.entry_id]["status_formatting_plan"]
+    config_stale = hass.data[DOMAIN][entry.entry_id]["config_stale_endpoints"]
+    status_stale = hass.data[DOMAIN][entry.entry_id]["status_stale_endpoints"]
     nas_model = hass.data[DOMAIN][entry.entry_id].get("nas_model")
+    api = hass.data[DOMAIN][entry.entry_id]["api"]
 
     # Configuration sensors (60s)
     config_sensors = [
-        UgreenNasSensor(entry.entry_id, config_coordinator, entity, nas_model)
+        UgreenNasSensor(entry.entry_id, config_coordinator, entity, config_formatting, nas_model, api.metrics, config_stale)
         for entity in config_entities
     ]
 
     # Status sensors (5s)
     status_sensors = [
-        UgreenNasSensor(entry.entry_id, status_coordinator, entity, nas_model)
+        UgreenNasSensor(entry.entry_id, status_coordinator, entity, status_formatting, nas_model, api.metrics, status_stale)
         for entity in status_entities
     ]
 
-    async_add_entities(config_sensors + status_sensors)
+    # API diagnostics (refreshed with the status coordinator)
+    metric_sensors = [
+        UgreenNasApiMetricSensor(entry.entry_id, status_coordinator, description, api, nas_model)
+        for description in API_METRIC_SENSORS
+    ]
+
+    async_add_entities(config_sensors + status_sensors + metric_sensors)
 
 class UgreenNasSensor(CoordinatorEntity, SensorEntity):  # type: ignore
     """Representation of a UGREEN NAS sensor."""
 
-    def __init__(self, entry_id: str, coordinator: DataUpdateCoordinator, endpoint: UgreenEntity, nas_model: 'str | None' = None) -> None:
+    def __init__(self, entry_id: str, coordinator: DataUpdateCoordinator, endpoint: UgreenEntity, formatting: FormattingPlan, nas_model: 'str | None' = None, metrics: 'UgreenApiMetrics | None' = None, stale_endpoints: 'set[str] | None' = None) -> None:
         super().__init__(coordinator)
         self._entry_id = entry_id
         self._endpoint = endpoint
         self._key = endpoint.description.key
+        self._metrics = metrics
+        # Values formatted by the coordinator for the whole tick (the only place sensors are formatted).
+        self._formatting = formatting
+        # Endpoints whose last fetch failed; their entities show the last known value, marked stale.
+        self._stale_endpoints = stale_endpoints if stale_endpoints is not None else set()
+        # (value, unit, available, stale) as last written to HA; None until the first write.
+        self._last_published: tuple | None = None
 
         self._attr_name = f"UGREEN NAS {endpoint.description.name}"
         self._attr_unique_id = f"{entry_id}_{endpoint.description.key}"
@@ -57,19 +93,22 @@ class UgreenNasSensor(CoordinatorEntity, SensorEntity):  # type: ignore
 
         base_device_info = build_device_info(self._key, nas_model)
 
-        if "disk" in self._key and "brand" in self._key:
-            base_device_info["manufacturer"] = str(self.coordinator.data.get(self._key))
+        # No data yet if the entry was set up from the stored topology (first refresh still running).
+        data = self.coordinator.data or {}
+        if "disk" in self._key and "brand" in self._key and self._key in data:
+            base_device_info["manufacturer"] = str(data.get(self._key))
 
-        if "disk" in self._key and "model" in self._key:
-            base_device_info["model"] = str(self.coordinator.data.get(self._key))
+        if "disk" in self._key and "model" in self._key and self._key in data:
+            base_device_info["model"] = str(data.get(self._key))
 
         self._attr_device_info = base_device_info
 
     @property
     def native_value(self) -> StateType | date | datetime | Decimal:  # type: ignore
         """Return the formatted value of the sensor."""
-        raw = self.coordinator.data.get(self._key)
-        return format_sensor_value(raw, self._endpoint)
+        formatted = self._formatting.results.get(self._key)
+        # Nothing formatted before the first tick (entry set up from the stored topology).
+        return formatted[0] if formatted is not None else None
 
     @property
     def extra_state_attributes(self):
@@ -79,23 +118,94 @@ class UgreenNasSensor(CoordinatorEntity, SensorEntity):  # type: ignore
             "nas_device_id": "",
             "nas_part_category": self._endpoint.nas_part_category,
         })
+        if self._is_stale:
+            base_attrs["stale"] = True
         return base_attrs
 
+    @property
+    def _is_stale(self) -> bool:
+        return self._endpoint.endpoint in self._stale_endpoints
+
     @property
     def native_unit_of_measurement(self) -> str | None:  # type: ignore
         """Return the unit, dynamically determined."""
-        raw = self.coordinator.data.get(self._key)
-        unit = self._endpoint.description.unit_of_measurement or ""
-
-        if self._endpoint.description.unit_of_measurement in ("B/s", "KB/s", "MB/s", "GB/s", "TB/s", "PB/s"):
-            return determine_unit(raw, unit, True)
-        elif self._endpoint.description.unit_of_measurement in ("B", "KB", "MB", "GB", "TB", "PB"):
-            return determine_unit(raw, unit, False)
-
-        return self._endpoint.description.unit_of_measurement
+        formatted = self._formatting.results.get(self._key)
+        return formatted[1] if formatted is not None else self._endpoint.description.unit_of_measurement
 
     def _handle_coordinator_update(self) -> None:
-        """Update the sensor value from the coordinator."""
-        self._attr_native_value = self.native_value
-        self._attr_native_unit_of_measurement = self.native_unit_of_measurement
+        """Update the sensor value from the coordinator; skip the write if nothing changed."""
+        value = self.native_value
+        unit = self.native_unit_of_measurement
+        published = (value, unit, self.available, self._is_stale)
+        if self._last_published is not None and self._is_unchanged(published):
+            if self._metrics is not None:
+                self._metrics.state_write(False)
+            return
+        self._last_published = published
+        if self._metrics is not None:
+            self._metrics.state_write(True)
+        self._attr_native_value = value
+        self._attr_native_unit_of_measurement = unit
         super()._handle_coordinator_update()
+
+    def _is_unchanged(self, published: tuple) -> bool:
+        # Equal to the last written state, or a numeric move within the entity's deadband.
+        if published == self._last_published:
+            return True
+        deadband = self._endpoint.deadband
+        value, unit, available, stale = published
+        last_value, last_unit, last_available, last_stale = self._last_published  # type: ignore[misc]
+        if not deadband or unit != last_unit or available != last_available or stale != last_stale:
+            return False
+        numeric = (int, float, Decimal)
+        if not isinstance(value, numeric) or not isinstance(last_value, numeric) or isinstance(value, bool):
+            return False
+        return abs(float(value) - float(last_value)) < deadband
+
+
+class UgreenNasApiMetricSensor(CoordinatorEntity, SensorEntity):  # type: ignore
+    """Diagnostic sensor exposing the request metrics of the UGREEN NAS API client."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    # These change on every tick; opt-in, so they don't undo the skipped writes above.
+    _attr_entity_registry_enabled_default = False
+    _unrecorded_attributes = frozenset({"endpoints"})
+
+    def __init__(self, entry_id: str, coordinator: DataUpdateCoordinator, description: UgreenEntityDescription, api: UgreenApiClient, nas_model: 'str | None' = None) -> None:
+        super().__init__(coordinator)
+        self._api = api
+        self._key = description.key
+
+        self._attr_name = f"UGREEN NAS {description.name}"
+        self._attr_unique_id = f"{entry_id}_{description.key}"
+        self._attr_icon = description.icon
+        self._attr_native_unit_of_measurement = description.unit_of_measurement
+        self._attr_device_info = build_device_info(self._key, nas_model)
+
+    @property
+    def native_value(self) -> StateType:  # type: ignore
+        """Return the current metric value."""
+        if self._key == "api_token_refreshes":
+            return self._api.get_token_refresh_metrics()["count"]
+        if self._key == "api_circuit_state":
+            return self._api.breaker.state
+        summary = self._api.metrics.summary()
+        if self._key == "api_latency_avg":
+            latency = summary["latency_avg"]
+            return round(latency * 1000, 1) if latency is not None else None
+        return summary[self._key.removeprefix("api_")]
+
+    @property
+    def extra_state_attributes(self):
+        """Per-endpoint latency for the average latency sensor (not recorded)."""
+        if self._key != "api_latency_avg":
+            return None
+        endpoints = {}
+        for endpoint, metrics in self._api.metrics.as_dict().items():
+            endpoints[endpoint] = {
+                "avg_ms": round(metrics["latency_avg"] * 1000, 1) if metrics["latency_avg"] is not None else None,
+                "p95_ms": round(metrics["latency_p95"] * 1000, 1) if metrics["latency_p95"] is not None else None,
+                "requests": metrics["requests"],
+                "failures": metrics["failures"],
+            }
+        return {"endpoints": endpoints}
@@ -1,8 +1,12 @@
-from typing import Optional, Any, Union
+import sys
+from typing import Optional, Any, Union, Iterable, Callable, TYPE_CHECKING
 from datetime import datetime
+from functools import lru_cache, partial
 from decimal import Decimal, ROUND_HALF_UP
 from typing import Any, Optional
-from .api import UgreenEntity
+
+if TYPE_CHECKING:
+    from .api import UgreenEntity
 
 def format_dynamic_size(
     raw: Any,
@@ -61,6 +65,79 @@ def determine_unit(
     unit_str = f"{units[unit_index]}/s" if per_second else units[unit_index]
     return unit_str
 
+# Non-negative ints below this limit are scaled with exact integer arithmetic. Up to here
+# the Decimal route (28 digits) cannot round across a .5 boundary, so both agree exactly.
+_EXACT_INT_LIMIT = 1 << 60
+_EXACT_MAX_PLACES = 20
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+_SIZE_EXPONENTS = {unit: exponent for exponent, unit in enumerate(_SIZE_UNITS)}
+
+def _size_divisions(value: int, limit: int) -> int:
+    # How often a non-negative int is divided by 1024 until it is below 1024 (at most 'limit').
+    return min(limit, (value.bit_length() - 1) // 10) if value >= 1024 else 0
+
+def _divide_half_up(numerator: int, denominator: int) -> int:
+    quotient, remainder = divmod(numerator, denominator)
+    return quotient + 1 if 2 * remainder >= denominator else quotient
+
+def scale_size(
+    raw: Any,
+    input_unit: str = 'B',
+    decimal_places: int = 2,
+    per_second: bool = False
+) -> tuple[Optional[Decimal], str]:
+    """Scale a size and pick its unit in one go; returns (value, unit).
+
+    value equals format_dynamic_size(raw, input_unit, decimal_places) and unit equals
+    determine_unit(raw, input_unit, per_second). Ints take an integer fast path where the
+    unit follows from the bit length; anything else goes the Decimal way.
+    """
+    if type(raw) is not int or not 0 <= raw < _EXACT_INT_LIMIT or not 0 <= decimal_places <= _EXACT_MAX_PLACES:
+        return format_dynamic_size(raw, input_unit, decimal_places), determine_unit(raw, input_unit, per_second)
+
+    value = None
+    exponent = _SIZE_EXPONENTS.get(input_unit)
+    if exponent is not None:
+        size_bytes = raw << (10 * exponent)
+        if size_bytes < _EXACT_INT_LIMIT:
+            divisions = _size_divisions(size_bytes, len(_SIZE_UNITS))
+            value = Decimal(_divide_half_up(size_bytes * 10 ** decimal_places, 1 << (10 * divisions))).scaleb(-decimal_places)
+        else:
+            value = format_dynamic_size(raw, input_unit, decimal_places)
+
+    if per_second and input_unit.endswith("/s"):
+        input_unit = input_unit.replace("/s", "")
+    unit_index = _SIZE_EXPONENTS.get(input_unit)
+    if unit_index is None:
+        return value, "Unknown unit"
+    unit_index += _size_divisions(raw, len(_SIZE_UNITS) - 1 - unit_index)
+    return value, f"{_SIZE_UNITS[unit_index]}/s" if per_second else _SIZE_UNITS[unit_index]
+
+
+class SizeScaler:
+    """scale_size for one entity, remembering the result for the last raw value.
+
+    A sensor asks for value and unit of the same raw value on every update, so the
+    second call is answered from the cache.
+    """
+
+    def __init__(self, input_unit: str, decimal_places: int = 2, per_second: bool = False) -> None:
+        self._args = (input_unit, decimal_places, per_second)
+        self._raw: Any = None
+        self._result: Optional[tuple] = None
+
+    def __call__(self, raw: Any) -> tuple[Optional[Decimal], str]:
+        if self._result is None or raw is not self._raw:
+            self._result = scale_size(raw, *self._args)
+            self._raw = raw
+        return self._result
+
+    def value(self, raw: Any) -> Optional[Decimal]:
+        return self(raw)[0]
+
+    def unit(self, raw: Any) -> str:
+        return self(raw)[1]
+
 def format_duration(seconds: float) -> str:
     """Format seconds into a human-readable duration."""
     try:
@@ -140,76 +217,157 @@ def convert_string_to_number(value: Union[str, int, float, Decimal], decimal_pla
 #    return str(value)
     return value
 
-def format_sensor_value(raw: Any, endpoint: UgreenEntity) -> Any:
-    """Format a raw value based on the endpoint definition."""
-    try:
-        if endpoint.description.unit_of_measurement is not None and endpoint.description.unit_of_measurement in ("B", "KB", "MB", "GB", "TB"):
-            return format_dynamic_size(raw, endpoint.description.unit_of_measurement, endpoint.decimal_places)
-
-        if isinstance(endpoint.description.name, str) and "Timestamp" in endpoint.description.name:
-            return format_timestamp(raw)
-
-        if "server_status" in endpoint.description.key:
-            return format_status_code(raw, {
-                2: "Normal",
-            })
-
-        if "disk" in endpoint.description.key and "status" in endpoint.description.key:
-            return format_status_code(raw, {
-                1: "Normal",
-            })
-            
-
-        if "fan" in endpoint.description.key and "overall" in endpoint.description.key:
-            return format_status_code(raw, {
-                0: "Normal",
-            })
-
-        if "fan" in endpoint.description.key and "status" in endpoint.description.key:
-            return format_status_code(raw, {
-                0: "ERROR!",
-                1: "Normal",
-            })
-
-        if "disk" in endpoint.description.key and not "interface" in endpoint.description.key and "type" in endpoint.description.key:
-            return format_status_code(raw, {
-                0: "HDD",
-                1: "SSD",
-                2: "M.2",
-            })
-            
-        if "volume" in endpoint.description.key and "health" in endpoint.description.key:
-            return format_status_code(raw, {
-                0: "Normal",
-            })
-            
-        if "usb_device_type" in endpoint.description.key:
-            return format_status_code(raw, {
-                0: "Generic USB Device",   # 0 = External HDD?
-            })
-
-        # if "status" in endpoint.description.key:
-        #     return format_status_code(raw, {
-        #         0: "Normal",
-        #     })
-
-        if endpoint.description.unit_of_measurement is not None and endpoint.description.unit_of_measurement == "%":
-            return format_percentage(raw)
-
-        if endpoint.description.unit_of_measurement is not None and endpoint.description.unit_of_measurement == "°C":
-            return format_temperature(raw)
-
-        if endpoint.description.unit_of_measurement is not None and endpoint.description.unit_of_measurement in ("KB/s", "MB/s", "GB/s"):
-            return format_dynamic_size(raw, endpoint.description.unit_of_measurement, endpoint.decimal_places)
-
-        if endpoint.description.unit_of_measurement is not None and endpoint.description.unit_of_measurement == "MHz":
-            return format_frequency_mhz(raw)
-        
-        return convert_string_to_number(raw, endpoint.decimal_places)
+def build_size_scaler(endpoint: 'UgreenEntity') -> Optional[SizeScaler]:
+    """SizeScaler shared by an entity's formatter and unit resolver, None if it has no size unit."""
+    unit = endpoint.description.unit_of_measurement
+    if unit in ("B", "KB", "MB", "GB", "TB", "PB"):
+        return SizeScaler(unit, endpoint.decimal_places)
+    if unit in ("B/s", "KB/s", "MB/s", "GB/s", "TB/s", "PB/s"):
+        return SizeScaler(unit, endpoint.decimal_places, per_second=True)
+    return None
+
+
+def select_sensor_formatter(endpoint: 'UgreenEntity', scaler: Optional[SizeScaler] = None) -> tuple[str, Callable[[Any], Any]]:
+    """Run the formatting rules for an entity once; returns (kind, formatter)."""
+    unit = endpoint.description.unit_of_measurement
+    name = endpoint.description.name
+    key = endpoint.description.key
+    places = endpoint.decimal_places
+
+    if unit is not None and unit in ("B", "KB", "MB", "GB", "TB"):
+        kind, formatter = "size", (scaler or SizeScaler(unit, places)).value
+
+    elif isinstance(name, str) and "Timestamp" in name:
+        kind, formatter = "timestamp", format_timestamp
+
+    elif "server_status" in key:
+        kind, formatter = "status", partial(format_status_code, status_map={
+            2: "Normal",
+        })
+
+    elif "disk" in key and "status" in key:
+        kind, formatter = "status", partial(format_status_code, status_map={
+            1: "Normal",
+        })
+
+    elif "fan" in key and "overall" in key:
+        kind, formatter = "status", partial(format_status_code, status_map={
+            0: "Normal",
+        })
+
+    elif "fan" in key and "status" in key:
+        kind, formatter = "status", partial(format_status_code, status_map={
+            0: "ERROR!",
+            1: "Normal",
+        })
+
+    elif "disk" in key and not "interface" in key and "type" in key:
+        kind, formatter = "status", partial(format_status_code, status_map={
+            0: "HDD",
+            1: "SSD",
+            2: "M.2",
+        })
+
+    elif "volume" in key and "health" in key:
+        kind, formatter = "status", partial(format_status_code, status_map={
+            0: "Normal",
+        })
+
+    elif "usb_device_type" in key:
+        kind, formatter = "status", partial(format_status_code, status_map={
+            0: "Generic USB Device",   # 0 = External HDD?
+        })
+
+    # elif "status" in key:
+    #     kind, formatter = "status", partial(format_status_code, status_map={
+    #         0: "Normal",
+    #     })
+
+    elif unit is not None and unit == "%":
+        kind, formatter = "percent", format_percentage
+
+    elif unit is not None and unit == "°C":
+        kind, formatter = "temperature", format_temperature
 
+    elif unit is not None and unit in ("KB/s", "MB/s", "GB/s"):
+        kind, formatter = "rate", partial(format_dynamic_size, input_unit=unit, decimal_places=places)
+
+    elif unit is not None and unit == "MHz":
+        kind, formatter = "frequency", format_frequency_mhz
+
+    else:
+        kind, formatter = "number", partial(convert_string_to_number, decimal_places=places)
+
+    return kind, formatter
+
+
+def format_sensor_value(raw: Any, endpoint: 'UgreenEntity') -> Any:
+    """Format a raw value based on the endpoint definition (see select_sensor_formatter)."""
+    try:
+        return select_sensor_formatter(endpoint)[1](raw)
     except Exception:
         return Decimal(0)
 
+
+class FormattingPlan:
+    """Formats all sensor values of one coordinator tick, one pass per formatter kind.
+
+    Entities are grouped at setup by the kind select_sensor_formatter picks for them.
+    format() runs each group in a single loop and keeps {key: (value, unit)} in
+    'results', which the sensors read. A raw value that is the same object as on the
+    last tick (endpoint not due, see TieredEndpointSchedule) keeps its result.
+    """
+
+    def __init__(self, entities: 'Iterable[UgreenEntity]') -> None:
+        # kind -> [(key, formatter, scaler or None, declared unit)]
+        self._groups: dict[str, list[tuple]] = {}
+        for entity in entities:
+            scaler = build_size_scaler(entity)
+            kind, formatter = select_sensor_formatter(entity, scaler)
+            self._groups.setdefault(kind, []).append(
+                (entity.description.key, formatter, scaler, entity.description.unit_of_measurement)
+            )
+        self._raw: dict[str, Any] = {}
+        self.results: dict[str, tuple[Any, Optional[str]]] = {}
+
+    def format(self, data: dict[str, Any]) -> dict[str, tuple[Any, Optional[str]]]:
+        """Format the raw values of one tick; returns the updated results."""
+        for kind, items in self._groups.items():
+            if kind == "size":
+                self._format_scaled(items, data)
+            else:
+                self._format_plain(items, data)
+        return self.results
+
+    def _changed(self, items: list[tuple], data: dict[str, Any]) -> list[tuple]:
+        raw_before, results = self._raw, self.results
+        changed = [
+            (item, raw) for item in items
+            for raw in (data.get(item[0]),)
+            if item[0] not in results or raw is not raw_before.get(item[0])
+        ]
+        for item, raw in changed:
+            raw_before[item[0]] = raw
+        return changed
+
+    def _format_scaled(self, items: list[tuple], data: dict[str, Any]) -> None:
+        # Sizes: value and unit come out of one scale_size call.
+        results = self.results
+        for (key, _, scaler, unit), raw in self._changed(items, data):
+            try:
+                results[key] = scaler(raw)
+            except Exception:
+                results[key] = (Decimal(0), unit)
+
+    def _format_plain(self, items: list[tuple], data: dict[str, Any]) -> None:
+        results = self.results
+        for (key, formatter, scaler, unit), raw in self._changed(items, data):
+            try:
+                value = formatter(raw)
+            except Exception:
+                value = Decimal(0)
+            results[key] = (value, scaler.unit(raw) if scaler is not None else unit)
+
 #########
 
 def scale_bytes_per_second(raw: Any) -> Optional[str]:
@@ -221,8 +379,11 @@ def scale_bytes_per_second(raw: Any) -> Optional[str]:
     try:
         if raw is None:
             return None
-        bytes_per_second = Decimal(str(raw).replace(",", "."))
         units = ["B/s", "kB/s", "MB/s", "GB/s", "TB/s"]
+        if type(raw) is int and 0 <= raw < _EXACT_INT_LIMIT:
+            divisions = _size_divisions(raw, len(units) - 1)
+            return f"{_divide_half_up(raw, 1 << (10 * divisions))} {units[divisions]}"
+        bytes_per_second = Decimal(str(raw).replace(",", "."))
         unit_index = 0
         while bytes_per_second >= 1024 and unit_index < len(units) - 1:
             bytes_per_second /= 1024
@@ -233,18 +394,101 @@ def scale_bytes_per_second(raw: Any) -> Optional[str]:
         return None
 
 
-def extract_value_from_path(data: dict, path: str) -> Any:
-    # Extract a value from nested dictionary/list structure using dot and index notation.
+@lru_cache(maxsize=None)
+def compile_path(path: str) -> Optional[tuple]:
+    """Compile a path like 'data.net.series[3].recv_rate' into accessor steps.
+
+    String steps are dict keys, int steps are list indices. Returns None for
+    malformed paths (these never resolve to a value).
+    """
+    steps: list = []
     try:
-        parts = path.split(".")
-        value: Any = data
-        for part in parts:
+        for part in path.split("."):
             if "[" in part and "]" in part:
                 part_name, index = part[:-1].split("[")
-                value = value.get(part_name, []) if isinstance(value, dict) else []
-                value = value[int(index)] if isinstance(value, list) else None
+                steps.append(sys.intern(part_name))
+                steps.append(int(index))
             else:
-                value = value.get(part) if isinstance(value, dict) else None
-        return value
-    except Exception:
+                steps.append(sys.intern(part))
+    except ValueError:
+        return None
+    return tuple(steps)
+
+
+def walk_path(data: Any, steps: Optional[tuple]) -> Any:
+    # Walk a pre-compiled path (see compile_path); no string handling in here.
+    if steps is None:
         return None
+    value = data
+    for step in steps:
+        if type(step) is int:
+            value = value[step] if isinstance(value, list) and -len(value) <= step < len(value) else None
+        else:
+            value = value.get(step) if isinstance(value, dict) else None
+    return value
+
+
+def compile_entity_paths(entities: 'Iterable[UgreenEntity]') -> None:
+    # Pre-compile each entity path once at setup and store it on entity.accessor.
+    # 'calculated:scale_bytes_per_second:<path>' compiles its inner path; other
+    # 'calculated:' paths are not read from a response and get no accessor.
+    for entity in entities:
+        path = entity.path or ""
+        if path.startswith("calculated:scale_bytes_per_second:"):
+            entity.accessor = compile_path(path.split(":", 2)[2])
+        elif path.startswith("calculated:"):
+            entity.accessor = None
+        else:
+            entity.accessor = compile_path(path)
+
+
+class ExtractionPlan:
+    """Prefix trie over the compiled paths of all entities sharing one endpoint.
+
+    resolve() walks a response once, so a shared prefix like 'data.net.series[3]'
+    is looked up a single time per tick instead of once per entity.
+    """
+
+    def __init__(self, entities: 'Iterable[UgreenEntity]') -> None:
+        # A node is (children: {step: node}, keys: [entity keys ending here], all_keys below).
+        self._root: tuple = ({}, [], [])
+        for entity in entities:
+            if entity.accessor is None:
+                continue
+            key = entity.description.key
+            node = self._root
+            node[2].append(key)
+            for step in entity.accessor:
+                node = node[0].setdefault(step, ({}, [], []))
+                node[2].append(key)
+            node[1].append(key)
+
+    def resolve(self, response: Any) -> dict[str, Any]:
+        """Return the value of every planned entity key for one response."""
+        values: dict[str, Any] = {}
+        self._visit(self._root, response, values)
+        return values
+
+    def _visit(self, node: tuple, value: Any, values: dict[str, Any]) -> None:
+        children, keys, all_keys = node
+        if value is None:
+            # Nothing below a missing node can resolve.
+            values.update(dict.fromkeys(all_keys))
+            return
+        for key in keys:
+            values[key] = value
+        if isinstance(value, dict):
+            for step, child in children.items():
+                self._visit(child, value.get(step) if type(step) is not int else None, values)
+        elif isinstance(value, list):
+            n = len(value)
+            for step, child in children.items():
+                self._visit(child, value[step] if type(step) is int and -n <= step < n else None, values)
+        else:
+            for child in children.values():
+                self._visit(child, None, values)
+
+
+def extract_value_from_path(data: dict, path: str) -> Any:
+    # Extract a value from nested dictionary/list structure using dot and index notation.
+    return walk_path(data, compile_path(path))
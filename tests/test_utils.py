@@ -0,0 +1,138 @@
+"""Randomized old-vs-new comparison of the size and rate formatting in utils.py.
+
+scale_size must return what format_dynamic_size and determine_unit (the Decimal
+implementation it replaced, still in utils.py) return for the same arguments, and
+scale_bytes_per_second what its Decimal implementation returned (kept below).
+Inputs are random, plus boundary values around every 1024**k unit threshold and
+half-up rounding ties. The seed is fixed, so failures reproduce.
+"""
+import random
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any, Optional
+
+import pytest
+
+from custom_components.ugreen_pro.utils import (
+    determine_unit,
+    format_dynamic_size,
+    scale_bytes_per_second,
+    scale_size,
+)
+
+SEED = 20240915
+UNITS = ["B", "KB", "MB", "GB", "TB", "PB"]
+RATE_UNITS = ["B/s", "KB/s", "MB/s", "GB/s"]
+# Where the integer fast path of scale_size ends (utils._EXACT_INT_LIMIT).
+EXACT_INT_LIMIT = 1 << 60
+
+
+def scale_bytes_per_second_decimal(raw: Any) -> Optional[str]:
+    # scale_bytes_per_second before the integer fast path (kept here as the reference).
+    try:
+        if raw is None:
+            return None
+        bytes_per_second = Decimal(str(raw).replace(",", "."))
+        units = ["B/s", "kB/s", "MB/s", "GB/s", "TB/s"]
+        unit_index = 0
+        while bytes_per_second >= 1024 and unit_index < len(units) - 1:
+            bytes_per_second /= 1024
+            unit_index += 1
+        value = int(bytes_per_second.to_integral_value(rounding=ROUND_HALF_UP))
+        return f"{value} {units[unit_index]}"
+    except Exception:
+        return None
+
+
+def threshold_values() -> list[int]:
+    """Ints around each unit threshold 1024**k, and the limit of the integer fast path."""
+    values = [0, 1, 2, 511, 512, 513, 1023]
+    for k in range(1, 7):
+        threshold = 1024 ** k
+        values += [threshold - 2, threshold - 1, threshold, threshold + 1, threshold + 2]
+        values += [threshold // 2 - 1, threshold // 2, threshold // 2 + 1]
+    values += [EXACT_INT_LIMIT - 1, EXACT_INT_LIMIT, EXACT_INT_LIMIT + 1]
+    return values
+
+
+def rounding_ties(places: int) -> list[int]:
+    """Ints whose scaled value sits on (or next to) a half-up tie at 'places' decimals."""
+    values = []
+    for divisions in range(1, 6):
+        divisor = 1024 ** divisions
+        for digits in (1, 3, 1023, 12345):
+            # digits + 0.5 units of the last decimal place, in bytes.
+            tie = (2 * digits + 1) * divisor // (2 * 10 ** places)
+            values += [tie - 1, tie, tie + 1]
+    return [value for value in values if value >= 0]
+
+
+def random_raw(rng: random.Random) -> Any:
+    """A raw value as the API might report it, mostly ints of any magnitude."""
+    kind = rng.random()
+    if kind < 0.6:
+        return rng.randrange(0, 1 << rng.randrange(1, 64))
+    if kind < 0.7:
+        return -rng.randrange(0, 1 << 40)
+    if kind < 0.8:
+        return rng.uniform(0, 1024 ** rng.randrange(0, 6))
+    if kind < 0.9:
+        return str(rng.randrange(0, 1 << 50))
+    return rng.choice([None, True, False, "", "1,5", "abc", float("nan"), float("inf"), Decimal("1023.5")])
+
+
+def as_compared(value: Any) -> Any:
+    # str() so that Decimal('1.0') and Decimal('1.00') differ, and NaN equals NaN.
+    return str(value) if isinstance(value, Decimal) else value
+
+
+def outcome(function: Any, *args: Any) -> Any:
+    # The result, or the exception type (determine_unit raises on NaN, for one).
+    try:
+        return function(*args)
+    except Exception as error:
+        return type(error)
+
+
+def assert_scale_size_matches(raw: Any, unit: str, places: int, per_second: bool) -> None:
+    scaled = outcome(scale_size, raw, unit, places, per_second)
+    expected_value = outcome(format_dynamic_size, raw, unit, places)
+    expected_unit = outcome(determine_unit, raw, unit, per_second)
+    expected = expected_unit if isinstance(expected_unit, type) else (expected_value, expected_unit)
+    if isinstance(scaled, tuple):
+        scaled = tuple(as_compared(part) for part in scaled)
+    if isinstance(expected, tuple):
+        expected = tuple(as_compared(part) for part in expected)
+    assert scaled == expected, f"scale_size({raw!r}, {unit!r}, {places}, per_second={per_second})"
+
+
+@pytest.mark.parametrize("unit", UNITS)
+@pytest.mark.parametrize("places", [0, 1, 2, 3])
+def test_scale_size_thresholds(unit: str, places: int) -> None:
+    for raw in threshold_values() + rounding_ties(places):
+        assert_scale_size_matches(raw, unit, places, False)
+
+
+@pytest.mark.parametrize("unit", RATE_UNITS)
+def test_scale_size_per_second_thresholds(unit: str) -> None:
+    for raw in threshold_values():
+        assert_scale_size_matches(raw, unit, 2, True)
+
+
+def test_scale_size_random() -> None:
+    rng = random.Random(SEED)
+    for _ in range(20000):
+        per_second = rng.random() < 0.3
+        unit = rng.choice(RATE_UNITS if per_second else UNITS + ["kB", "B/s"])
+        assert_scale_size_matches(random_raw(rng), unit, rng.choice([0, 1, 2, 3, 6]), per_second)
+
+
+def test_scale_bytes_per_second_thresholds() -> None:
+    for raw in threshold_values() + rounding_ties(0):
+        assert scale_bytes_per_second(raw) == scale_bytes_per_second_decimal(raw), raw
+
+
+def test_scale_bytes_per_second_random() -> None:
+    rng = random.Random(SEED)
+    for _ in range(20000):
+        raw = random_raw(rng)
+        assert scale_bytes_per_second(raw) == scale_bytes_per_second_decimal(raw), raw
@@ -0,0 +1,377 @@
+"""Local stand-in for the UGOS API of a UGREEN NAS, for offline testing and load benchmarks.
+
+Serves the endpoints used by custom_components/ugreen_pro (login with RSA, the
+discovery/status endpoints, desktop components and the shutdown/reboot buttons)
+for a configurable topology, with configurable latency, jitter, token expiry
+(code 1024) and failure rates.
+
+    python tools/ugos_simulator.py --bays 8 --nics 4 --latency 0.05 --jitter 0.02
+
+Then add the integration with host 127.0.0.1, port 9999 and the simulator's
+credentials (default admin / admin). Needs aiohttp and pycryptodome.
+"""
+import argparse
+import asyncio
+import base64
+import logging
+import random
+import secrets
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from aiohttp import web
+from Crypto.Cipher import PKCS1_v1_5
+from Crypto.PublicKey import RSA
+
+_LOGGER = logging.getLogger(__name__)
+
+# UGOS answers an unknown or expired token with this code (see UgreenApiClient.get).
+CODE_TOKEN_EXPIRED = 1024
+CODE_LOGIN_FAILED = 1001
+
+# Model reported for a bay count, if none is configured.
+MODELS = {2: "DXP2800", 4: "DXP4800 Plus", 6: "DXP6800 Pro", 8: "DXP8800 Plus"}
+
+
+@dataclass
+class SimulatorConfig:
+    """Topology and behaviour of the simulated NAS."""
+    bays: int = 4
+    pools: int = 1
+    volumes_per_pool: int = 1
+    nics: int = 2
+    dimms: int = 2
+    device_fans: int = 1
+    cpu_fan: bool = True
+    gpu: bool = False
+    usbs: int = 0
+    ups: bool = False
+    model: str = ""
+    username: str = "admin"
+    password: str = "admin"
+    # Response delay in seconds: gauss(latency, jitter), never below 0.
+    latency: float = 0.0
+    jitter: float = 0.0
+    # Tokens expire this many seconds after login (0 = never) ...
+    token_ttl: float = 0.0
+    # ... and any request is answered with code 1024 with this probability.
+    expiry_rate: float = 0.0
+    # Share of requests answered with HTTP 500.
+    failure_rate: float = 0.0
+    key_bits: int = 2048
+    seed: int | None = None
+
+    @property
+    def model_name(self) -> str:
+        return self.model or MODELS.get(self.bays, f"DXP{self.bays}800")
+
+
+@dataclass
+class SimulatorStats:
+    """Request counters, served on /simulator/stats."""
+    requests: dict[str, int] = field(default_factory=dict)
+    logins: int = 0
+    failed_logins: int = 0
+    token_expired: int = 0
+    failures: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "requests": dict(self.requests),
+            "logins": self.logins,
+            "failed_logins": self.failed_logins,
+            "token_expired": self.token_expired,
+            "failures": self.failures,
+        }
+
+
+def build_topology(config: SimulatorConfig) -> dict[str, Any]:
+    """Static part of the NAS: hardware, disks and pools with their volumes."""
+    disks = [
+        {
+            "dev_name": f"sd{chr(ord('a') + i)}",
+            "name": f"Disk{i + 1}",
+            "slot": i + 1,
+            "model": "WD40EFPX" if i % 2 == 0 else "ST4000VN006",
+            "brand": "WDC" if i % 2 == 0 else "Seagate",
+            "serial": f"WX{100000 + i}",
+            "size": 4 * 10**12,
+            "type": 0,
+            "interface_type": "SATA",
+            "label": "",
+            "used_for": 1,
+            "status": 1,
+            "temperature": 33 + i % 5,
+            "power_on_hours": 1200 * (i + 1),
+        }
+        for i in range(config.bays)
+    ]
+    pools = []
+    per_pool = max(1, config.bays // max(1, config.pools))
+    for p in range(config.pools):
+        members = disks[p * per_pool:(p + 1) * per_pool]
+        total = 3 * 10**12 * max(1, len(members) - 1)
+        used = total // 3
+        pools.append({
+            "name": f"pool{p}",
+            "label": f"Storage Pool {p + 1}",
+            "level": "raid5" if len(members) > 2 else "raid1",
+            "status": 0,
+            "total": total,
+            "used": used,
+            "free": total - used,
+            "available": total - used,
+            "total_disk_num": len(members),
+            "disks": [{"dev_name": d["dev_name"]} for d in members],
+            "volumes": [
+                {
+                    "name": f"volume{v + 1}",
+                    "label": f"Volume {v + 1}",
+                    "poolname": f"pool{p}",
+                    "total": total // config.volumes_per_pool,
+                    "used": used // config.volumes_per_pool,
+                    "available": (total - used) // config.volumes_per_pool,
+                    "hascache": False,
+                    "filesystem": "btrfs",
+                    "health": 0,
+                    "status": 0,
+                }
+                for v in range(config.volumes_per_pool)
+            ],
+        })
+    hardware = {
+        "cpu": [{"model": "Intel(R) Core(TM) i5-1235U", "ghz": "4400 MHz", "core": 10, "thread": 12}],
+        "mem": [
+            {"model": "DDR5", "manufacturer": "Samsung", "size": 8 * 2**30, "mhz": "4800 MHz"}
+            for _ in range(config.dimms)
+        ],
+        "net": [
+            {
+                "model": "Intel I226-V", "ip": f"192.168.1.{10 + i}", "mac": f"6c:1f:f7:00:00:{i:02x}",
+                "speed": 2500, "duplex": "full", "mtu": 1500, "mask": "255.255.255.0",
+            }
+            for i in range(config.nics)
+        ],
+        "usb": [{"model": "USB Disk", "vendor": "SanDisk", "device_type": 0} for _ in range(config.usbs)],
+        "ups": [{"model": "Back-UPS 700", "vendor": "APC", "power_free": "100%"}] if config.ups else [],
+    }
+    common = {
+        "model": config.model_name,
+        "serial": "EC000000000001",
+        "nas_name": "ugreen-sim",
+        "nas_owner": config.username,
+        "system_version": "1.3.0.1234",
+        "mac": [n["mac"] for n in hardware["net"]],
+    }
+    return {"common": common, "hardware": hardware, "disks": disks, "pools": pools}
+
+
+class UgosSimulator:
+    """Request handlers and state (keys, tokens, counters) of one simulated NAS."""
+
+    def __init__(self, config: SimulatorConfig) -> None:
+        self.config = config
+        self.random = random.Random(config.seed)
+        self.topology = build_topology(config)
+        self.stats = SimulatorStats()
+        self.started = time.time()
+        self._key = RSA.generate(config.key_bits)
+        self._cipher = PKCS1_v1_5.new(self._key)
+        self._tokens: dict[str, float] = {}
+        # Slowly moving load values, advanced on every get_all.
+        self._rates: dict[str, float] = {}
+
+    def create_app(self) -> web.Application:
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_post("/ugreen/v1/verify/check", self.verify_check)
+        app.router.add_post("/ugreen/v1/verify/login", self.verify_login)
+        app.router.add_get("/ugreen/v1/sysinfo/machine/common", self.sysinfo)
+        app.router.add_get("/ugreen/v2/storage/disk/list", self.disk_list)
+        app.router.add_get("/ugreen/v1/storage/pool/list", self.pool_list)
+        app.router.add_get("/ugreen/v1/taskmgr/stat/get_all", self.stat_get_all)
+        app.router.add_get("/ugreen/v1/desktop/components/data", self.desktop_component)
+        app.router.add_post("/ugreen/v1/desktop/shutdown", self.power_action)
+        app.router.add_post("/ugreen/v1/desktop/reboot", self.power_action)
+        app.router.add_get("/simulator/stats", self.simulator_stats)
+        return app
+
+    ################################################ MIDDLEWARE ################
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        if request.path.startswith("/simulator/"):
+            return await handler(request)
+        self.stats.requests[request.path] = self.stats.requests.get(request.path, 0) + 1
+        delay = self.random.gauss(self.config.latency, self.config.jitter) if self.config.jitter else self.config.latency
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if self.random.random() < self.config.failure_rate:
+            self.stats.failures += 1
+            return web.json_response({"code": 500, "msg": "simulated failure"}, status=500)
+        if not request.path.startswith("/ugreen/v1/verify/") and not self._token_valid(request.query.get("token", "")):
+            self.stats.token_expired += 1
+            return web.json_response({"code": CODE_TOKEN_EXPIRED, "msg": "token expired", "data": None})
+        return await handler(request)
+
+    def _token_valid(self, token: str) -> bool:
+        issued = self._tokens.get(token)
+        if issued is None:
+            return False
+        if self.config.token_ttl and time.monotonic() - issued > self.config.token_ttl:
+            del self._tokens[token]
+            return False
+        if self.random.random() < self.config.expiry_rate:
+            del self._tokens[token]
+            return False
+        return True
+
+    ################################################ LOGIN #####################
+
+    async def verify_check(self, request: web.Request) -> web.Response:
+        public_pem = self._key.publickey().export_key()
+        return web.json_response(
+            {"code": 200, "msg": "success", "data": None},
+            headers={"x-rsa-token": base64.b64encode(public_pem).decode()},
+        )
+
+    async def verify_login(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        try:
+            password = self._cipher.decrypt(base64.b64decode(body.get("password", "")), None)
+        except (ValueError, TypeError):
+            password = None
+        if body.get("username") != self.config.username or password != self.config.password.encode():
+            self.stats.failed_logins += 1
+            return web.json_response({"code": CODE_LOGIN_FAILED, "msg": "wrong username or password", "data": None})
+        token = secrets.token_hex(16).upper()
+        self._tokens[token] = time.monotonic()
+        self.stats.logins += 1
+        return web.json_response({"code": 200, "msg": "success", "data": {"token": token}})
+
+    ################################################ ENDPOINTS #################
+
+    async def sysinfo(self, request: web.Request) -> web.Response:
+        return self._ok({"common": self.topology["common"], "hardware": self.topology["hardware"]})
+
+    async def disk_list(self, request: web.Request) -> web.Response:
+        return self._ok({"result": self.topology["disks"]})
+
+    async def pool_list(self, request: web.Request) -> web.Response:
+        return self._ok({"result": self.topology["pools"]})
+
+    async def stat_get_all(self, request: web.Request) -> web.Response:
+        config = self.config
+        disks = self.topology["disks"]
+        overview = {
+            "cpu": [{"used_percent": round(self._walk("cpu", 0, 100, 5), 1), "temp": round(self._walk("cpu_temp", 35, 90, 1))}],
+            "mem": [{"used_percent": round(self._walk("mem", 5, 95, 1), 1)}],
+            "cpu_fan": [{"speed": round(self._walk("cpu_fan", 600, 2500, 50)), "status": 1}] if config.cpu_fan else [],
+            "device_fan": [
+                {"speed": round(self._walk(f"fan{i}", 500, 2000, 40)), "status": 1} for i in range(config.device_fans)
+            ],
+        }
+        total_mem = sum(m["size"] for m in self.topology["hardware"]["mem"])
+        used_mem = int(total_mem * overview["mem"][0]["used_percent"] / 100)
+        net = [{"name": "overview", "send_rate": 0, "recv_rate": 0}]
+        for i in range(config.nics):
+            net.append({"name": f"eth{i}", "send_rate": self._rate(f"eth{i}_send"), "recv_rate": self._rate(f"eth{i}_recv")})
+        net[0]["send_rate"] = sum(n["send_rate"] for n in net[1:])
+        net[0]["recv_rate"] = sum(n["recv_rate"] for n in net[1:])
+        disk = [{"name": "overview", "read_rate": 0, "write_rate": 0}]
+        for d in disks:
+            disk.append({
+                "name": d["dev_name"],
+                "read_rate": self._rate(f"{d['dev_name']}_read"),
+                "write_rate": self._rate(f"{d['dev_name']}_write"),
+                "temperature": round(self._walk(f"{d['dev_name']}_temp", 28, 55, 0.5)),
+            })
+        disk[0]["read_rate"] = sum(d["read_rate"] for d in disk[1:])
+        disk[0]["write_rate"] = sum(d["write_rate"] for d in disk[1:])
+        return self._ok({
+            "overview": overview,
+            "mem": {"structure": {
+                "total": total_mem, "used": used_mem, "free": total_mem - used_mem,
+                "cache": (total_mem - used_mem) // 2, "share": 2**28,
+            }},
+            "net": {"series": net},
+            "disk": {"series": disk},
+            "volume": {"series": [{"read_rate": disk[0]["read_rate"], "write_rate": disk[0]["write_rate"]}]},
+            "gpu": {"series": [{"gpu_name": "Intel UHD Graphics", "used_percent": round(self._walk("gpu", 0, 100, 5), 1)}] if config.gpu else []},
+        })
+
+    async def desktop_component(self, request: web.Request) -> web.Response:
+        component = request.query.get("id", "")
+        if component == "desktop.component.SystemStatus":
+            return self._ok({
+                "type": "NAS",
+                "dev_name": self.topology["common"]["nas_name"],
+                "last_boot_date": time.strftime("%Y-%m-%d", time.localtime(self.started)),
+                "last_boot_time": int(self.started),
+                "total_run_time": int(time.time() - self.started),
+                "server_status": 2,
+                "status": 0,
+                "message": "The device is running normally",
+            })
+        if component == "desktop.component.TemperatureMonitoring":
+            return self._ok({"cpu_status": 0, "fan_status": 0, "status": 0, "message": "Temperature is normal"})
+        return web.json_response({"code": 404, "msg": f"unknown component {component}", "data": None})
+
+    async def power_action(self, request: web.Request) -> web.Response:
+        _LOGGER.info("Simulated NAS received %s (ignored)", request.path)
+        return self._ok(None)
+
+    async def simulator_stats(self, request: web.Request) -> web.Response:
+        return web.json_response(self.stats.as_dict())
+
+    ################################################ HELPERS ###################
+
+    @staticmethod
+    def _ok(data: Any) -> web.Response:
+        return web.json_response({"code": 200, "msg": "success", "data": data})
+
+    def _walk(self, name: str, low: float, high: float, step: float) -> float:
+        value = self._rates.get(name, (low + high) / 2) + self.random.uniform(-step, step)
+        value = min(high, max(low, value))
+        self._rates[name] = value
+        return value
+
+    def _rate(self, name: str) -> int:
+        # Bytes per second: mostly idle, with bursts up to ~250 MB/s.
+        if self.random.random() < 0.1:
+            return self.random.randrange(10**6, 250 * 10**6)
+        return int(self._walk(name, 0, 200_000, 20_000))
+
+
+async def serve(config: SimulatorConfig, host: str = "127.0.0.1", port: int = 9999) -> web.AppRunner:
+    """Start the simulator; returns the runner (await runner.cleanup() to stop)."""
+    runner = web.AppRunner(UgosSimulator(config).create_app())
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    return runner
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9999)
+    defaults = SimulatorConfig()
+    for name, value in vars(defaults).items():
+        option = "--" + name.replace("_", "-")
+        if isinstance(value, bool):
+            parser.add_argument(option, action=argparse.BooleanOptionalAction, default=value)
+        elif name == "seed":
+            parser.add_argument(option, type=int, default=None)
+        else:
+            parser.add_argument(option, type=type(value), default=value)
+    args = vars(parser.parse_args())
+    host, port = args.pop("host"), args.pop("port")
+    config = SimulatorConfig(**args)
+
+    logging.basicConfig(level=logging.INFO)
+    _LOGGER.info("Simulating a %s (%d bays, %d NICs) on http://%s:%d", config.model_name, config.bays, config.nics, host, port)
+    web.run_app(UgosSimulator(config).create_app(), host=host, port=port, print=None)
+
+
+if __name__ == "__main__":
+    main()